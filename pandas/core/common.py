@@ -148,12 +148,13 @@ def _unpickle_array(bytes):
     return arr
 
 def _view_wrapper(f, wrap_dtype, na_override=None):
-    def wrapper(arr, indexer, out, fill_value=np.nan):
+    def wrapper(arr, *indexers, **kwds):
+        fill_value = kwds.get('fill_value', np.nan)
         if na_override is not None and np.isnan(fill_value):
             fill_value = na_override
         view = arr.view(wrap_dtype)
-        outview = out.view(wrap_dtype)
-        f(view, indexer, outview, fill_value=fill_value)
+        outview = kwds['out'].view(wrap_dtype)
+        f(view, *indexers, out=outview, fill_value=fill_value)
     return wrapper
 
 
@@ -384,6 +385,21 @@ def _need_upcast(values):
         return True
     return False
 
+def _pack_mask(mask):
+    """
+    Pack boolean NA mask into a validity bitmask (1 bit per value, set where
+    the value is valid) along the last axis
+    """
+    return np.packbits(-np.asarray(mask, dtype=bool), axis=-1)
+
+def _unpack_mask(bits, n):
+    """
+    Unpack validity bitmask produced by _pack_mask into a boolean NA mask
+    having n elements along the last axis
+    """
+    valid = np.unpackbits(bits, axis=-1)[..., :n]
+    return valid == 0
+
 def _interp_wrapper(f, wrap_dtype, na_override=None):
     def wrapper(arr, mask, limit=None):
         view = arr.view(wrap_dtype)
@@ -508,8 +524,8 @@ def _is_bool_indexer(key):
     return False
 
 def _default_index(n):
-    from pandas.core.index import Index
-    return Index(np.arange(n))
+    from pandas.core.index import RangeIndex
+    return RangeIndex(n)
 
 def ensure_float(arr):
     if issubclass(arr.dtype.type, np.integer):
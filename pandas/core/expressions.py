@@ -0,0 +1,247 @@
+"""
+Chunked evaluation of arithmetic expressions over the columns of a DataFrame
+"""
+import ast
+import threading
+
+import numpy as np
+
+from pandas.core.series import Series
+
+# Rows evaluated per chunk. The per-operator temporaries of a chunk stay in
+# cache instead of each operator streaming a full-length array through memory
+_CHUNK_SIZE = 8192
+
+_binary_ops = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod,
+    ast.Pow: np.power,
+    ast.BitAnd: np.bitwise_and,
+    ast.BitOr: np.bitwise_or,
+    ast.BitXor: np.bitwise_xor,
+}
+
+_unary_ops = {
+    ast.USub: np.negative,
+    ast.Invert: np.invert,
+    ast.Not: np.logical_not,
+}
+
+_cmp_ops = {
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+}
+
+_constants = {'True': True, 'False': False, 'None': None}
+
+
+class _Constant(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def evaluate(self, start, stop, buffers):
+        return self.value
+
+
+class _Term(object):
+    """
+    Full-length array operand, sliced per chunk without copying
+    """
+    def __init__(self, values):
+        self.values = values
+
+    def evaluate(self, start, stop, buffers):
+        return self.values[start:stop]
+
+
+class _Op(object):
+    """
+    Applies a ufunc to its evaluated operands, writing into a buffer owned
+    by this node that is reused from one chunk to the next
+    """
+    def __init__(self, func, operands):
+        self.func = func
+        self.operands = operands
+
+    def evaluate(self, start, stop, buffers):
+        args = [x.evaluate(start, stop, buffers) for x in self.operands]
+        out = buffers.get(self)
+        if out is None:
+            out = buffers[self] = self.func(*args)
+            return out
+        return self.func(*(args + [out[:stop - start]]))
+
+
+def _make_op(func, operands):
+    if all(isinstance(x, _Constant) for x in operands):
+        return _Constant(func(*[x.value for x in operands]))
+    return _Op(func, operands)
+
+
+class _ExprParser(object):
+
+    def __init__(self, resolver):
+        self.resolver = resolver
+
+    def parse(self, expr):
+        try:
+            tree = ast.parse(expr.strip(), mode='eval')
+        except SyntaxError:
+            raise ValueError('Invalid expression: %s' % expr)
+        return self.visit(tree.body)
+
+    def visit(self, node):
+        method = getattr(self, 'visit_' + type(node).__name__, None)
+        if method is None:
+            raise ValueError('Unsupported expression element: %s'
+                             % type(node).__name__)
+        return method(node)
+
+    def visit_BinOp(self, node):
+        func = _binary_ops.get(type(node.op))
+        if func is None:
+            raise ValueError('Unsupported operator: %s'
+                             % type(node.op).__name__)
+        return _make_op(func, [self.visit(node.left), self.visit(node.right)])
+
+    def visit_UnaryOp(self, node):
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        func = _unary_ops.get(type(node.op))
+        if func is None:
+            raise ValueError('Unsupported operator: %s'
+                             % type(node.op).__name__)
+        return _make_op(func, [operand])
+
+    def visit_Compare(self, node):
+        # a < b < c is (a < b) & (b < c)
+        result = None
+        left = self.visit(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            func = _cmp_ops.get(type(op))
+            if func is None:
+                raise ValueError('Unsupported comparison: %s'
+                                 % type(op).__name__)
+            right = self.visit(comparator)
+            term = _make_op(func, [left, right])
+            if result is None:
+                result = term
+            else:
+                result = _make_op(np.logical_and, [result, term])
+            left = right
+        return result
+
+    def visit_BoolOp(self, node):
+        func = (np.logical_and if isinstance(node.op, ast.And)
+                else np.logical_or)
+        result = self.visit(node.values[0])
+        for value in node.values[1:]:
+            result = _make_op(func, [result, self.visit(value)])
+        return result
+
+    def visit_Num(self, node):
+        return _Constant(node.n)
+
+    def visit_Str(self, node):
+        return _Constant(node.s)
+
+    def visit_Name(self, node):
+        return self.resolver(node.id)
+
+
+def evaluate(frame, expr, local_dict=None, num_threads=1):
+    """
+    Evaluate expr over the columns of frame in chunks of _CHUNK_SIZE rows.
+    See DataFrame.eval
+
+    Returns
+    -------
+    result : ndarray
+    """
+    if local_dict is None:
+        local_dict = {}
+
+    n = len(frame.index)
+
+    def resolver(name):
+        if name in frame.columns:
+            return _Term(frame[name].values)
+        if name in local_dict:
+            value = local_dict[name]
+        elif name in _constants:
+            return _Constant(_constants[name])
+        else:
+            raise NameError('name %s is not a column or local variable'
+                            % name)
+
+        # align once up front rather than per operator
+        if isinstance(value, Series):
+            value = value.reindex(frame.index).values
+        if isinstance(value, np.ndarray) and value.ndim > 0:
+            if len(value) != n:
+                raise ValueError('Length of %s (%d) does not match frame '
+                                 'length (%d)' % (name, len(value), n))
+            return _Term(value)
+        return _Constant(value)
+
+    node = _ExprParser(resolver).parse(expr)
+
+    if isinstance(node, _Constant):
+        result = np.empty(n, dtype=np.asarray(node.value).dtype)
+        result.fill(node.value)
+        return result
+
+    first = min(n, _CHUNK_SIZE)
+    head = node.evaluate(0, first, {})
+    result = np.empty(n, dtype=head.dtype)
+    result[:first] = head
+
+    def _evaluate_range(start, stop):
+        buffers = {}
+        for i in xrange(start, stop, _CHUNK_SIZE):
+            j = min(i + _CHUNK_SIZE, stop)
+            result[i:j] = node.evaluate(i, j, buffers)
+
+    remaining = n - first
+    nchunks = (remaining + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+    num_threads = max(1, min(num_threads, nchunks))
+
+    if num_threads == 1:
+        _evaluate_range(first, n)
+        return result
+
+    # NumPy ufuncs release the GIL, so contiguous runs of chunks can be
+    # evaluated concurrently
+    per_thread = (nchunks + num_threads - 1) // num_threads * _CHUNK_SIZE
+    errors = []
+
+    def _run(start, stop):
+        try:
+            _evaluate_range(start, stop)
+        except Exception, e:
+            errors.append(e)
+
+    threads = []
+    for start in xrange(first, n, per_thread):
+        stop = min(start + per_thread, n)
+        thread = threading.Thread(target=_run, args=(start, stop))
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return result
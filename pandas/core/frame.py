@@ -1478,9 +1478,11 @@ class DataFrame(NDFrame):
         -------
         value : scalar value
         """
-        series = self._get_item_cache(col)
-        engine = self.index._engine
-        return engine.get_value(series, index)
+        try:
+            series = self._item_cache[col]
+        except Exception:
+            series = self._get_item_cache(col)
+        return self.index._engine.get_value(series, index)
 
     def set_value(self, index, col, value):
         """
@@ -1499,9 +1501,17 @@ class DataFrame(NDFrame):
             otherwise a new object
         """
         try:
-            series = self._get_item_cache(col)
-            engine = self.index._engine
-            engine.set_value(series, index, value)
+            if self._data.is_masked():
+                # cached columns of masked blocks may be materialized copies
+                self._data.set_scalar((col, index), value)
+                self._item_cache.pop(col, None)
+                return self
+
+            try:
+                series = self._item_cache[col]
+            except Exception:
+                series = self._get_item_cache(col)
+            self.index._engine.set_value(series, index, value)
             return self
         except KeyError:
             new_index, new_columns = self._expand_axes((index, col))
@@ -1596,9 +1606,7 @@ class DataFrame(NDFrame):
         -------
         value : scalar value
         """
-        row = self.index[i]
-        col = self.columns[j]
-        return self.get_value(row, col)
+        return self._data.iget_scalar(j, i)
 
     def __getitem__(self, key):
         # slice rows
@@ -2069,7 +2077,8 @@ class DataFrame(NDFrame):
             return left_result, right_result
 
     def reindex(self, index=None, columns=None, method=None, level=None,
-                fill_value=np.nan, limit=None, copy=True):
+                fill_value=np.nan, limit=None, copy=True, mask_na=False,
+                tolerance=None):
         """Conform DataFrame to new index with optional filling logic, placing
         NA/NaN in locations having no value in the previous index. A new object
         is produced unless the new index is equivalent to the current one and
@@ -2082,10 +2091,11 @@ class DataFrame(NDFrame):
             avoid duplicating data
         columns : array-like, optional
             Same usage as index argument
-        method : {'backfill', 'bfill', 'pad', 'ffill', None}, default None
+        method : {'backfill', 'bfill', 'pad', 'ffill', 'nearest', None}
             Method to use for filling holes in reindexed DataFrame
             pad / ffill: propagate last valid observation forward to next valid
             backfill / bfill: use NEXT valid observation to fill gap
+            nearest: use the row at the NEAREST label
         copy : boolean, default True
             Return a new object, even if the passed indexes are the same
         level : int or name
@@ -2096,6 +2106,13 @@ class DataFrame(NDFrame):
             "compatible" value
         limit : int, default None
             Maximum size gap to forward or backward fill
+        mask_na : boolean, default False
+            Keep integer and boolean columns in their dtype when reindexing
+            the rows introduces missing values, tracking them in a validity
+            bitmask instead of upcasting to float64 / object
+        tolerance : scalar, timedelta or string, default None
+            Maximum distance between a new row label and the label it takes
+            its values from with a fill method, e.g. '5s' for a DatetimeIndex
 
         Examples
         --------
@@ -2109,8 +2126,7 @@ class DataFrame(NDFrame):
         frame = self
 
         if (index is not None and columns is not None
-            and method is None and level is None
-            and not self._is_mixed_type):
+            and method is None and level is None and not mask_na):
             return self._reindex_multi(index, columns, copy, fill_value)
 
         if columns is not None:
@@ -2119,12 +2135,13 @@ class DataFrame(NDFrame):
 
         if index is not None:
             frame = frame._reindex_index(index, method, copy, level,
-                                         fill_value, limit)
+                                         fill_value, limit, mask_na=mask_na,
+                                         tolerance=tolerance)
 
         return frame
 
     def reindex_axis(self, labels, axis=0, method=None, level=None, copy=True,
-                     limit=None, fill_value=np.nan):
+                     limit=None, fill_value=np.nan, mask_na=False):
         """Conform DataFrame to new index with optional filling logic, placing
         NA/NaN in locations having no value in the previous index. A new object
         is produced unless the new index is equivalent to the current one and
@@ -2149,6 +2166,9 @@ class DataFrame(NDFrame):
             passed MultiIndex level
         limit : int, default None
             Maximum size gap to forward or backward fill
+        mask_na : boolean, default False
+            Keep integer and boolean columns in their dtype when reindexing
+            the rows, tracking missing values in a validity bitmask
 
         Examples
         --------
@@ -2166,7 +2186,7 @@ class DataFrame(NDFrame):
         if axis == 0:
             return self._reindex_index(labels, method, copy, level,
                                        fill_value=fill_value,
-                                       limit=limit)
+                                       limit=limit, mask_na=mask_na)
         elif axis == 1:
             return self._reindex_columns(labels, copy, level,
                                          fill_value=fill_value,
@@ -2178,26 +2198,20 @@ class DataFrame(NDFrame):
         new_index, row_indexer = self.index.reindex(new_index)
         new_columns, col_indexer = self.columns.reindex(new_columns)
 
-        if row_indexer is not None and col_indexer is not None:
-            new_values = com.take_2d_multi(self.values, row_indexer,
-                                           col_indexer, fill_value=fill_value)
-            return DataFrame(new_values, index=new_index, columns=new_columns)
-        elif row_indexer is not None:
-            return self._reindex_with_indexers(new_index, row_indexer,
-                                               None, None, copy, fill_value)
-        elif col_indexer is not None:
-            return self._reindex_with_indexers(None, None,
-                                               new_columns, col_indexer,
-                                               copy, fill_value)
-        else:
+        if row_indexer is None and col_indexer is None:
             return self.copy() if copy else self
 
+        return self._reindex_with_indexers(new_index, row_indexer,
+                                           new_columns, col_indexer,
+                                           copy, fill_value)
+
     def _reindex_index(self, new_index, method, copy, level, fill_value=np.nan,
-                       limit=None):
+                       limit=None, mask_na=False, tolerance=None):
         new_index, indexer = self.index.reindex(new_index, method, level,
-                                                limit=limit)
+                                                limit=limit,
+                                                tolerance=tolerance)
         return self._reindex_with_indexers(new_index, indexer, None, None,
-                                           copy, fill_value)
+                                           copy, fill_value, mask_na=mask_na)
 
     def _reindex_columns(self, new_columns, copy, level, fill_value=np.nan,
                          limit=None):
@@ -2207,12 +2221,21 @@ class DataFrame(NDFrame):
                                            copy, fill_value)
 
     def _reindex_with_indexers(self, index, row_indexer, columns, col_indexer,
-                               copy, fill_value):
+                               copy, fill_value, mask_na=False):
         new_data = self._data
+        if (row_indexer is not None and col_indexer is not None
+            and not mask_na):
+            # select rows and columns of each block in one pass
+            new_data = new_data.reindex_indexer_multi(columns, col_indexer,
+                                                      index, row_indexer,
+                                                      fill_value=fill_value)
+            return DataFrame(new_data)
+
         if row_indexer is not None:
             row_indexer = com._ensure_int64(row_indexer)
             new_data = new_data.reindex_indexer(index, row_indexer, axis=1,
-                                                fill_value=fill_value)
+                                                fill_value=fill_value,
+                                                mask_na=mask_na)
         elif index is not None and index is not new_data.axes[1]:
             new_data = new_data.copy(deep=copy)
             new_data.axes[1] = index
@@ -2630,9 +2653,15 @@ class DataFrame(NDFrame):
                 self._data = self._data.take(indexer)
 
             self._clear_item_cache()
-            return self
+            result = self
         else:
-            return self.take(indexer, axis=axis)
+            result = self.take(indexer, axis=axis)
+
+        if by is None:
+            new_labels = result._get_axis(axis)
+            new_labels._set_flag_hints(*labels._sorted_flags(ascending))
+
+        return result
 
     def sortlevel(self, level=0, axis=0, ascending=True):
         """
@@ -2760,7 +2789,7 @@ class DataFrame(NDFrame):
             new_blocks = []
             method = com._clean_fill_method(method)
             for block in self._data.blocks:
-                if block._can_hold_na:
+                if block._can_hold_na or block.is_masked:
                     newb = block.interpolate(method, axis=axis,
                                              limit=limit, inplace=inplace)
                 else:
@@ -3428,6 +3457,7 @@ class DataFrame(NDFrame):
             offset = datetools.to_offset(offset)
 
         def _shift_block(blk, indexer):
+            blk = blk.unmask()
             new_values = blk.values.take(indexer, axis=1)
             # convert integer to float if necessary. need to do a lot more than
             # that, handle boolean etc also
@@ -3494,7 +3524,9 @@ class DataFrame(NDFrame):
             If False, convert each row or column into a Series. If raw=True the
             passed function will receive ndarray objects instead. If you are
             just applying a NumPy reduction function this will achieve much
-            better performance
+            better performance. Functions accepting an axis argument are
+            called once on each internal 2D block (without interleaving mixed
+            dtypes) rather than once per row or column
         args : tuple
             Positional arguments to pass to function in addition to the
             array/series
@@ -3537,6 +3569,11 @@ class DataFrame(NDFrame):
                     else:
                         return self.copy()
 
+                if raw:
+                    result = self._apply_blockwise(func, axis, args, kwds)
+                    if result is not None:
+                        return result
+
                 if raw and not self._is_mixed_type:
                     return self._apply_raw(f, axis)
                 else:
@@ -3544,6 +3581,56 @@ class DataFrame(NDFrame):
             else:
                 return self._apply_broadcast(f, axis)
 
+    def _apply_blockwise(self, func, axis, args, kwds):
+        """
+        Call func(values, axis=...) once per Block. Reductions over rows
+        (axis=1) need a single block. Returns None if func does not accept an
+        axis argument or does not return a reduction or same-shaped result
+        """
+        if not self.columns.is_unique:
+            return None
+
+        data = self._data.consolidate()
+        if axis == 1 and len(data.blocks) > 1:
+            return None
+
+        results = []
+        for blk in data.blocks:
+            if com.is_datetime64_dtype(blk.values):
+                return None
+
+            # block values are stored transposed
+            values = blk.get_values(blk.dtype)
+            try:
+                res = func(values, *args, axis=1 - axis, **kwds)
+            except TypeError:
+                return None
+
+            res = np.asarray(res)
+            if (res.shape != values.shape and
+                res.shape != (values.shape[axis],)):
+                return None
+            results.append(res)
+
+        is_reduction = [r.ndim == 1 for r in results]
+        if any(is_reduction) and not all(is_reduction):
+            return None
+
+        if not is_reduction[0]:
+            new_blocks = [make_block(res, blk.items, blk.ref_items)
+                          for res, blk in zip(results, data.blocks)]
+            new_data = BlockManager(new_blocks, data.axes)
+            return self._constructor(new_data)
+
+        if axis == 1:
+            return Series(results[0], index=self.index)
+
+        result = np.concatenate(results)
+        indexer = np.concatenate([blk.ref_locs for blk in data.blocks])
+        out = np.empty_like(result)
+        out[indexer] = result
+        return Series(out, index=self.columns)
+
     def _apply_raw(self, func, axis):
         try:
             result = lib.reduce(self.values, func, axis=axis)
@@ -3659,6 +3746,33 @@ class DataFrame(NDFrame):
         """
         return self.apply(lambda x: lib.map_infer(x, func))
 
+    def eval(self, expr, local_dict=None, num_threads=1):
+        """
+        Evaluate an arithmetic expression over the columns of the DataFrame,
+        e.g. df.eval('a * b + c / d'). The expression is computed in
+        cache-sized chunks of rows, avoiding a full-length temporary array per
+        operator
+
+        Parameters
+        ----------
+        expr : string
+            Python expression using column names, numbers, the arithmetic
+            operators + - * / // % **, comparisons and & | ~
+        local_dict : dict, optional
+            Additional named operands. Series are aligned to the frame's index
+            once before evaluation; arrays must match the frame's length
+        num_threads : int, default 1
+            Number of threads to evaluate chunks with
+
+        Returns
+        -------
+        result : Series
+        """
+        from pandas.core.expressions import evaluate
+        result = evaluate(self, expr, local_dict=local_dict,
+                          num_threads=num_threads)
+        return Series(result, index=self.index)
+
     #----------------------------------------------------------------------
     # Merging / joining methods
 
@@ -4223,6 +4337,13 @@ class DataFrame(NDFrame):
                 filter_type=None, **kwds):
         f = lambda x: op(x, axis=axis, skipna=skipna, **kwds)
         labels = self._get_agg_axis(axis)
+
+        if (axis == 0 and skipna and op in nanops._mask_ops and
+            self._data.is_masked()):
+            result = self._reduce_masked_blocks(op, **kwds)
+            if result is not None:
+                return result
+
         if numeric_only is None:
             try:
                 values = self.values
@@ -4266,6 +4387,29 @@ class DataFrame(NDFrame):
 
         return Series(result, index=labels)
 
+    def _reduce_masked_blocks(self, op, **kwds):
+        # reduce each numeric block in its own dtype, passing the validity
+        # bitmask through so that integer results stay exact
+        from pandas.core.internals import IntBlock, FloatBlock, BoolBlock
+
+        blocks = self._data.blocks
+        if not all(isinstance(b, (IntBlock, FloatBlock, BoolBlock))
+                   for b in blocks):
+            return None
+
+        results = []
+        for blk in blocks:
+            results.append(op(blk.values, axis=1, skipna=True,
+                              mask=blk.isnull(), **kwds))
+
+        # integer results stay exact when all blocks reduce to integers,
+        # otherwise upcast like the unmasked reduction
+        dtype = np.find_common_type([r.dtype for r in results], [])
+        result = np.empty(len(self.columns), dtype=dtype)
+        for blk, blk_result in zip(blocks, results):
+            result[blk.ref_locs] = blk_result
+        return Series(result, index=self.columns)
+
     def idxmin(self, axis=0, skipna=True):
         """
         Return index of first occurence of minimum over requested axis.
@@ -4659,7 +4803,7 @@ def extract_index(data):
             if have_series:
                 assert(lengths[0] == len(index))
             else:
-                index = Index(np.arange(lengths[0]))
+                index = _default_index(lengths[0])
 
     return _ensure_index(index)
 
@@ -89,7 +89,7 @@ class PandasObject(object):
             return default
 
     def groupby(self, by=None, axis=0, level=None, as_index=True, sort=True,
-                group_keys=True):
+                group_keys=True, n_jobs=1, assume_sorted=False):
         """
         Group series using mapper (dict or key function, apply given function
         to group, return result as series) or by a series of columns
@@ -100,7 +100,8 @@ class PandasObject(object):
             list of column names.
             Called on each element of the object index to determine the groups.
             If a dict or Series is passed, the Series or dict VALUES will be
-            used to determine the groups
+            used to determine the groups. Passing the ``grouper`` of an
+            existing GroupBy reuses its already computed group labels
         axis : int, default 0
         level : int, level name, or sequence of such, default None
             If the axis is a MultiIndex (hierarchical), group by a particular
@@ -113,6 +114,15 @@ class PandasObject(object):
             Sort group keys. Get better performance by turning this off
         group_keys : boolean, default True
             When calling apply, add group keys to index to identify pieces
+        n_jobs : int, default 1
+            Number of threads used to aggregate the blocks / column ranges of
+            a DataFrame with the compiled aggregation functions (sum, mean,
+            etc.). -1 means one per CPU
+        assume_sorted : boolean, default False
+            The data is already sorted by the group keys, e.g. after
+            sort_index. The groups are then found as runs of equal keys in one
+            pass and aggregated without hashing or sorting the keys. Keys that
+            are not sorted or have missing values are grouped as usual
 
         Examples
         --------
@@ -131,7 +141,8 @@ class PandasObject(object):
         """
         from pandas.core.groupby import groupby
         return groupby(self, by, axis=axis, level=level, as_index=as_index,
-                       sort=sort, group_keys=group_keys)
+                       sort=sort, group_keys=group_keys, n_jobs=n_jobs,
+                       assume_sorted=assume_sorted)
 
     def asfreq(self, freq, method=None, how=None):
         """
@@ -14,6 +14,7 @@ from pandas.util.decorators import cache_readonly, Appender
 import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.lib as lib
+import pandas._algos as _algos
 
 
 class GroupByError(Exception):
@@ -116,7 +117,7 @@ class GroupBy(object):
 
     def __init__(self, obj, keys=None, axis=0, level=None,
                  grouper=None, exclusions=None, selection=None, as_index=True,
-                 sort=True, group_keys=True):
+                 sort=True, group_keys=True, n_jobs=1, assume_sorted=False):
         self._selection = selection
 
         if isinstance(obj, NDFrame):
@@ -136,10 +137,13 @@ class GroupBy(object):
         self.keys = keys
         self.sort = sort
         self.group_keys = group_keys
+        self.n_jobs = n_jobs
 
         if grouper is None:
             grouper, exclusions = _get_grouper(obj, keys, axis=axis,
                                                level=level, sort=sort)
+            if assume_sorted:
+                grouper = _get_sorted_grouper(grouper)
 
         self.grouper = grouper
         self.exclusions = set(exclusions) if exclusions else set()
@@ -322,12 +326,211 @@ class GroupBy(object):
             f = lambda x: x.var(ddof=ddof)
             return self._python_agg_general(f)
 
+    def median(self):
+        """
+        Compute median of groups, excluding missing values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        try:
+            return self._cython_agg_general('median')
+        except GroupByError:
+            raise
+        except Exception:  # pragma: no cover
+            f = lambda x: x.median(axis=self.axis)
+            return self._python_agg_general(f)
+
+    def quantile(self, q=0.5):
+        """
+        Compute value at the given quantile of groups, a la scoreatpercentile
+        in scipy.stats, excluding missing values
+
+        Parameters
+        ----------
+        q : quantile, default 0.5 (50% quantile)
+            0 <= q <= 1
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        return self._cython_agg_general('quantile', q=q)
+
+    def sem(self):
+        """
+        Compute standard error of the mean of groups, excluding missing values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        return self._cython_agg_general('sem')
+
+    def count(self, axis=None, **kwds):
+        """
+        Compute count of group values, excluding missing values
+
+        Parameters
+        ----------
+        axis : int, optional
+        kwds : other keywords of DataFrame.count / Series.count, e.g. level
+
+        Counts along the grouping axis without other keywords are computed
+        in Cython, anything else counts each group with its own count method
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        if (axis is None or axis == self.axis) and not kwds:
+            return self._cython_agg_general('count')
+
+        if axis is not None:
+            kwds['axis'] = axis
+        f = lambda x: x.count(**kwds)
+        try:
+            return self._python_agg_general(f)
+        except ValueError:
+            # per-group counts by level or across the other axis do not
+            # reduce, stitch them together like apply
+            return self.apply(f)
+
+    def nunique(self):
+        """
+        Compute number of distinct values in groups, excluding missing values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        return self._cython_agg_general('nunique')
+
+    def partial_aggregate(self, how, **kwds):
+        """
+        Mergeable per-group state of the aggregation `how`, for data read
+        in chunks. Merge the states of the chunks with combine, then call
+        result on the merged state
+
+        Parameters
+        ----------
+        how : {'sum', 'count', 'mean', 'var', 'std', 'min', 'max', 'nunique',
+               'quantile'}
+            nunique (HyperLogLog) and quantile (t-digest) are approximate
+        q : float, default 0.5
+            Quantile to compute with how='quantile'
+        compression : float, default 100
+            Roughly the number of centroids kept per group with
+            how='quantile'; more is more accurate
+        precision : int, default 10
+            log2 of the number of HyperLogLog registers per group with
+            how='nunique'; relative error is about 1.04 / sqrt(2 ** precision)
+
+        Notes
+        -----
+        nunique hashes numbers and strings the same way in every process.
+        Other objects (tuples, dates in object columns, ...) go through
+        hash(), so their states only merge within one process
+
+        Examples
+        --------
+        >>> parts = [chunk.groupby('key').partial_aggregate('mean')
+        ...          for chunk in read_csv(path, chunksize=100000)]
+        >>> reduce(lambda a, b: a.combine(b), parts).result()
+
+        Returns
+        -------
+        partial : PartialAggregate
+        """
+        return PartialAggregate.from_groupby(self, how, **kwds)
+
     def size(self):
         """
         Compute group sizes
         """
         return self.grouper.size()
 
+    def cumsum(self):
+        """
+        Cumulative sum within each group, skipping missing values. The result
+        is indexed like the grouped object
+        """
+        return self._cython_transform('cumsum', lambda x: x.cumsum())
+
+    def cumprod(self):
+        """
+        Cumulative product within each group, skipping missing values. The
+        result is indexed like the grouped object
+        """
+        return self._cython_transform('cumprod', lambda x: x.cumprod())
+
+    def cummin(self):
+        """
+        Cumulative minimum within each group, skipping missing values. The
+        result is indexed like the grouped object
+        """
+        return self._cython_transform('cummin', lambda x: x.cummin())
+
+    def cummax(self):
+        """
+        Cumulative maximum within each group, skipping missing values. The
+        result is indexed like the grouped object
+        """
+        return self._cython_transform('cummax', lambda x: x.cummax())
+
+    def shift(self, periods=1):
+        """
+        Shift values by desired number of rows within each group, introducing
+        missing values at the start (end if periods is negative) of each group
+
+        Parameters
+        ----------
+        periods : int
+            Number of rows to move, can be positive or negative
+        """
+        return self._cython_transform('shift', lambda x: x.shift(periods),
+                                      periods=periods)
+
+    def diff(self, periods=1):
+        """
+        1st discrete difference within each group
+
+        Parameters
+        ----------
+        periods : int, default 1
+            Rows to shift for forming difference
+        """
+        return self._cython_transform('diff', lambda x: x.diff(periods),
+                                      periods=periods)
+
+    def pct_change(self, periods=1, fill_method='pad', limit=None):
+        """
+        Percent change over given number of rows within each group
+
+        Parameters
+        ----------
+        periods : int, default 1
+            Rows to shift for forming percent change
+        fill_method : {'pad', None}, default 'pad'
+            How to handle NAs, within each group, before computing percent
+            changes
+        limit : int, default None
+            The number of consecutive NAs to fill before stopping
+        """
+        alt = lambda x: x.pct_change(periods, fill_method=fill_method,
+                                     limit=limit)
+        return self._cython_transform('pct_change', alt, periods=periods,
+                                      fill_method=fill_method, limit=limit)
+
+    def rank(self, method='average', ascending=True):
+        """
+        Compute data ranks (1 through group size) within each group
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'first'}
+            average: average rank of group
+            min: lowest rank in group
+            max: highest rank in group
+            first: ranks assigned in order they appear in the array
+        ascending : boolean, default True
+            False for ranks by high (1) to low (N)
+        """
+        alt = lambda x: x.rank(method=method, ascending=ascending)
+        return self._cython_transform('rank', alt, method=method,
+                                      ascending=ascending)
+
     sum = _groupby_function('sum', 'add', np.sum)
     prod = _groupby_function('prod', 'prod', np.prod)
     min = _groupby_function('min', 'min', np.min)
@@ -352,13 +555,13 @@ class GroupBy(object):
                 return np.nan
         return self.agg(picker)
 
-    def _cython_agg_general(self, how):
+    def _cython_agg_general(self, how, **kwds):
         output = {}
         for name, obj in self._iterate_slices():
-            if not issubclass(obj.dtype.type, (np.number, np.bool_)):
+            try:
+                result, names = self.grouper.aggregate(obj.values, how, **kwds)
+            except NotImplementedError:
                 continue
-
-            result, names = self.grouper.aggregate(obj.values, how)
             output[name] = result
 
         if len(output) == 0:
@@ -366,6 +569,24 @@ class GroupBy(object):
 
         return self._wrap_aggregated_output(output, names)
 
+    def _cython_transform(self, how, alt, **kwds):
+        output = {}
+        for name, obj in self._iterate_slices():
+            try:
+                output[name] = self.grouper.transform(obj.values, how, **kwds)
+            except NotImplementedError:
+                continue
+
+        try:
+            if len(output) == 0:
+                raise NotImplementedError
+            return self._wrap_transformed_output(output)
+        except NotImplementedError:
+            return self.apply(alt)
+
+    def _wrap_transformed_output(self, output):
+        raise NotImplementedError
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = _intercept_function(func)
         agg_func = lambda x: func(x, *args, **kwargs)
@@ -422,7 +643,13 @@ class GroupBy(object):
             result = concat(values, axis=self.axis)
             ax = self.obj._get_axis(self.axis)
 
-            if isinstance(result, Series):
+            reverse_indexer = self.grouper._reverse_sort_idx
+            if (reverse_indexer is not None and len(values) == self.ngroups
+                and result.shape[self.axis] == len(ax)):
+                # the pieces are the groups of the sorted data, so undoing
+                # the sort is enough to line them back up
+                result = result.take(reverse_indexer, axis=self.axis)
+            elif isinstance(result, Series):
                 result = result.reindex(ax)
             else:
                 result = result.reindex_axis(ax, axis=self.axis)
@@ -437,7 +664,7 @@ class GroupBy(object):
 
         return result
 
-def _generate_groups(obj, group_index, ngroups, axis=0):
+def _generate_groups(obj, group_index, ngroups, axis=0, sorter=None):
     if isinstance(obj, NDFrame) and not isinstance(obj, DataFrame):
         factory = obj._constructor
         obj = obj._data
@@ -445,7 +672,7 @@ def _generate_groups(obj, group_index, ngroups, axis=0):
         factory = None
 
     return generate_groups(obj, group_index, ngroups,
-                           axis=axis, factory=factory)
+                           axis=axis, factory=factory, sorter=sorter)
 
 @Appender(GroupBy.__doc__)
 def groupby(obj, by, **kwds):
@@ -458,6 +685,44 @@ def groupby(obj, by, **kwds):
 
     return klass(obj, by, **kwds)
 
+def _get_n_threads(n_jobs):
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        import multiprocessing
+        return max(multiprocessing.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+def _split_block_values(values, agg_axis, n_jobs):
+    """
+    Split 2-d block values aggregated along axis 1 into at most n_jobs
+    contiguous column ranges of the original frame
+    """
+    nthreads = _get_n_threads(n_jobs)
+    if nthreads == 1 or values.ndim != 2 or agg_axis != 1:
+        return [values]
+
+    nchunks = min(nthreads, len(values))
+    bounds = np.linspace(0, len(values), nchunks + 1).astype(int)
+    return [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+def _map_threaded(func, tasks, n_jobs):
+    """
+    map(func, tasks) on a pool of n_jobs threads. The compiled groupby
+    kernels release the GIL, so the tasks run concurrently
+    """
+    nthreads = min(_get_n_threads(n_jobs), len(tasks))
+    if nthreads <= 1:
+        return [func(task) for task in tasks]
+
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(nthreads)
+    try:
+        return pool.map(func, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
 def _get_axes(group):
     if isinstance(group, Series):
         return [group.index]
@@ -478,11 +743,17 @@ class Grouper(object):
     """
 
     """
-    def __init__(self, axis, groupings, sort=True, group_keys=True):
+    # key columns left out of the aggregation when the grouper is reused
+    exclusions = ()
+
+    def __init__(self, axis, groupings, sort=True, group_keys=True,
+                 exclusions=None):
         self.axis = axis
         self.groupings = groupings
         self.sort = sort
         self.group_keys = group_keys
+        if exclusions is not None:
+            self.exclusions = exclusions
 
     @property
     def shape(self):
@@ -504,29 +775,21 @@ class Grouper(object):
         Generator yielding sequence of (name, subsetted object)
         for each group
         """
+        # groups are contiguous slices of the data sorted once by group id
+        comp_ids, _, ngroups = self.group_info
         if len(self.groupings) == 1:
-            indices = self.indices
-            groups = indices.keys()
-            try:
-                groups = sorted(groups)
-            except Exception: # pragma: no cover
-                pass
-
-            for name in groups:
-                inds = indices[name]
-                group = data.take(inds, axis=axis)
-                yield name, group
+            get_key = list(self.result_index).__getitem__
         else:
             # provide "flattened" iterator for multi-group setting
-            comp_ids, _, ngroups = self.group_info
             label_list = self.labels
             level_list = self.levels
             mapper = _KeyMapper(comp_ids, ngroups, label_list, level_list)
+            get_key = mapper.get_key
 
-            for label, group in _generate_groups(data, comp_ids, ngroups,
-                                                 axis=axis):
-                key = mapper.get_key(label)
-                yield key, group
+        for label, group in _generate_groups(data, comp_ids, ngroups,
+                                             axis=axis,
+                                             sorter=self._sort_idx):
+            yield get_key(label), group
 
     @cache_readonly
     def indices(self):
@@ -570,6 +833,22 @@ class Grouper(object):
 
             return self.axis.groupby(to_groupby)
 
+    @cache_readonly
+    def _sort_idx(self):
+        # stable sort of the rows by group id
+        comp_ids, _, ngroups = self.group_info
+        return lib.groupsort_indexer(comp_ids, ngroups)[0]
+
+    @cache_readonly
+    def _reverse_sort_idx(self):
+        # where each row went in the sorted data, None if some rows are in no
+        # group
+        if len(self._sort_idx) and (self.group_info[0] < 0).any():
+            return None
+        reverse_indexer = np.empty(len(self._sort_idx), dtype=np.int64)
+        reverse_indexer.put(self._sort_idx, np.arange(len(self._sort_idx)))
+        return reverse_indexer
+
     @cache_readonly
     def group_info(self):
         comp_ids, obs_group_ids = self._get_compressed_labels()
@@ -580,20 +859,33 @@ class Grouper(object):
 
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
-        if self._overflow_possible:
-            tups = lib.fast_zip(all_labels)
-            labs, uniques, _ = algos.factorize(tups)
-
-            if self.sort:
-                uniques, labs = _reorder_by_uniques(uniques, labs)
-
-            return labs, uniques
+        if len(all_labels) == 1 and not self.groupings[0]._was_factor:
+            # factorized labels are already dense, and sorted if asked for
+            labels = all_labels[0]
+            return labels, np.arange(self.groupings[0].ngroups, dtype=np.int64)
+        elif self._overflow_possible:
+            # combine the keys one at a time, compressing after each step so
+            # the offsets stay within the number of rows. The observed ids are
+            # then the position of a row in each group, see get_group_levels
+            comp_ids, ngroups = all_labels[0], self.shape[0]
+            for labels, size in zip(all_labels[1:], self.shape[1:]):
+                group_index = get_group_index([comp_ids, labels],
+                                              (ngroups, size))
+                comp_ids, obs_ids = _compress_group_index(group_index,
+                                                          sort=self.sort)
+                ngroups = len(obs_ids)
+
+            mask = comp_ids >= 0
+            group_rows = np.empty(ngroups, dtype=np.int64)
+            group_rows[comp_ids[mask]] = np.arange(len(comp_ids))[mask]
+            return comp_ids, group_rows
         else:
             if len(all_labels) > 1:
                 group_index = get_group_index(all_labels, self.shape)
             else:
                 group_index = all_labels[0]
-            comp_ids, obs_group_ids = _compress_group_index(group_index)
+            comp_ids, obs_group_ids = _compress_group_index(group_index,
+                                                            sort=self.sort)
             return comp_ids, obs_group_ids
 
     @cache_readonly
@@ -611,8 +903,11 @@ class Grouper(object):
 
     def get_group_levels(self):
         obs_ids = self.group_info[1]
-        if self._overflow_possible:
-            recons_labels = [np.array(x) for x in izip(*obs_ids)]
+        if len(self.groupings) == 1:
+            recons_labels = [obs_ids]
+        elif self._overflow_possible:
+            recons_labels = [ping.labels.take(obs_ids)
+                             for ping in self.groupings]
         else:
             recons_labels = decons_group_index(obs_ids, self.shape)
 
@@ -635,7 +930,25 @@ class Grouper(object):
         'var' : lib.group_var,
         'std' : lib.group_var,
         'first': lambda a, b, c, d: lib.group_nth(a, b, c, d, 1),
-        'last': lib.group_last
+        'last': lib.group_last,
+        'median': lambda a, b, c, d: lib.group_quantile(a, b, c, d, 0.5),
+        'quantile': lib.group_quantile,
+        'sem': lib.group_sem,
+        'nunique': lib.group_nunique
+    }
+
+    # kernels aggregating in the dtype of the values (see
+    # _get_kernel_dtype), generated as group_<how>_<dtype>. Other dtypes go
+    # through float64
+    _typed_kernel_name = 'group_%s_%s'
+    _typed_cython_functions = {
+        'add' : ('float32', 'int64', 'uint64'),
+        'min' : ('float32', 'int64', 'uint64', 'datetime64', 'object'),
+        'max' : ('float32', 'int64', 'uint64', 'datetime64', 'object'),
+        'first' : ('float32', 'int64', 'uint64', 'datetime64', 'object'),
+        'last' : ('float32', 'int64', 'uint64', 'datetime64', 'object'),
+        'count' : ('float64', 'float32', 'int64', 'uint64', 'datetime64',
+                   'object'),
     }
 
     _cython_transforms = {
@@ -650,8 +963,53 @@ class Grouper(object):
 
     _filter_empty_groups = True
 
-    def aggregate(self, values, how, axis=0):
-        values = com._ensure_float64(values)
+    def _get_aggregate_function(self, how, values):
+        """
+        Returns the kernel computing `how` on values, together with the
+        values converted to the kernel's input type and the result dtype
+        """
+        dtype_str = _get_kernel_dtype(values)
+        if dtype_str is None:
+            raise NotImplementedError('cannot aggregate %s values'
+                                      % values.dtype)
+
+        if how == 'nunique':
+            return (self._cython_functions[how], _factorize_values(values),
+                    np.int64)
+
+        if dtype_str in self._typed_cython_functions.get(how, ()):
+            out_dtype = values.dtype
+            if dtype_str == 'datetime64':
+                values = values.view(np.int64)
+            elif dtype_str == 'int64':
+                values = com._ensure_int64(values)
+                out_dtype = values.dtype
+            elif dtype_str == 'float64':
+                values = com._ensure_float64(values)
+
+            if how == 'first':
+                nth = getattr(_algos, 'group_nth_%s' % dtype_str)
+                agg_func = lambda a, b, c, d: nth(a, b, c, d, 1)
+            else:
+                agg_func = getattr(_algos, self._typed_kernel_name
+                                   % (how, dtype_str))
+
+            if how == 'count':
+                out_dtype = np.int64
+            return agg_func, values, out_dtype
+
+        if dtype_str in ('datetime64', 'object'):
+            raise NotImplementedError('%s not supported for %s values'
+                                      % (how, values.dtype))
+
+        return (self._cython_functions[how], com._ensure_float64(values),
+                np.float64)
+
+    def aggregate(self, values, how, axis=0, **kwds):
+        agg_func, values, out_dtype = self._get_aggregate_function(how,
+                                                                   values)
+        out_dtype = np.dtype(out_dtype)
+        is_datetime = issubclass(out_dtype.type, np.datetime64)
         arity = self._cython_arity.get(how, 1)
 
         vdim = values.ndim
@@ -668,18 +1026,25 @@ class Grouper(object):
             out_shape = (self.ngroups,) + values.shape[1:]
 
         # will be filled in Cython function
-        result = np.empty(out_shape, dtype=np.float64)
+        if is_datetime:
+            result = np.empty(out_shape, dtype=np.int64)
+        else:
+            result = np.empty(out_shape, dtype=out_dtype)
         counts = np.zeros(self.ngroups, dtype=np.int64)
 
-        result = self._aggregate(result, counts, values, how)
+        result = self._aggregate(result, counts, values, agg_func, how,
+                                 **kwds)
 
         if self._filter_empty_groups:
-            if result.ndim == 2:
+            if result.ndim == 2 and result.dtype == np.float64:
                 result = lib.row_bool_subset(result,
                                              (counts > 0).view(np.uint8))
             else:
                 result = result[counts > 0]
 
+        if is_datetime:
+            result = result.view(out_dtype)
+
         if vdim == 1 and arity == 1:
             result = result[:, 0]
 
@@ -694,8 +1059,7 @@ class Grouper(object):
 
         return result, names
 
-    def _aggregate(self, result, counts, values, how):
-        agg_func = self._cython_functions[how]
+    def _aggregate(self, result, counts, values, agg_func, how, **kwds):
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         comp_ids, _, ngroups = self.group_info
@@ -705,12 +1069,164 @@ class Grouper(object):
         elif values.ndim > 2:
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
                 agg_func(result[:, :, i], counts, chunk.squeeze(),
-                         comp_ids)
+                         comp_ids, **kwds)
         else:
-            agg_func(result, counts, values, comp_ids)
+            agg_func(result, counts, values, comp_ids, **kwds)
 
         return trans_func(result)
 
+    # statistics aggregate_multiple computes together from one pass of
+    # group_summary over float64 values
+    _summary_functions = ('count', 'sum', 'mean', 'var', 'std', 'min', 'max')
+
+    def aggregate_multiple(self, values, hows, axis=0):
+        """
+        Aggregate float64 values by each of hows (see _summary_functions)
+        with a single pass over the data
+
+        Returns
+        -------
+        results : list of ndarray, like the results of aggregate
+        """
+        if values.dtype != np.float64:
+            raise NotImplementedError('%s values' % values.dtype)
+        for how in hows:
+            if how not in self._summary_functions:
+                raise NotImplementedError(how)
+
+        vdim = values.ndim
+        if vdim == 1:
+            values = values[:, None]
+        elif vdim > 2:
+            raise NotImplementedError
+        elif axis > 0:
+            values = values.swapaxes(0, axis)
+
+        comp_ids, _, ngroups = self.group_info
+        shape = (ngroups, values.shape[1])
+        nobs = np.zeros(shape)
+        sumx = np.zeros(shape)
+        sumxx = np.zeros(shape)
+        minx = np.empty(shape)
+        maxx = np.empty(shape)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        lib.group_summary(nobs, sumx, sumxx, minx, maxx, counts, values,
+                          comp_ids)
+
+        # same formulas as the single statistic kernels
+        missing = nobs == 0
+        results = []
+        for how in hows:
+            if how == 'count':
+                result = nobs.astype(np.int64)
+            elif how == 'sum':
+                result = np.where(missing, np.nan, sumx)
+            elif how == 'mean':
+                result = sumx / np.where(missing, np.nan, nobs)
+            elif how in ('var', 'std'):
+                ct = np.where(nobs < 2, np.nan, nobs)
+                result = (ct * sumxx - sumx * sumx) / (ct * ct - ct)
+                if how == 'std':
+                    result = np.sqrt(result)
+            elif how == 'min':
+                result = np.where(missing, np.nan, minx)
+            elif how == 'max':
+                result = np.where(missing, np.nan, maxx)
+
+            if self._filter_empty_groups:
+                result = result[counts > 0]
+
+            if vdim == 1:
+                result = result[:, 0]
+            elif axis > 0:
+                result = result.swapaxes(0, axis)
+
+            results.append(result)
+
+        return results
+
+    #------------------------------------------------------------
+    # Transform functions
+
+    # cumulative kernels generated as group_<how>_<dtype>
+    _cumulative_functions = {
+        'cumsum' : ('float64', 'int64'),
+        'cumprod' : ('float64', 'int64'),
+        'cummin' : ('float64', 'int64', 'datetime64'),
+        'cummax' : ('float64', 'int64', 'datetime64'),
+    }
+
+    def transform(self, values, how, **kwds):
+        """
+        Compute the group-wise transform `how` of 1-d values in one pass over
+        the group ids, returning an array aligned with values
+        """
+        comp_ids, _, ngroups = self.group_info
+        dtype_str = _get_kernel_dtype(values)
+        if dtype_str is None:
+            raise NotImplementedError('cannot transform %s values'
+                                      % values.dtype)
+
+        if how == 'shift':
+            indexer = lib.group_shift_indexer(comp_ids, ngroups,
+                                              kwds['periods'])
+            return com.take_1d(values, indexer)
+
+        if dtype_str in ('datetime64', 'object'):
+            if dtype_str not in self._cumulative_functions.get(how, ()):
+                raise NotImplementedError('%s not supported for %s values'
+                                          % (how, values.dtype))
+
+        if how in self._cumulative_functions:
+            dtypes = self._cumulative_functions[how]
+            if dtype_str == 'int64' and (comp_ids < 0).any():
+                # rows with a missing key need NaN
+                dtype_str = 'float64'
+            elif dtype_str not in dtypes:
+                dtype_str = 'float64'
+
+            if dtype_str == 'datetime64':
+                kernel_values = values.view(np.int64)
+            elif dtype_str == 'int64':
+                kernel_values = com._ensure_int64(values)
+            else:
+                kernel_values = com._ensure_float64(values)
+
+            result = np.empty((len(values), 1), dtype=kernel_values.dtype)
+            kernel = getattr(_algos, 'group_%s_%s' % (how, dtype_str))
+            kernel(result, kernel_values[:, None], comp_ids, ngroups)
+            result = result[:, 0]
+            if dtype_str == 'datetime64':
+                result = result.view(values.dtype)
+            return result
+
+        values = com._ensure_float64(values)
+        if how == 'rank':
+            return lib.group_rank_float64(values, comp_ids,
+                                          ties_method=kwds['method'],
+                                          ascending=kwds['ascending'])
+
+        periods = kwds['periods']
+        indexer = lib.group_shift_indexer(comp_ids, ngroups, periods)
+        if how == 'diff':
+            return values - com.take_1d(values, indexer)
+        elif how == 'pct_change':
+            fill_method = kwds['fill_method']
+            if fill_method is None:
+                filled = values
+            elif fill_method in ('pad', 'ffill'):
+                mask = np.isnan(values)
+                filler = lib.group_pad_indexer(comp_ids, ngroups, mask,
+                                               kwds['limit'])
+                filled = com.take_1d(values, filler)
+            else:
+                raise NotImplementedError
+            result = filled / com.take_1d(filled, indexer) - 1
+            result[np.isnan(values)] = np.nan
+            return result
+
+        raise NotImplementedError('unknown transform %s' % how)
+
     def agg_series(self, obj, func):
         try:
             return self._aggregate_series_fast(obj, func)
@@ -727,7 +1243,7 @@ class Grouper(object):
 
         # avoids object / Series creation overhead
         dummy = obj[:0].copy()
-        indexer = lib.groupsort_indexer(group_index, ngroups)[0]
+        indexer = self._sort_idx
         obj = obj.take(indexer)
         group_index = com.ndtake(group_index, indexer)
         grouper = lib.SeriesGrouper(obj, func, group_index, ngroups,
@@ -744,7 +1260,8 @@ class Grouper(object):
         group_index, _, ngroups = self.group_info
 
         for label, group in _generate_groups(obj, group_index, ngroups,
-                                             axis=self.axis):
+                                             axis=self.axis,
+                                             sorter=self._sort_idx):
             res = func(group)
             if result is None:
                 try:
@@ -761,6 +1278,37 @@ class Grouper(object):
         return result, counts
 
 
+def _get_kernel_dtype(values):
+    """
+    Name of the dtype whose group_* kernels aggregate values, or None if
+    there are none
+    """
+    dtype = values.dtype
+    if dtype == np.float32:
+        return 'float32'
+    elif dtype == np.uint64:
+        return 'uint64'
+    elif issubclass(dtype.type, np.integer):
+        return 'int64'
+    elif issubclass(dtype.type, (np.number, np.bool_)):
+        return 'float64'
+    elif issubclass(dtype.type, np.datetime64):
+        return 'datetime64'
+    elif dtype == np.object_:
+        return 'object'
+    return None
+
+def _factorize_values(values):
+    """
+    Integer codes of values (of any shape) for the nunique kernels, -1 for
+    nulls
+    """
+    flat = values.ravel()
+    codes = algos.factorize(flat)[0]
+    if com.is_datetime64_dtype(values):
+        codes[flat.view(np.int64) == lib.iNaT] = -1
+    return com._ensure_int64(codes).reshape(values.shape)
+
 def generate_bins_generic(values, binner, closed):
     """
     Generate bin edge offsets and bin labels for one array using another array
@@ -827,6 +1375,9 @@ class BinGrouper(Grouper):
         self.binlabels = _ensure_index(binlabels)
         self._filter_empty_groups = filter_empty
 
+    # bins already follow the order of the data
+    _reverse_sort_idx = None
+
     @property
     def nkeys(self):
         return 1
@@ -880,7 +1431,17 @@ class BinGrouper(Grouper):
         'std' : lib.group_var_bin,
         'ohlc' : lib.group_ohlc,
         'first': lambda a, b, c, d: lib.group_nth_bin(a, b, c, d, 1),
-        'last': lib.group_last_bin
+        'last': lib.group_last_bin,
+        'median': lambda a, b, c, d: lib.group_quantile_bin(a, b, c, d, 0.5),
+        'quantile': lib.group_quantile_bin,
+        'sem': lib.group_sem_bin,
+        'nunique': lib.group_nunique_bin
+    }
+
+    _typed_kernel_name = 'group_%s_bin_%s'
+    _typed_cython_functions = {
+        'count' : ('float64', 'float32', 'int64', 'uint64', 'datetime64',
+                   'object'),
     }
 
     _name_functions = {
@@ -889,8 +1450,7 @@ class BinGrouper(Grouper):
 
     _filter_empty_groups = True
 
-    def _aggregate(self, result, counts, values, how):
-        agg_func = self._cython_functions[how]
+    def _aggregate(self, result, counts, values, agg_func, how, **kwds):
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         if values.ndim > 3:
@@ -898,18 +1458,131 @@ class BinGrouper(Grouper):
             raise NotImplementedError
         elif values.ndim > 2:
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
-                agg_func(result[:, :, i], counts, chunk, self.bins)
+                agg_func(result[:, :, i], counts, chunk, self.bins, **kwds)
         else:
-            agg_func(result, counts, values, self.bins)
+            agg_func(result, counts, values, self.bins, **kwds)
 
         return trans_func(result)
 
+    def aggregate_multiple(self, values, hows, axis=0):
+        # no bin version of group_summary
+        raise NotImplementedError
+
+    def transform(self, values, how, **kwds):
+        raise NotImplementedError
+
     def agg_series(self, obj, func):
         dummy = obj[:0]
         grouper = lib.SeriesBinGrouper(obj, func, self.bins, dummy)
         return grouper.get_result()
 
 
+class SortedGrouper(Grouper):
+    """
+    Grouper over keys that are already sorted, see assume_sorted in
+    groupby. The groups are the runs of equal keys, found in one linear
+    scan, so the keys are neither hashed nor sorted, and the float64
+    aggregations run the bin kernels of BinGrouper over the run boundaries
+
+    Parameters
+    ----------
+    bins : ndarray
+        End position of each run
+    binlabels : Index
+        Keys of the runs, the result index
+    """
+
+    def __init__(self, axis, groupings, bins, binlabels, group_keys=True,
+                 exclusions=None):
+        Grouper.__init__(self, axis, groupings, sort=True,
+                         group_keys=group_keys, exclusions=exclusions)
+        self.bins = com._ensure_int64(bins)
+        self.binlabels = binlabels
+
+    def get_iterator(self, data, axis=0):
+        """
+        Groupby iterator
+
+        Returns
+        -------
+        Generator yielding sequence of (name, subsetted object)
+        for each group
+        """
+        comp_ids, _, ngroups = self.group_info
+        get_key = list(self.result_index).__getitem__
+
+        for label, group in _generate_groups(data, comp_ids, ngroups,
+                                             axis=axis,
+                                             sorter=self._sort_idx):
+            yield get_key(label), group
+
+    @cache_readonly
+    def _run_starts(self):
+        return np.concatenate(([0], self.bins[:-1]))
+
+    @cache_readonly
+    def indices(self):
+        return dict((key, np.arange(start, end))
+                    for key, start, end in izip(self.result_index,
+                                                self._run_starts, self.bins))
+
+    def size(self):
+        """
+        Compute group sizes
+        """
+        return Series(self.bins - self._run_starts, index=self.result_index)
+
+    @cache_readonly
+    def _sort_idx(self):
+        return np.arange(len(self.axis), dtype=np.int64)
+
+    @cache_readonly
+    def group_info(self):
+        ngroups = len(self.bins)
+        obs_group_ids = np.arange(ngroups, dtype=np.int64)
+        comp_ids = np.repeat(obs_group_ids, self.bins - self._run_starts)
+        return comp_ids, obs_group_ids, ngroups
+
+    @cache_readonly
+    def ngroups(self):
+        return len(self.bins)
+
+    @cache_readonly
+    def result_index(self):
+        return self.binlabels
+
+    def _get_aggregate_function(self, how, values):
+        dtype_str = _get_kernel_dtype(values)
+        agg_func, values, out_dtype = Grouper._get_aggregate_function(
+            self, how, values)
+
+        if dtype_str in BinGrouper._typed_cython_functions.get(how, ()):
+            bin_func = getattr(_algos, BinGrouper._typed_kernel_name
+                               % (how, dtype_str))
+        elif agg_func is self._cython_functions.get(how):
+            bin_func = BinGrouper._cython_functions[how]
+        else:
+            # kernels typed for the values have no bin version
+            return agg_func, values, out_dtype
+
+        bins = self.bins
+        def _bin_agg_func(out, counts, values, labels, **kwds):
+            # the runs are the bins, the labels are not needed
+            bin_func(out, counts, values, bins, **kwds)
+
+        return _bin_agg_func, values, out_dtype
+
+    def _aggregate_series_fast(self, obj, func):
+        func = _intercept_function(func)
+
+        if obj.index._has_complex_internals:
+            raise TypeError('Incompatible index for Cython grouper')
+
+        dummy = obj[:0].copy()
+        grouper = lib.SeriesBinGrouper(obj, func, self.bins, dummy)
+        return grouper.get_result()
+
+
 class Grouping(object):
     """
     Holds the grouping information for a single key
@@ -1061,7 +1734,11 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
         gpr = key.get_grouper(obj)
         return gpr, []
     elif isinstance(key, Grouper):
-        return key, []
+        # reuse the labels and group ids already computed by the grouper
+        if len(getattr(key, 'axis', group_axis)) != len(group_axis):
+            raise ValueError('Grouper length %d does not match axis length %d'
+                             % (len(key.axis), len(group_axis)))
+        return key, list(key.exclusions)
 
     if not isinstance(key, (tuple, list)):
         keys = [key]
@@ -1114,13 +1791,64 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
     if len(groupings) == 0:
         raise ValueError('No group keys passed!')
 
-    grouper = Grouper(group_axis, groupings, sort=sort)
+    grouper = Grouper(group_axis, groupings, sort=sort,
+                      exclusions=exclusions)
 
     return grouper, exclusions
 
 def _is_label_like(val):
     return isinstance(val, basestring) or np.isscalar(val)
 
+def _get_sorted_grouper(grouper):
+    """
+    SortedGrouper over the runs of equal keys of grouper, found in one scan.
+    Returns grouper itself if the keys turn out not to be sorted or have
+    missing values
+    """
+    if type(grouper) is not Grouper or len(grouper.axis) == 0:
+        return grouper
+
+    keys = []
+    for ping in grouper.groupings:
+        if ping._was_factor:
+            values = com._ensure_int64(ping.labels)
+            if (values < 0).any():
+                return grouper
+        else:
+            values = np.asarray(ping.grouper)
+            if com.isnull(values).any():
+                return grouper
+        keys.append(values)
+
+    n = len(grouper.axis)
+    changed = np.zeros(n - 1, dtype=bool)
+    for values in keys:
+        changed |= values[1:] != values[:-1]
+    starts = np.concatenate(([0], changed.nonzero()[0] + 1))
+    bins = np.concatenate((starts[1:], [n]))
+
+    # the runs must be in increasing order of the keys, else a key could
+    # come back in a later run
+    run_keys = [values.take(starts) for values in keys]
+    greater = np.zeros(len(starts) - 1, dtype=bool)
+    equal = np.ones(len(starts) - 1, dtype=bool)
+    for values in run_keys:
+        greater |= equal & (values[1:] > values[:-1])
+        equal &= values[1:] == values[:-1]
+    if not greater.all():
+        return grouper
+
+    levels = []
+    for ping, values in zip(grouper.groupings, run_keys):
+        if ping._was_factor:
+            values = ping.group_index.take(values)
+        levels.append(values)
+    binlabels = MultiIndex.from_arrays(levels, names=grouper.names)
+
+    return SortedGrouper(grouper.axis, grouper.groupings, bins, binlabels,
+                         group_keys=grouper.group_keys,
+                         exclusions=grouper.exclusions)
+
 def _convert_grouper(axis, grouper):
     if isinstance(grouper, dict):
         return grouper.get
@@ -1215,24 +1943,19 @@ class SeriesGroupBy(GroupBy):
         return ret
 
     def _aggregate_multiple_funcs(self, arg):
-        if isinstance(arg, dict):
-            columns = arg.keys()
-            arg = arg.items()
-        elif any(isinstance(x, (tuple, list)) for x in arg):
-            arg = [(x, x) if not isinstance(x, (tuple, list)) else x
-                   for x in arg]
-
-            # indicated column order
-            columns = list(zip(*arg))[0]
-        else:
-            # list of functions / function names
-            columns = []
-            for f in arg:
-                if isinstance(f, basestring):
-                    columns.append(f)
-                else:
-                    columns.append(f.__name__)
-            arg = zip(columns, arg)
+        columns, arg = _normalize_multiple_funcs(arg)
+
+        hows = _get_summary_hows([func for _, func in arg])
+        if hows is not None:
+            try:
+                results = self.grouper.aggregate_multiple(self.obj.values,
+                                                          hows)
+            except NotImplementedError:
+                pass
+            else:
+                return DataFrame(dict(zip(columns, results)),
+                                 index=self.grouper.result_index,
+                                 columns=columns)
 
         results = {}
 
@@ -1251,12 +1974,18 @@ class SeriesGroupBy(GroupBy):
         else:
             return Series(output, index=index, name=self.name)
 
+    def _wrap_transformed_output(self, output):
+        return Series(output[self.name], index=self.obj.index, name=self.name)
+
     def _wrap_applied_output(self, keys, values, not_indexed_same=False):
         if len(keys) == 0:
             return Series([])
 
         def _get_index():
-            if self.grouper.nkeys > 1:
+            if len(keys) == self.grouper.ngroups:
+                # groups were iterated in result order
+                return self.grouper.result_index
+            elif self.grouper.nkeys > 1:
                 index = MultiIndex.from_tuples(keys, names=self.grouper.names)
             else:
                 index = Index(keys, name=self.grouper.names[0])
@@ -1342,8 +2071,8 @@ class NDFrameGroupBy(GroupBy):
 
             yield val, slicer(val)
 
-    def _cython_agg_general(self, how):
-        new_blocks = self._cython_agg_blocks(how)
+    def _cython_agg_general(self, how, **kwds):
+        new_blocks = self._cython_agg_blocks(how, **kwds)
         return self._wrap_agged_blocks(new_blocks)
 
     def _wrap_agged_blocks(self, blocks):
@@ -1365,18 +2094,38 @@ class NDFrameGroupBy(GroupBy):
 
     _block_agg_axis = 0
 
-    def _cython_agg_blocks(self, how):
+    def _cython_agg_blocks(self, how, **kwds):
         data, agg_axis = self._get_data_to_aggregate()
 
-        new_blocks = []
+        # compute the groups up front rather than in the worker threads
+        self.grouper.ngroups
 
+        tasks = []
         for block in data.blocks:
-            values = block.values
-            if not issubclass(values.dtype.type, (np.number, np.bool_)):
-                continue
+            values = block.get_values(block.dtype)
+            for chunk in _split_block_values(values, agg_axis, self.n_jobs):
+                tasks.append((block, chunk))
 
-            values = com._ensure_float64(values)
-            result, names = self.grouper.aggregate(values, how, axis=agg_axis)
+        def _aggregate_chunk(task):
+            try:
+                result, _ = self.grouper.aggregate(task[1], how,
+                                                   axis=agg_axis, **kwds)
+            except NotImplementedError:
+                return None
+            return result
+
+        results = _map_threaded(_aggregate_chunk, tasks, self.n_jobs)
+
+        new_blocks = []
+        for block in data.blocks:
+            chunks = [r for (b, _), r in izip(tasks, results)
+                      if b is block and r is not None]
+            if len(chunks) == 0:
+                continue
+            if len(chunks) == 1:
+                result = chunks[0]
+            else:
+                result = np.concatenate(chunks, axis=0)
             newb = make_block(result, block.items, block.ref_items)
             new_blocks.append(newb)
 
@@ -1500,9 +2249,30 @@ class NDFrameGroupBy(GroupBy):
 
         obj = self._obj_with_exclusions
 
+        names, pairs = _normalize_multiple_funcs(arg)
+        summary = self._aggregate_summary_blocks([func for _, func in pairs])
+        if summary and len(summary) == len(obj.columns):
+            # every column done in one pass, fill the output directly
+            result = {}
+            for col in obj.columns:
+                for name, values in zip(names, summary[col]):
+                    result[(col, name)] = values
+            columns = MultiIndex.from_tuples([(col, name)
+                                              for col in obj.columns
+                                              for name in names])
+            return DataFrame(result, index=self.grouper.result_index,
+                             columns=columns)
+
         results = []
         keys = []
         for col in obj:
+            if col in summary:
+                results.append(DataFrame(dict(zip(names, summary[col])),
+                                         index=self.grouper.result_index,
+                                         columns=names))
+                keys.append(col)
+                continue
+
             try:
                 colg = SeriesGroupBy(obj[col], selection=col,
                                      grouper=self.grouper)
@@ -1515,6 +2285,31 @@ class NDFrameGroupBy(GroupBy):
 
         return result
 
+    def _aggregate_summary_blocks(self, funcs):
+        """
+        Results of the built-in statistics funcs for the columns of the
+        float64 blocks, each block aggregated in one pass. Returns
+        {column -> list of results}, empty if any func is not built in
+        """
+        hows = _get_summary_hows(funcs)
+        if hows is None or not self._obj_with_exclusions.columns.is_unique:
+            return {}
+
+        data, agg_axis = self._get_data_to_aggregate()
+
+        summary = {}
+        for block in data.blocks:
+            try:
+                results = self.grouper.aggregate_multiple(block.values, hows,
+                                                          axis=agg_axis)
+            except NotImplementedError:
+                continue
+
+            for i, item in enumerate(block.items):
+                summary[item] = [result[i] for result in results]
+
+        return summary
+
     def _aggregate_generic(self, func, *args, **kwargs):
         assert(self.grouper.nkeys == 1)
 
@@ -1593,21 +2388,13 @@ class NDFrameGroupBy(GroupBy):
             return self._concat_objects(keys, values,
                                         not_indexed_same=not_indexed_same)
         else:
-            if len(self.grouper.groupings) > 1:
+            if len(keys) == self.grouper.ngroups:
+                # groups were iterated in result order
+                key_index = self.grouper.result_index
+            elif len(self.grouper.groupings) > 1:
                 key_index = MultiIndex.from_tuples(keys, names=key_names)
             else:
-                ping = self.grouper.groupings[0]
-                if len(keys) == ping.ngroups:
-                    key_index = ping.group_index
-                    key_index.name = key_names[0]
-
-                    key_lookup = Index(keys)
-                    indexer = key_lookup.get_indexer(key_index)
-
-                    # reorder the values
-                    values = [values[i] for i in indexer]
-                else:
-                    key_index = Index(keys, name=key_names[0])
+                key_index = Index(keys, name=key_names[0])
 
             if isinstance(values[0], np.ndarray):
                 if (isinstance(values[0], Series) and
@@ -1722,7 +2509,8 @@ class DataFrameGroupBy(NDFrameGroupBy):
             return DataFrameGroupBy(self.obj, self.grouper, selection=key,
                                     grouper=self.grouper,
                                     exclusions=self.exclusions,
-                                    as_index=self.as_index)
+                                    as_index=self.as_index,
+                                    n_jobs=self.n_jobs)
         else:
             if key not in self.obj:  # pragma: no cover
                 raise KeyError(str(key))
@@ -1753,6 +2541,14 @@ class DataFrameGroupBy(NDFrameGroupBy):
         else:
             return obj._data, 1
 
+    def _wrap_transformed_output(self, output):
+        if self.axis != 0:
+            raise NotImplementedError
+
+        columns = [c for c in self._obj_with_exclusions.columns
+                   if c in output]
+        return DataFrame(output, index=self.obj.index, columns=columns)
+
     def _wrap_aggregated_output(self, output, names=None):
         agg_axis = 0 if self.axis == 1 else 1
         agg_labels = self._obj_with_exclusions._get_axis(agg_axis)
@@ -1879,7 +2675,8 @@ class PanelGroupBy(NDFrameGroupBy):
                 try:
                     itemg = DataFrameGroupBy(obj[item],
                                              axis=self.axis - 1,
-                                             grouper=self.grouper)
+                                             grouper=self.grouper,
+                                             n_jobs=self.n_jobs)
                     result[item] = itemg.aggregate(func, *args, **kwargs)
                 except (ValueError, TypeError):
                     raise
@@ -1897,14 +2694,276 @@ class NDArrayGroupBy(GroupBy):
     pass
 
 
+#----------------------------------------------------------------------
+# Mergeable partial aggregation
+
+class PartialAggregate(object):
+    """
+    Per-group state of an aggregation over part of the data, e.g. one chunk
+    of a file read with chunksize. States of different chunks, possibly
+    computed in different processes, are merged with combine; result gives
+    the aggregate of all the data merged so far
+
+    Parameters
+    ----------
+    how : string
+    index : Index
+        Group keys
+    columns : Index or None
+        None if a Series was grouped
+    name : object
+        Name of the grouped Series
+    state : dict
+        Arrays with one row per group, or for how='quantile' the per-column
+        (means, weights, labels) centroids of each group
+    options : dict
+    """
+    _hows = ('sum', 'count', 'mean', 'var', 'std', 'min', 'max', 'nunique',
+             'quantile')
+    _numeric_hows = ('sum', 'mean', 'var', 'std', 'min', 'max', 'quantile')
+
+    def __init__(self, how, index, columns, name, state, options):
+        self.how = how
+        self.index = index
+        self.columns = columns
+        self.name = name
+        self.state = state
+        self.options = options
+
+    def __repr__(self):
+        return 'PartialAggregate(%s, %d groups)' % (self.how, len(self.index))
+
+    @classmethod
+    def from_groupby(cls, grouped, how, q=0.5, compression=100,
+                     precision=10):
+        if how not in cls._hows:
+            raise ValueError('cannot partially aggregate %s' % how)
+        if not 4 <= precision <= 16:
+            raise ValueError('precision must be between 4 and 16')
+
+        grouper = grouped.grouper
+        if isinstance(grouper, BinGrouper):
+            raise NotImplementedError('partial aggregation needs group keys')
+        if grouped.axis != 0:
+            raise NotImplementedError('partial aggregation only on axis=0')
+
+        if isinstance(grouped, SeriesGroupBy):
+            obj = grouped.obj
+            columns, name = None, obj.name
+            column_values = [obj.values]
+        else:
+            obj = grouped._obj_with_exclusions
+            if how in cls._numeric_hows:
+                obj = obj._get_numeric_data()
+            columns, name = obj.columns, None
+            column_values = [obj.icol(i).values for i in range(len(columns))]
+
+        if how == 'nunique':
+            # each column hashed by its own dtype, so that it hashes alike
+            # in chunks where another column has a different dtype
+            shape = (len(obj), len(column_values))
+            hashes = np.empty(shape, dtype=np.uint64)
+            mask = np.empty(shape, dtype=bool)
+            for j, col_values in enumerate(column_values):
+                hashes[:, j], mask[:, j] = _hash_values(col_values)
+        elif isinstance(grouped, SeriesGroupBy):
+            values = column_values[0][:, None]
+        else:
+            values = obj.values
+
+        if how in cls._numeric_hows:
+            values = com._ensure_float64(values)
+
+        comp_ids, _, ngroups = grouper.group_info
+        state = {}
+        if how != 'nunique':
+            state['nobs'] = grouper.aggregate(values, 'count')[0]
+
+        if how in ('sum', 'mean'):
+            sums = grouper.aggregate(values, 'add')[0]
+            sums[state['nobs'] == 0] = 0
+            state['sum'] = sums
+        elif how in ('min', 'max'):
+            state[how] = grouper.aggregate(values, how)[0]
+        elif how in ('var', 'std'):
+            shape = (ngroups, values.shape[1])
+            nobs = np.zeros(shape)
+            mean = np.zeros(shape)
+            m2 = np.zeros(shape)
+            lib.group_moments(nobs, mean, m2, values, comp_ids)
+            state['mean'] = mean
+            state['m2'] = m2
+        elif how == 'nunique':
+            registers = np.zeros((ngroups, hashes.shape[1], 2 ** precision),
+                                 dtype=np.uint8)
+            lib.group_hll_update(registers, hashes, mask, comp_ids,
+                                 precision)
+            state['registers'] = registers
+        elif how == 'quantile':
+            digests = []
+            for j in range(values.shape[1]):
+                col = values[:, j]
+                keep = (comp_ids >= 0) & ~np.isnan(col)
+                means, labels = col[keep], comp_ids[keep]
+                digests.append(_compress_digest(means, np.ones(len(means)),
+                                                labels, ngroups,
+                                                compression))
+            state['digests'] = digests
+
+        options = dict(q=q, compression=compression, precision=precision)
+        return cls(how, grouper.result_index, columns, name, state, options)
+
+    def combine(self, other):
+        """
+        Merge with the state of another part of the data, grouped by the same
+        kind of keys and aggregated the same way
+
+        Returns
+        -------
+        combined : PartialAggregate
+        """
+        if (self.how != other.how or self.options != other.options or
+            (self.columns is None) != (other.columns is None) or
+            (self.columns is not None and
+             not self.columns.equals(other.columns))):
+            raise ValueError('can only combine states of the same '
+                             'aggregation of the same columns')
+
+        index = self.index.union(other.index)
+        left = index.get_indexer(self.index)
+        right = index.get_indexer(other.index)
+        ngroups = len(index)
+
+        def _expand(arr, indexer, fill_value=0):
+            result = np.empty((ngroups,) + arr.shape[1:], dtype=arr.dtype)
+            result.fill(fill_value)
+            result[indexer] = arr
+            return result
+
+        ls, rs = self.state, other.state
+        state = {}
+        if 'nobs' in ls:
+            ln, rn = _expand(ls['nobs'], left), _expand(rs['nobs'], right)
+            state['nobs'] = ln + rn
+
+        how = self.how
+        if how in ('sum', 'mean'):
+            state['sum'] = _expand(ls['sum'], left) + _expand(rs['sum'], right)
+        elif how == 'min':
+            state['min'] = np.fmin(_expand(ls['min'], left, np.nan),
+                                   _expand(rs['min'], right, np.nan))
+        elif how == 'max':
+            state['max'] = np.fmax(_expand(ls['max'], left, np.nan),
+                                   _expand(rs['max'], right, np.nan))
+        elif how in ('var', 'std'):
+            # pairwise update of Chan et al.
+            lmean, rmean = _expand(ls['mean'], left), _expand(rs['mean'], right)
+            nobs = np.where(state['nobs'] > 0, state['nobs'], 1)
+            delta = rmean - lmean
+            state['mean'] = lmean + delta * rn / nobs
+            state['m2'] = (_expand(ls['m2'], left) + _expand(rs['m2'], right)
+                           + delta ** 2 * ln * rn / nobs)
+        elif how == 'nunique':
+            state['registers'] = np.maximum(_expand(ls['registers'], left),
+                                            _expand(rs['registers'], right))
+        elif how == 'quantile':
+            digests = []
+            for (lm, lw, ll), (rm, rw, rl) in zip(ls['digests'],
+                                                  rs['digests']):
+                labels = np.concatenate((left.take(ll), right.take(rl)))
+                digests.append(_compress_digest(np.concatenate((lm, rm)),
+                                                np.concatenate((lw, rw)),
+                                                labels, ngroups,
+                                                self.options['compression']))
+            state['digests'] = digests
+
+        return PartialAggregate(how, index, self.columns, self.name, state,
+                                self.options)
+
+    def result(self):
+        """
+        Aggregate of the data merged so far. nunique (HyperLogLog) and
+        quantile (t-digest) are approximate
+
+        Returns
+        -------
+        aggregated : Series or DataFrame
+        """
+        how, state = self.how, self.state
+        if 'nobs' in state:
+            nobs = state['nobs']
+
+        if how == 'count':
+            result = nobs
+        elif how == 'sum':
+            result = np.where(nobs > 0, state['sum'], np.nan)
+        elif how == 'mean':
+            result = state['sum'] / np.where(nobs > 0, nobs, np.nan)
+        elif how in ('var', 'std'):
+            result = state['m2'] / np.where(nobs > 1, nobs - 1, np.nan)
+            if how == 'std':
+                result = np.sqrt(result)
+        elif how in ('min', 'max'):
+            result = state[how]
+        elif how == 'nunique':
+            result = np.round(_hll_estimate(state['registers']))
+            result = result.astype(np.int64)
+        elif how == 'quantile':
+            result = np.empty((len(self.index), len(state['digests'])))
+            for j, (means, weights, labels) in enumerate(state['digests']):
+                lib.group_digest_quantile(result[:, j], means, weights,
+                                          labels, self.options['q'])
+
+        if self.columns is None:
+            return Series(result[:, 0], index=self.index, name=self.name)
+        return DataFrame(result, index=self.index, columns=self.columns)
+
+def _hash_values(values):
+    """
+    uint64 hash codes of the values of a column, and the mask of missing
+    values. Numbers are hashed as float64, also in object columns, so a
+    column that is int in one chunk and float or object in another still
+    hashes alike
+    """
+    mask = com.isnull(values)
+    if values.dtype == np.object_:
+        hashes = lib.hash_object_array(values.ravel()).reshape(values.shape)
+    else:
+        if issubclass(values.dtype.type, np.datetime64):
+            values = values.view(np.int64)
+        hashes = values.astype(np.float64)
+        hashes[mask | (hashes == 0)] = 0  # -0.0 is 0.0
+        hashes = hashes.view(np.uint64)
+    return hashes, mask
+
+def _hll_estimate(registers):
+    # HyperLogLog estimate, with linear counting for small cardinalities
+    m = registers.shape[-1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+    est = alpha * m * m / np.power(2.0, -registers.astype(float)).sum(-1)
+
+    zeros = (registers == 0).sum(-1)
+    small = (est <= 2.5 * m) & (zeros > 0)
+    est[small] = m * np.log(m / zeros[small].astype(float))
+    return est
+
+def _compress_digest(means, weights, labels, ngroups, compression):
+    sorter = np.lexsort((means, labels))
+    return lib.group_digest_compress(means.take(sorter), weights.take(sorter),
+                                     com._ensure_int64(labels.take(sorter)),
+                                     ngroups, compression)
+
 #----------------------------------------------------------------------
 # Grouping generator for BlockManager
 
-def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x):
+def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x,
+                    sorter=None):
     """
     Parameters
     ----------
     data : BlockManager
+    sorter : ndarray, optional
+        Indexer sorting group_index stably, computed if not passed
 
     Returns
     -------
@@ -1912,7 +2971,9 @@ def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x):
     """
     group_index = com._ensure_int64(group_index)
 
-    indexer = lib.groupsort_indexer(group_index, ngroups)[0]
+    indexer = sorter
+    if indexer is None:
+        indexer = lib.groupsort_indexer(group_index, ngroups)[0]
     group_index = com.ndtake(group_index, indexer)
 
     if isinstance(data, BlockManager):
@@ -1920,23 +2981,26 @@ def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x):
         sorted_axis = data.axes[axis].take(indexer)
         sorted_data = data.reindex_axis(sorted_axis, axis=axis)
     if isinstance(data, Series):
-        sorted_axis = data.index.take(indexer)
-        sorted_data = data.reindex(sorted_axis)
+        sorted_data = data.take(indexer)
     elif isinstance(data, DataFrame):
         sorted_data = data.take(indexer, axis=axis)
 
     if isinstance(sorted_data, DataFrame):
         def _get_slice(slob):
-            if axis == 0:
-                return sorted_data[slob]
-            else:
-                return sorted_data.ix[:, slob]
+            return sorted_data._slice(slob, axis=axis)
     elif isinstance(sorted_data, BlockManager):
         def _get_slice(slob):
             return factory(sorted_data.get_slice(slob, axis=axis))
     elif isinstance(sorted_data, Series):
+        sorted_values = sorted_data.values
+        sorted_index = sorted_data.index
+        name = sorted_data.name
+
+        # views into the sorted data, skipping Series.__getitem__
         def _get_slice(slob):
-            return sorted_data._get_values(slob)
+            return Series(sorted_values[slob],
+                          index=sorted_index[slob.start:slob.stop],
+                          name=name)
     else:  # pragma: no cover
         def _get_slice(slob):
             return sorted_data[slob]
@@ -2123,6 +3187,43 @@ _cython_table = {
     np.var: 'var'
 }
 
+def _normalize_multiple_funcs(arg):
+    """
+    Result column names and (name, function) pairs of the list or dict of
+    functions passed to aggregate
+    """
+    if isinstance(arg, dict):
+        columns = arg.keys()
+        arg = arg.items()
+    elif any(isinstance(x, (tuple, list)) for x in arg):
+        arg = [(x, x) if not isinstance(x, (tuple, list)) else x
+               for x in arg]
+
+        # indicated column order
+        columns = list(zip(*arg))[0]
+    else:
+        # list of functions / function names
+        columns = []
+        for f in arg:
+            if isinstance(f, basestring):
+                columns.append(f)
+            else:
+                columns.append(f.__name__)
+        arg = zip(columns, arg)
+
+    return columns, arg
+
+def _get_summary_hows(funcs):
+    # None unless Grouper.aggregate_multiple can compute all of funcs
+    hows = []
+    for func in funcs:
+        if not isinstance(func, basestring):
+            func = _intercept_cython(func)
+        if func not in Grouper._summary_functions:
+            return None
+        hows.append(func)
+    return hows
+
 def _intercept_function(func):
     return _func_table.get(func, func)
 
@@ -36,6 +36,47 @@ def _indexOp(opname):
 class InvalidIndexError(Exception):
     pass
 
+
+class _Identity(object):
+    pass
+
+
+class Reindexer(object):
+    """
+    Indexer conforming objects labeled by a source index to a target index,
+    computed once and reused. See Index.reindexer
+
+    Attributes
+    ----------
+    new_index : Index
+    indexer : ndarray or None
+        None if the source and target are equal
+    """
+    def __init__(self, source, target, method=None, limit=None):
+        self.method = method
+        self.limit = limit
+        self.new_index, self.indexer = source.reindex(target, method=method,
+                                                      limit=limit)
+        # weak, so the cache entry keyed on the source can be evicted
+        self._source_id = weakref.ref(source._get_id())
+
+    def applies_to(self, index):
+        """
+        True if index is the source index, a copy of it or known equal to it
+        """
+        return getattr(index, '_id', None) is self._source_id()
+
+    def __call__(self, obj, **kwds):
+        """
+        Conform a Series or DataFrame (along its index) labeled by the source
+        index. Keywords are passed on to obj.reindex (fill_value, copy, ...)
+        """
+        if not self.applies_to(obj.index):
+            raise ValueError('Object is not indexed by the source index of '
+                             'this Reindexer')
+        return obj.reindex(self.new_index, method=self.method,
+                           limit=self.limit, **kwds)
+
 _o_dtype = np.dtype(object)
 
 class Index(np.ndarray):
@@ -64,14 +105,29 @@ class Index(np.ndarray):
     _left_indexer = _algos.left_join_indexer_object
     _inner_indexer = _algos.inner_join_indexer_object
     _outer_indexer = _algos.outer_join_indexer_object
+    _union_sorted = _algos.union_sorted_object
+    _intersection_sorted = _algos.intersection_sorted_object
+    _diff_sorted = _algos.diff_sorted_object
 
     _box_scalars = False
 
     name = None
     asi8 = None
 
+    # lineage token shared by views and copies of the same labels and by
+    # indexes found to be equal, see is_
+    _id = None
+
     _engine_type = lib.ObjectEngine
 
+    # Reindexers onto this index, see reindexer
+    _reindexers = None
+
+    # monotonicity / uniqueness known from how the index was produced, handed
+    # to the engine in place of a scan over the labels. None if unknown
+    _known_monotonic = None
+    _known_unique = None
+
     def __new__(cls, data, dtype=None, copy=False, name=None):
         if isinstance(data, np.ndarray):
             if issubclass(data.dtype.type, np.datetime64):
@@ -117,7 +173,26 @@ class Index(np.ndarray):
         self.name = getattr(obj, 'name', None)
 
     def _shallow_copy(self):
-        return self.view(type(self))
+        result = self.view(type(self))
+        result._id = self._get_id()
+        return result
+
+    def _get_id(self):
+        if self._id is None:
+            self._id = _Identity()
+        return self._id
+
+    def is_(self, other):
+        """
+        More flexible, faster check like ``is`` that also holds for shallow
+        copies of this Index and for indexes already found to be equal to it.
+        A True result implies self.equals(other)
+        """
+        return self._get_id() is getattr(other, '_id', Ellipsis)
+
+    def _note_equal(self, other):
+        # labels are immutable, so later comparisons can short-circuit
+        other._id = self._get_id()
 
     def __repr__(self):
         try:
@@ -206,12 +281,96 @@ class Index(np.ndarray):
 
     @property
     def is_monotonic(self):
+        monotonic = self._flag_hints()[0]
+        if monotonic is not None:
+            return monotonic
         return self._engine.is_monotonic
 
     @cache_readonly
     def is_unique(self):
+        unique = self._flag_hints()[1]
+        if unique is not None:
+            return unique
         return self._engine.is_unique
 
+    def _flag_hints(self):
+        return self._known_monotonic, self._known_unique
+
+    def _set_flag_hints(self, monotonic=None, unique=None):
+        """
+        Record that the labels are known to be sorted and / or unique, e.g.
+        for the result of a merge, so they are not checked again. Only call
+        on newly created indexes. Returns self
+        """
+        if monotonic is not None:
+            self._known_monotonic = monotonic
+        if unique is not None:
+            self._known_unique = unique
+
+        engine = self._get_cached_engine()
+        if engine is not None:
+            engine.set_known_flags(monotonic, unique)
+        return self
+
+    def _get_known_flags(self):
+        """
+        (monotonic, unique) as far as known without scanning the labels, None
+        where unknown
+        """
+        monotonic, unique = self._flag_hints()
+        engine = self._get_cached_engine()
+        if engine is not None:
+            checked_monotonic, checked_unique = engine.known_flags()
+            if monotonic is None:
+                monotonic = checked_monotonic
+            if unique is None:
+                unique = checked_unique
+        return monotonic, unique
+
+    def _get_cached_engine(self):
+        cache = getattr(self, '_cache', None)
+        if cache is None:
+            return None
+        return cache.get('_engine')
+
+    def _selection_flags(self, key):
+        """
+        Flags known to hold for self[key] or self.take(key): sortedness
+        survives if the positions are increasing, uniqueness if none repeats
+        """
+        monotonic, unique = self._get_known_flags()
+        if not (monotonic or unique):
+            return None, None
+
+        if isinstance(key, slice):
+            ordered = key.step is None or key.step > 0
+            distinct = True
+        else:
+            key = np.asarray(key)
+            if key.dtype == np.bool_:
+                ordered = distinct = True
+            elif issubclass(key.dtype.type, np.integer):
+                key = com._ensure_int64(key)
+                ordered, distinct = _algos.is_monotonic_int64(key)
+                if ordered and len(key) > 0 and key[0] < 0 <= key[-1]:
+                    # negative positions wrap around to the end
+                    ordered = False
+                distinct = bool(ordered and distinct)
+            else:
+                return None, None
+
+        return (True if monotonic and ordered else None,
+                True if unique and distinct else None)
+
+    def _sorted_flags(self, ascending=True):
+        """
+        Flags known to hold for the labels once sorted
+        """
+        # argsort may leave object arrays holding NaN out of order
+        sortable = self.dtype != np.object_ or self.inferred_type == 'string'
+        monotonic = True if ascending and sortable else None
+        return monotonic, self._get_known_flags()[1]
+
     def is_numeric(self):
         return self.inferred_type in ['integer', 'floating']
 
@@ -230,7 +389,35 @@ class Index(np.ndarray):
     @cache_readonly
     def _engine(self):
         # property, for now, slow to look up
-        return self._engine_type(lambda: self.values, len(self))
+        engine_type = self._engine_type
+        if engine_type is lib.ObjectEngine and self.inferred_type == 'string':
+            engine_type = lib.StringEngine
+        engine = engine_type(lambda: self.values, len(self))
+
+        monotonic, unique = self._flag_hints()
+        if monotonic is not None or unique is not None:
+            engine.set_known_flags(monotonic, unique)
+        return engine
+
+    def set_lookup_strategy(self, strategy):
+        """
+        Choose how labels are located by get_loc / get_indexer
+
+        Parameters
+        ----------
+        strategy : {'auto', 'hash', 'binary', 'interpolation'}
+            auto : hash table, binary search for large monotonic indexes
+            hash : always build a hash table
+            binary : binary search when the index is monotonic, no hash table
+            interpolation : as binary, with interpolation search for evenly
+                spaced int64 / datetime labels
+
+        Notes
+        -----
+        Hash tables count against lib.set_engine_memory_limit and may be
+        dropped and rebuilt when the limit is exceeded
+        """
+        self._engine.strategy = strategy
 
     def _get_level_number(self, level):
         if not isinstance(level, int):
@@ -302,7 +489,12 @@ class Index(np.ndarray):
             if result.ndim > 1:
                 return result
 
-            return Index(result, name=self.name)
+            result = Index(result, name=self.name)
+            return result._set_flag_hints(*self._selection_flags(key))
+
+    def __getslice__(self, i, j):
+        result = np.ndarray.__getslice__(self, i, j)
+        return result._set_flag_hints(*self._selection_flags(slice(i, j)))
 
     def append(self, other):
         """
@@ -341,7 +533,8 @@ class Index(np.ndarray):
         """
         indexer = com._ensure_platform_int(indexer)
         taken = self.view(np.ndarray).take(indexer)
-        return self._constructor(taken, name=self.name)
+        result = self._constructor(taken, name=self.name)
+        return result._set_flag_hints(*self._selection_flags(indexer))
 
     def format(self, name=False):
         """
@@ -377,7 +570,7 @@ class Index(np.ndarray):
         """
         Determines if two Index objects contain the same elements.
         """
-        if self is other:
+        if self.is_(other):
             return True
 
         if not isinstance(other, Index):
@@ -386,7 +579,10 @@ class Index(np.ndarray):
         if type(other) != Index:
             return other.equals(self)
 
-        return np.array_equal(self, other)
+        if np.array_equal(self, other):
+            self._note_equal(other)
+            return True
+        return False
 
     def asof(self, label):
         """
@@ -427,6 +623,7 @@ class Index(np.ndarray):
             _as = _as[::-1]
 
         sorted_index = self.take(_as)
+        sorted_index._set_flag_hints(*self._sorted_flags(ascending))
 
         if return_indexer:
             return sorted_index, _as
@@ -508,9 +705,16 @@ class Index(np.ndarray):
             other = other.astype('O')
             return this.union(other)
 
+        flags = None, None
         if self.is_monotonic and other.is_monotonic:
             try:
-                result = self._outer_indexer(self, other.values)[0]
+                if self.is_unique and other.is_unique:
+                    # merge pass, no indexers needed
+                    result = self._union_sorted(self.values, other.values)
+                    flags = True, True
+                else:
+                    result = self._outer_indexer(self, other.values)[0]
+                    flags = True, None
             except TypeError:
                 # incomparable objects
                 result = list(self.values)
@@ -537,7 +741,8 @@ class Index(np.ndarray):
                     result = self.values
 
         # for subclasses
-        return self._wrap_union_result(other, result)
+        result = self._wrap_union_result(other, result)
+        return result._set_flag_hints(*flags)
 
     def _wrap_union_result(self, other, result):
         name = self.name if self.name == other.name else None
@@ -573,8 +778,15 @@ class Index(np.ndarray):
 
         if self.is_monotonic and other.is_monotonic:
             try:
-                result = self._inner_indexer(self, other.values)[0]
-                return self._wrap_union_result(other, result)
+                if self.is_unique and other.is_unique:
+                    result = self._intersection_sorted(self.values,
+                                                       other.values)
+                    flags = True, True
+                else:
+                    result = self._inner_indexer(self, other.values)[0]
+                    flags = True, None
+                result = self._wrap_union_result(other, result)
+                return result._set_flag_hints(*flags)
             except TypeError:
                 pass
 
@@ -606,6 +818,13 @@ class Index(np.ndarray):
 
         if not isinstance(other, Index):
             other = np.asarray(other)
+        elif (self._diff_sorted is not None and self.dtype == other.dtype
+              and self.is_monotonic and other.is_monotonic):
+            try:
+                result = Index(self._diff_sorted(self.values, other.values))
+                return result._set_flag_hints(monotonic=True, unique=True)
+            except TypeError:
+                pass
 
         theDiff = sorted(set(self) - set(other))
         return Index(theDiff)
@@ -668,7 +887,7 @@ class Index(np.ndarray):
         """
         self._engine.set_value(arr, key, value)
 
-    def get_indexer(self, target, method=None, limit=None):
+    def get_indexer(self, target, method=None, limit=None, tolerance=None):
         """
         Compute indexer and mask for new index given the current index. The
         indexer should be then used as an input to ndarray.take to align the
@@ -678,9 +897,16 @@ class Index(np.ndarray):
         Parameters
         ----------
         target : Index
-        method : {'pad', 'ffill', 'backfill', 'bfill'}
+        method : {'pad', 'ffill', 'backfill', 'bfill', 'nearest'}
             pad / ffill: propagate LAST valid observation forward to next valid
             backfill / bfill: use NEXT valid observation to fill gap
+            nearest: use the NEAREST label, ties going to the later one
+        limit : int, default None
+            Maximum size gap to forward or backward fill
+        tolerance : scalar, default None
+            Maximum distance between a target label and the label it is
+            matched to with a fill method. For a DatetimeIndex, a timedelta,
+            Tick or frequency string such as '5s'
 
         Notes
         -----
@@ -701,30 +927,60 @@ class Index(np.ndarray):
 
         pself, ptarget = self._possibly_promote(target)
         if pself is not self or ptarget is not target:
-            return pself.get_indexer(ptarget, method=method, limit=limit)
+            return pself.get_indexer(ptarget, method=method, limit=limit,
+                                     tolerance=tolerance)
 
         if self.dtype != target.dtype:
             this = self.astype(object)
             target = target.astype(object)
-            return this.get_indexer(target, method=method, limit=limit)
+            return this.get_indexer(target, method=method, limit=limit,
+                                    tolerance=tolerance)
 
         if not self.is_unique:
             raise Exception('Reindexing only valid with uniquely valued Index '
                             'objects')
 
+        if tolerance is not None:
+            if method is None:
+                raise ValueError('tolerance requires a fill method')
+            tolerance = self._convert_tolerance(tolerance)
+
         if method == 'pad':
             assert(self.is_monotonic)
             indexer = self._engine.get_pad_indexer(target.values, limit)
         elif method == 'backfill':
             assert(self.is_monotonic)
             indexer = self._engine.get_backfill_indexer(target.values, limit)
+        elif method == 'nearest':
+            if limit is not None:
+                raise ValueError('limit not supported for method nearest')
+            assert(self.is_monotonic)
+            return com._ensure_platform_int(
+                self._engine.get_nearest_indexer(target.values, tolerance))
         elif method is None:
             indexer = self._engine.get_indexer(target.values)
         else:
             raise ValueError('unrecognized method: %s' % method)
 
+        if tolerance is not None:
+            indexer = com._ensure_int64(indexer)
+            self._engine.mask_tolerance(target.values, indexer, tolerance)
+
         return com._ensure_platform_int(indexer)
 
+    def _convert_tolerance(self, tolerance):
+        # in units of the labels' differences
+        return tolerance
+
+    def _mask_tolerance(self, target, indexer, tolerance):
+        """
+        Set indexer (int64) to -1, in place, where a label of target is
+        further than tolerance from the label it was matched to
+        """
+        target = _ensure_index(target)
+        self._engine.mask_tolerance(target.values, indexer,
+                                    self._convert_tolerance(tolerance))
+
     def _possibly_promote(self, other):
         # A hack, but it works
         from pandas.tseries.index import DatetimeIndex
@@ -767,7 +1023,47 @@ class Index(np.ndarray):
         }
         return aliases.get(method, method)
 
-    def reindex(self, target, method=None, level=None, limit=None):
+    def reindexer(self, source, method=None, limit=None):
+        """
+        Precompute the indexer conforming objects labeled by source to this
+        index. It is cached on this index, keyed on the identity of source
+        (see is_) and the fill options, and dropped once source and its copies
+        are garbage collected. Reindexing from source onto this index, e.g.
+        with Series.reindex or DataFrame.reindex, reuses it
+
+        Parameters
+        ----------
+        source : Index
+        method : {'backfill', 'bfill', 'pad', 'ffill', None}
+        limit : int, default None
+
+        Returns
+        -------
+        reindexer : Reindexer
+            Callable on Series / DataFrame labeled by source
+        """
+        source = _ensure_index(source)
+        method = self._get_method(method)
+
+        result = self._get_reindexer(source, method, limit)
+        if result is None:
+            if self._reindexers is None:
+                self._reindexers = weakref.WeakKeyDictionary()
+            result = Reindexer(source, self, method=method, limit=limit)
+            by_options = self._reindexers.setdefault(source._get_id(), {})
+            by_options[method, limit] = result
+        return result
+
+    def _get_reindexer(self, source, method, limit):
+        if self._reindexers is None or source._id is None:
+            return None
+        by_options = self._reindexers.get(source._id)
+        if by_options is None:
+            return None
+        return by_options.get((method, limit))
+
+    def reindex(self, target, method=None, level=None, limit=None,
+                tolerance=None):
         """
         For Index, simply returns the new index and the results of
         get_indexer. Provided here to enable an interface that is amenable for
@@ -778,6 +1074,12 @@ class Index(np.ndarray):
         (new_index, indexer, mask) : tuple
         """
         target = _ensure_index(target)
+        if level is None and tolerance is None:
+            reindexer = target._get_reindexer(self, self._get_method(method),
+                                              limit)
+            if reindexer is not None:
+                return reindexer.new_index, reindexer.indexer
+
         if level is not None:
             if method is not None:
                 raise ValueError('Fill method not supported if level passed')
@@ -788,7 +1090,7 @@ class Index(np.ndarray):
                 indexer = None
             else:
                 indexer = self.get_indexer(target, method=method,
-                                           limit=limit)
+                                           limit=limit, tolerance=tolerance)
         return target, indexer
 
     def join(self, other, how='left', level=None, return_indexers=False):
@@ -847,6 +1149,13 @@ class Index(np.ndarray):
 
         _validate_join_method(how)
 
+        if self.is_(other) and self.is_unique:
+            ret_index = other if how == 'right' else self
+            if return_indexers:
+                return ret_index, None, None
+            else:
+                return ret_index
+
         if not self.is_unique and not other.is_unique:
             return self._join_non_unique(other, how=how,
                                          return_indexers=return_indexers)
@@ -1116,6 +1425,7 @@ class Index(np.ndarray):
         cp : Index
             Returns view on same base ndarray
         """
+        self._get_id()
         cp = self.view(np.ndarray).view(type(self))
         cp.__dict__.update(self.__dict__)
         return cp
@@ -1129,6 +1439,9 @@ class Int64Index(Index):
     _left_indexer = _algos.left_join_indexer_int64
     _inner_indexer = _algos.inner_join_indexer_int64
     _outer_indexer = _algos.outer_join_indexer_int64
+    _union_sorted = _algos.union_sorted_int64
+    _intersection_sorted = _algos.intersection_sorted_int64
+    _diff_sorted = _algos.diff_sorted_int64
 
     _engine_type = lib.Int64Engine
 
@@ -1182,19 +1495,234 @@ class Int64Index(Index):
         """
         Determines if two Index objects contain the same elements.
         """
-        if self is other:
+        if self.is_(other):
             return True
 
         # if not isinstance(other, Int64Index):
         #     return False
 
-        return np.array_equal(self, other)
+        if np.array_equal(self, other):
+            if isinstance(other, Int64Index):
+                self._note_equal(other)
+            return True
+        return False
 
     def _wrap_joined_index(self, joined, other):
         name = self.name if self.name == other.name else None
         return Int64Index(joined, name=name)
 
 
+class RangeIndex(Int64Index):
+    """
+    Int64Index holding the evenly spaced integers start, start + step, ...
+    up to but not including stop; the default index of pandas objects.
+    Lookups, slicing, equality, set operations and joins between
+    RangeIndexes are computed from (start, stop, step), and no hash table
+    is ever built for it
+
+    Parameters
+    ----------
+    start : int, default 0
+    stop : int, default None
+        If None, the range is [0, start)
+    step : int, default 1
+    name : object, optional
+    """
+    # (start, stop, step) with stop = start + len(self) * step, or None for
+    # arrays produced by ndarray machinery that are not known to be ranges
+    _range = None
+
+    def __new__(cls, start=0, stop=None, step=1, name=None):
+        if stop is None:
+            start, stop = 0, start
+        if step == 0:
+            raise ValueError('RangeIndex step must not be zero')
+
+        subarr = np.arange(start, stop, step, dtype=np.int64).view(cls)
+        subarr.name = name
+        subarr._range = (start, start + len(subarr) * step, step)
+        return subarr
+
+    def __array_finalize__(self, obj):
+        Int64Index.__array_finalize__(self, obj)
+
+        # views of the same memory are the same range
+        rng = getattr(obj, '_range', None)
+        if (rng is not None and self.shape == obj.shape and
+            self.strides == obj.strides and
+            self.__array_interface__['data'] ==
+            obj.__array_interface__['data']):
+            self._range = rng
+        else:
+            self._range = None
+
+    def __reduce__(self):
+        if self._range is None:
+            return Int64Index.__reduce__(self)
+        start, stop, step = self._range
+        return RangeIndex, (start, stop, step, self.name)
+
+    @property
+    def start(self):
+        return self._range[0]
+
+    @property
+    def stop(self):
+        return self._range[1]
+
+    @property
+    def step(self):
+        return self._range[2]
+
+    @cache_readonly
+    def _engine(self):
+        engine = self._engine_type(lambda: self.values, len(self))
+        if self._range is not None and self.is_monotonic:
+            engine.set_monotonic_unique()
+            # sorted lookups on evenly spaced keys take O(1)
+            engine.strategy = 'interpolation'
+        return engine
+
+    @property
+    def is_monotonic(self):
+        if self._range is None:
+            return Int64Index.is_monotonic.fget(self)
+        return self._range[2] > 0 or len(self) < 2
+
+    @cache_readonly
+    def is_unique(self):
+        if self._range is None:
+            return self._engine.is_unique
+        return True
+
+    def _locate(self, values):
+        # positions of integer values in the range, -1 where absent
+        start, stop, step = self._range
+        offset = np.asarray(values, dtype=np.int64) - start
+        pos = offset // step
+        mask = (offset % step == 0) & (pos >= 0) & (pos < len(self))
+        return np.where(mask, pos, -1)
+
+    def _locate_scalar(self, key):
+        start, stop, step = self._range
+        pos, rem = divmod(key - start, step)
+        if rem == 0 and 0 <= pos < len(self):
+            return int(pos)
+        return -1
+
+    def __contains__(self, key):
+        if self._range is not None and com.is_integer(key):
+            return self._locate_scalar(key) != -1
+        return Int64Index.__contains__(self, key)
+
+    def get_loc(self, key):
+        if self._range is not None and com.is_integer(key):
+            loc = self._locate_scalar(key)
+            if loc == -1:
+                raise KeyError(key)
+            return loc
+        return Int64Index.get_loc(self, key)
+
+    def get_indexer(self, target, method=None, limit=None, tolerance=None):
+        target = _ensure_index(target)
+        if (method is None and self._range is not None and
+            type(target) in (Int64Index, RangeIndex)):
+            return com._ensure_platform_int(self._locate(target))
+        return Int64Index.get_indexer(self, target, method=method,
+                                      limit=limit, tolerance=tolerance)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) and self._range is not None:
+            start, stop, step = self._range
+            i, j, k = key.indices(len(self))
+            count = len(xrange(i, j, k))
+            new_start = start + i * step
+            new_step = step * k
+
+            result = self.view(np.ndarray)[key].view(RangeIndex)
+            result.name = self.name
+            result._range = (new_start, new_start + count * new_step,
+                             new_step)
+            return result
+        return Int64Index.__getitem__(self, key)
+
+    def __getslice__(self, i, j):
+        return self.__getitem__(slice(i, j))
+
+    def _aligned_with(self, other):
+        # both ascending ranges with the same step and phase
+        if not isinstance(other, RangeIndex):
+            return False
+        if self._range is None or other._range is None:
+            return False
+        step = self._range[2]
+        return (step > 0 and other._range[2] == step and
+                (other._range[0] - self._range[0]) % step == 0)
+
+    def equals(self, other):
+        if (isinstance(other, RangeIndex) and self._range is not None and
+            other._range is not None):
+            if len(self) != len(other):
+                return False
+            if len(self) == 0:
+                result = True
+            elif len(self) == 1:
+                result = self._range[0] == other._range[0]
+            else:
+                result = self._range[0::2] == other._range[0::2]
+            if result:
+                self._note_equal(other)
+            return result
+        return Int64Index.equals(self, other)
+
+    def _result_name(self, other):
+        return self.name if self.name == other.name else None
+
+    def _wrap_union_result(self, other, result):
+        return Int64Index(result, name=self._result_name(other))
+
+    def union(self, other):
+        if (self._aligned_with(other) and len(self) > 0 and
+            len(other) > 0):
+            start, stop, step = self._range
+            ostart, ostop, _ = other._range
+            # overlapping or adjacent
+            if ostart <= stop and start <= ostop:
+                return RangeIndex(min(start, ostart), max(stop, ostop), step,
+                                  name=self._result_name(other))
+        return Int64Index.union(self, other)
+
+    def intersection(self, other):
+        if self._aligned_with(other):
+            start, stop, step = self._range
+            ostart, ostop, _ = other._range
+            new_start = max(start, ostart)
+            new_stop = max(min(stop, ostop), new_start)
+            return RangeIndex(new_start, new_stop, step,
+                              name=self._result_name(other))
+        return Int64Index.intersection(self, other)
+
+    def _join_monotonic(self, other, how='left', return_indexers=False):
+        if self._aligned_with(other):
+            if how == 'left':
+                join_index = self
+            elif how == 'right':
+                join_index = other
+            elif how == 'inner':
+                join_index = self.intersection(other)
+            else:
+                join_index = self.union(other)
+
+            if isinstance(join_index, RangeIndex):
+                if not return_indexers:
+                    return join_index
+                lidx = None if join_index is self else self._locate(join_index)
+                ridx = (None if join_index is other
+                        else other._locate(join_index))
+                return join_index, lidx, ridx
+
+        return Int64Index._join_monotonic(self, other, how=how,
+                                          return_indexers=return_indexers)
 
 
 class MultiIndex(Index):
@@ -1264,6 +1792,7 @@ class MultiIndex(Index):
         cp.labels = list(self.labels)
         cp.names = list(self.names)
         cp.sortorder = self.sortorder
+        cp._id = self._get_id()
         return cp
 
     def _array_values(self):
@@ -1329,23 +1858,38 @@ class MultiIndex(Index):
                                  % (self.nlevels, level))
         return level
 
-    _tuples = None
-
     @property
     def values(self):
+        """
+        Object array of label tuples. Built from the levels and labels on
+        every access and not cached, hold on to the result to reuse it
+        """
         if self._is_v2:
             return self.view(np.ndarray)
-        else:
-            if self._tuples is not None:
-                return self._tuples
+        return self._build_tuples(self.labels)
+
+    def _build_tuples(self, labels):
+        values = [ndtake(lev.values, lab)
+                  for lev, lab in zip(self.levels, labels)]
 
-            values = [ndtake(lev.values, lab)
-                      for lev, lab in zip(self.levels, self.labels)]
+        # Need to box timestamps, etc.
+        values = _clean_arrays(values)
+        return lib.fast_zip(values)
+
+    _iter_chunksize = 10000
+
+    def __iter__(self):
+        if self._is_v2:
+            return iter(self.view(np.ndarray))
+        return self._iter_tuples()
 
-            # Need to box timestamps, etc.
-            values = _clean_arrays(values)
-            self._tuples = lib.fast_zip(values)
-            return self._tuples
+    def _iter_tuples(self):
+        n = len(self)
+        for start in xrange(0, n, self._iter_chunksize):
+            stop = min(start + self._iter_chunksize, n)
+            labels = [lab[start:stop] for lab in self.labels]
+            for tup in self._build_tuples(labels):
+                yield tup
 
     # fml
     @property
@@ -1483,6 +2027,60 @@ class MultiIndex(Index):
 
         return 0
 
+    @cache_readonly
+    def _engine(self):
+        keys, sizes, uniques = _pack_labels(self.levels, self.labels)
+        level_engines = [lev._engine for lev in self.levels]
+        return lib.MultiIndexEngine(lambda: keys, len(self), level_engines,
+                                    sizes, uniques)
+
+    @property
+    def is_monotonic(self):
+        # packed keys sort like the label tuples if all levels are sorted
+        if all(lev.is_monotonic for lev in self.levels):
+            return self._engine.is_monotonic
+
+        keys = self._get_sorted_keys()
+        if keys is None:
+            return Index(self.values).is_monotonic
+        return bool((keys[1:] >= keys[:-1]).all())
+
+    def _get_sorted_keys(self):
+        """
+        int64 keys of the elements that sort like the label tuples, packed
+        from the labels recoded to the sorted order of each level. None if a
+        level cannot be sorted
+        """
+        codes = []
+        for lev, lab in zip(self.levels, self.labels):
+            lab = com._ensure_int64(lab)
+            if not lev.is_monotonic:
+                try:
+                    sorter = lev.values.argsort()
+                except TypeError:
+                    return None
+                ranks = np.empty(len(lev), dtype=np.int64)
+                ranks.put(sorter, np.arange(len(lev)))
+                lab = np.where(lab == -1, -1, ranks.take(lab))
+            codes.append(lab)
+        return _pack_labels(self.levels, codes)[0]
+
+    def _sorted_flags(self, ascending=True):
+        # inferring the type of the tuples would build them all
+        return None, self._get_known_flags()[1]
+
+    def _get_target_codes(self, target):
+        # codes of target's labels in this index's levels, -2 where a label
+        # is not in the level
+        codes = []
+        for lev, tlev, tlab in zip(self.levels, target.levels, target.labels):
+            lev_indexer = lev.get_indexer(tlev)
+            lev_indexer[lev_indexer == -1] = -2
+            code = com.take_1d(lev_indexer, tlab)
+            code[tlab == -1] = -1
+            codes.append(code)
+        return codes
+
     @classmethod
     def from_arrays(cls, arrays, sortorder=None, names=None):
         """
@@ -1626,14 +2224,37 @@ class MultiIndex(Index):
         appended : Index
         """
         if isinstance(other, (list, tuple)):
-            to_concat = (self.values,) + tuple(k.values for k in other)
+            others = list(other)
         else:
-            to_concat = self.values, other.values
+            others = [other]
+
+        # concatenate the labels recoded against the union of the levels
+        result = self
+        for other in others:
+            if (not isinstance(other, MultiIndex) or
+                other.nlevels != self.nlevels):
+                break
+            recoded = result._recode_with(other)
+            if recoded is None:
+                break
+            levels, left_codes, right_codes = recoded
+            labels = [np.concatenate((left, right))
+                      for left, right in zip(left_codes, right_codes)]
+            levels, labels = _compact_levels(levels, labels)
+            result = MultiIndex(levels=levels, labels=labels,
+                                names=self.names)
+        else:
+            return result
+
+        to_concat = (self.values,) + tuple(k.values for k in others)
         new_tuples = np.concatenate(to_concat)
         return MultiIndex.from_tuples(new_tuples, names=self.names)
 
     def argsort(self, *args, **kwargs):
-        return self.values.argsort()
+        keys = self._get_sorted_keys()
+        if keys is None:
+            return self.values.argsort()
+        return keys.argsort()
 
     def drop(self, labels, level=None):
         """
@@ -1837,6 +2458,27 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
+        if method is None:
+            if (not isinstance(target, MultiIndex) and target.dtype == object
+                and len(target) > 0 and isinstance(target[0], tuple)):
+                try:
+                    target = MultiIndex.from_tuples(target)
+                except Exception:
+                    pass
+
+            if (isinstance(target, MultiIndex) and
+                target.nlevels == self.nlevels):
+                engine = self._engine
+                keys = _pack_codes(self._get_target_codes(target),
+                                   engine.sizes, engine.uniques)
+                return com._ensure_platform_int(engine.get_indexer(keys))
+
+        if (method is not None and isinstance(target, MultiIndex) and
+            target.nlevels == self.nlevels):
+            indexer = self._get_fill_indexer_packed(target, method, limit)
+            if indexer is not None:
+                return com._ensure_platform_int(indexer)
+
         target_index = target
         if isinstance(target, MultiIndex):
             target_index = target._tuple_index
@@ -1859,7 +2501,28 @@ class MultiIndex(Index):
 
         return com._ensure_platform_int(indexer)
 
-    def reindex(self, target, method=None, level=None, limit=None):
+    def _get_fill_indexer_packed(self, target, method, limit=None):
+        # pad / backfill on int64 keys packed against the union of the
+        # levels; None if the keys would not sort like the tuples
+        recoded = self._recode_with(target)
+        if recoded is None:
+            return None
+        levels, left_codes, right_codes = recoded
+
+        keys, sizes, uniques = _pack_labels(levels, left_codes)
+        if any(uniq is not None for uniq in uniques):
+            return None
+        target_keys = _pack_codes(right_codes, sizes, uniques)
+
+        assert(self.is_unique and self.is_monotonic)
+        engine = Int64Index(keys)._engine
+        if method == 'pad':
+            return engine.get_pad_indexer(target_keys, limit=limit)
+        else:
+            return engine.get_backfill_indexer(target_keys, limit=limit)
+
+    def reindex(self, target, method=None, level=None, limit=None,
+                tolerance=None):
         """
         Performs any necessary conversion on the input index and calls
         get_indexer. This method is here so MultiIndex and an Index of
@@ -1869,6 +2532,15 @@ class MultiIndex(Index):
         -------
         (new_index, indexer, mask) : (MultiIndex, ndarray, ndarray)
         """
+        if tolerance is not None:
+            raise ValueError('tolerance not supported for MultiIndex')
+
+        if level is None and isinstance(target, Index):
+            reindexer = target._get_reindexer(self, self._get_method(method),
+                                              limit)
+            if reindexer is not None:
+                return reindexer.new_index, reindexer.indexer
+
         if level is not None:
             if method is not None:
                 raise ValueError('Fill method not supported if level passed')
@@ -1892,10 +2564,10 @@ class MultiIndex(Index):
 
         return target, indexer
 
-    @cache_readonly
+    @property
     def _tuple_index(self):
         """
-        Convert MultiIndex to an Index of tuples
+        Convert MultiIndex to an Index of tuples (not cached)
 
         Returns
         -------
@@ -2132,7 +2804,7 @@ class MultiIndex(Index):
         --------
         equal_levels
         """
-        if self is other:
+        if self.is_(other):
             return True
 
         if not isinstance(other, MultiIndex):
@@ -2145,11 +2817,17 @@ class MultiIndex(Index):
             return False
 
         for i in xrange(self.nlevels):
+            if self.levels[i].equals(other.levels[i]):
+                if not np.array_equal(self.labels[i], other.labels[i]):
+                    return False
+                continue
+
             svalues = ndtake(self.levels[i].values, self.labels[i])
             ovalues = ndtake(other.levels[i].values, other.labels[i])
             if not np.array_equal(svalues, ovalues):
                 return False
 
+        self._note_equal(other)
         return True
 
     def equal_levels(self, other):
@@ -2184,6 +2862,10 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        result = self._setop_packed(other, 'union', result_names)
+        if result is not None:
+            return result
+
         uniq_tuples = lib.fast_unique_multiple([self.values, other.values])
         return MultiIndex.from_arrays(zip(*uniq_tuples), sortorder=0,
                                       names=result_names)
@@ -2207,6 +2889,10 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        result = self._setop_packed(other, 'intersection', result_names)
+        if result is not None:
+            return result
+
         self_tuples = self.values
         other_tuples = other.values
         uniq_tuples = sorted(set(self_tuples) & set(other_tuples))
@@ -2235,6 +2921,10 @@ class MultiIndex(Index):
                               labels=[[]] * self.nlevels,
                               names=result_names)
 
+        result = self._setop_packed(other, 'diff', result_names)
+        if result is not None:
+            return result
+
         difference = sorted(set(self.values) - set(other.values))
 
         if len(difference) == 0:
@@ -2316,6 +3006,113 @@ class MultiIndex(Index):
 
         return self.__bounds
 
+    def _join_monotonic(self, other, how='left', return_indexers=False):
+        if (isinstance(other, MultiIndex) and other.nlevels == self.nlevels
+            and not self.equals(other)):
+            result = self._join_packed(other, how=how)
+            if result is not None:
+                if return_indexers:
+                    return result
+                return result[0]
+
+        return Index._join_monotonic(self, other, how=how,
+                                     return_indexers=return_indexers)
+
+    def _recode_with(self, other):
+        """
+        Labels of self and other against the union of their levels, or None
+        if a union level cannot be sorted
+
+        Returns
+        -------
+        (levels, left_codes, right_codes)
+        """
+        levels = []
+        left_codes = []
+        right_codes = []
+        for lev, lab, olev, olab in zip(self.levels, self.labels,
+                                        other.levels, other.labels):
+            new_lev = lev.union(olev)
+            if not new_lev.is_monotonic:
+                try:
+                    new_lev = new_lev.take(new_lev.values.argsort())
+                except TypeError:
+                    return None
+            left = com.take_1d(new_lev.get_indexer(lev), lab)
+            left[lab == -1] = -1
+            right = com.take_1d(new_lev.get_indexer(olev), olab)
+            right[olab == -1] = -1
+            levels.append(new_lev)
+            left_codes.append(left)
+            right_codes.append(right)
+        return levels, left_codes, right_codes
+
+    def _setop_packed(self, other, op, names):
+        # sorted set operation on int64 keys packed from the labels, None if
+        # the levels cannot be sorted
+        recoded = self._recode_with(other)
+        if recoded is None:
+            return None
+        levels, left_codes, right_codes = recoded
+
+        n = len(self)
+        codes = [np.concatenate((left, right))
+                 for left, right in zip(left_codes, right_codes)]
+        keys = _pack_labels(levels, codes)[0]
+
+        if op == 'union':
+            indexer = np.unique(keys, return_index=True)[1]
+        else:
+            uniq, indexer = np.unique(keys[:n], return_index=True)
+            mask = _sorted_isin(uniq, np.unique(keys[n:]))
+            if op == 'diff':
+                mask = ~mask
+            indexer = indexer[mask]
+
+        if len(indexer) == 0:
+            return MultiIndex(levels=[[]] * self.nlevels,
+                              labels=[[]] * self.nlevels,
+                              names=names)
+
+        levels, labels = _compact_levels(levels, [lab.take(indexer)
+                                                  for lab in codes])
+        return MultiIndex(levels=levels, labels=labels, sortorder=0,
+                          names=names)
+
+    def _join_packed(self, other, how='left'):
+        # join on int64 keys packed against the union of the levels; None if
+        # the keys would not fit in int64 or would not sort like the tuples
+        recoded = self._recode_with(other)
+        if recoded is None:
+            return None
+        levels, left_codes, right_codes = recoded
+
+        lkeys, sizes, uniques = _pack_labels(levels, left_codes)
+        if any(uniq is not None for uniq in uniques):
+            return None
+        rkeys = _pack_codes(right_codes, sizes, uniques)
+
+        join_keys, lidx, ridx = Int64Index(lkeys).join(Int64Index(rkeys),
+                                                       how=how,
+                                                       return_indexers=True)
+
+        if how == 'left' and lidx is None:
+            return self, lidx, ridx
+        elif how == 'right' and ridx is None:
+            return other, lidx, ridx
+
+        # unpack the joined keys into labels
+        join_keys = np.asarray(join_keys, dtype=np.int64)
+        labels = []
+        for size in reversed(sizes):
+            labels.append(join_keys % size - 1)
+            join_keys = join_keys // size
+        labels.reverse()
+
+        names = self.names if self.names == other.names else None
+        join_index = MultiIndex(levels=levels, labels=labels, names=names)
+        return join_index, lidx, ridx
+
     def _wrap_joined_index(self, joined, other):
         names = self.names if self.names == other.names else None
         return MultiIndex.from_tuples(joined, names=names)
@@ -2324,6 +3121,88 @@ class MultiIndex(Index):
 # For utility purposes
 
 
+_INT64_MAX = np.iinfo(np.int64).max
+
+def _pack_labels(levels, labels):
+    """
+    Pack the label codes of a MultiIndex into one int64 key per element.
+    Keys sort like the codes lexicographically. Where the product of the
+    level sizes would overflow int64, the keys packed so far are replaced by
+    their rank among the distinct keys before continuing
+
+    Returns
+    -------
+    keys : ndarray (int64)
+    sizes : list of per-level multipliers (level size + 1 for NA)
+    uniques : list, per level the sorted distinct keys ranked before packing
+        that level, or None
+    """
+    n = len(labels[0]) if len(labels) > 0 else 0
+    keys = np.zeros(n, dtype=np.int64)
+    sizes = []
+    uniques = []
+    bound = 1
+    for lev, lab in zip(levels, labels):
+        size = len(lev) + 1
+        uniq = None
+        if bound > _INT64_MAX // size:
+            uniq, keys = np.unique(keys, return_inverse=True)
+            keys = keys.astype(np.int64)
+            bound = len(uniq)
+        keys = keys * size + (com._ensure_int64(lab) + 1)
+        bound *= size
+        sizes.append(size)
+        uniques.append(uniq)
+    return keys, sizes, uniques
+
+def _pack_codes(codes, sizes, uniques):
+    """
+    Pack per-level codes (-1 for NA, -2 for labels absent from the level) with
+    the parameters from _pack_labels. Keys that cannot be in the index are -1
+    """
+    n = len(codes[0]) if len(codes) > 0 else 0
+    keys = np.zeros(n, dtype=np.int64)
+    missing = np.zeros(n, dtype=bool)
+    for code, size, uniq in zip(codes, sizes, uniques):
+        if uniq is not None:
+            missing |= ~_sorted_isin(keys, uniq)
+            if len(uniq) > 0:
+                keys = np.minimum(uniq.searchsorted(keys), len(uniq) - 1)
+                keys = keys.astype(np.int64)
+        code = com._ensure_int64(code)
+        missing |= code < -1
+        keys = keys * size + (code + 1)
+    keys[missing] = -1
+    return keys
+
+def _sorted_isin(values, sorted_keys):
+    """
+    Boolean mask of the elements of values found in the sorted array
+    sorted_keys
+    """
+    if len(sorted_keys) == 0:
+        return np.zeros(len(values), dtype=bool)
+    pos = sorted_keys.searchsorted(values)
+    pos = np.minimum(pos, len(sorted_keys) - 1)
+    return sorted_keys.take(pos) == values
+
+def _compact_levels(levels, labels):
+    """
+    Drop the level values not referenced by the labels and renumber the
+    labels, preserving level order
+    """
+    new_levels = []
+    new_labels = []
+    for lev, lab in zip(levels, labels):
+        used = np.unique(lab[lab != -1])
+        # position len(lev) maps the NA label -1 to itself
+        mapping = np.empty(len(lev) + 1, dtype=np.int64)
+        mapping.fill(-1)
+        mapping[used] = np.arange(len(used))
+        new_levels.append(lev.take(used))
+        new_labels.append(mapping.take(lab))
+    return new_levels, new_labels
+
 def _sparsify(label_list, start=0):
     pivoted = zip(*label_list)
     k = len(label_list)
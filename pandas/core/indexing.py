@@ -158,28 +158,43 @@ class _NDFrameIndexer(object):
         return True
 
     def _multi_take(self, tup):
-        index = self._convert_for_reindex(tup[0], axis=0)
-        columns = self._convert_for_reindex(tup[1], axis=1)
-        return self.obj.reindex(index=index, columns=columns)
+        # compute both indexers up front and take rows and columns together
+        index, row_indexer = self._get_take_indexer(tup[0], axis=0)
+        columns, col_indexer = self._get_take_indexer(tup[1], axis=1)
 
-    def _convert_for_reindex(self, key, axis=0):
+        if row_indexer is None and col_indexer is None:
+            return self.obj.copy()
+
+        return self.obj._reindex_with_indexers(index, row_indexer,
+                                               columns, col_indexer,
+                                               True, np.nan)
+
+    def _get_take_indexer(self, key, axis=0):
+        """
+        Return (new_labels, indexer) selecting key along axis, where indexer
+        is None if the labels are unchanged
+        """
         labels = self.obj._get_axis(axis)
 
         if com._is_bool_indexer(key):
             key = _check_bool_indexer(labels, key)
-            return labels[np.asarray(key)]
+            indexer = np.asarray(key, dtype=bool).nonzero()[0]
+            return labels.take(indexer), indexer
+
+        if isinstance(key, Index):
+            # want Index objects to pass through untouched
+            keyarr = key
         else:
-            if isinstance(key, Index):
-                # want Index objects to pass through untouched
-                keyarr = key
-            else:
-                # asarray can be unsafe, NumPy strings are weird
-                keyarr = _asarray_tuplesafe(key)
+            # asarray can be unsafe, NumPy strings are weird
+            keyarr = _asarray_tuplesafe(key)
 
-            if _is_integer_dtype(keyarr) and not _is_integer_index(labels):
-                return labels.take(keyarr)
+        if _is_integer_dtype(keyarr) and not _is_integer_index(labels):
+            new_labels = labels.take(keyarr)
+            indexer = com._ensure_int64(keyarr)
+            indexer = np.where(indexer < 0, indexer + len(labels), indexer)
+            return new_labels, indexer
 
-            return keyarr
+        return labels.reindex(keyarr)
 
     def _getitem_lowerdim(self, tup):
         from pandas.core.frame import DataFrame
@@ -275,7 +290,9 @@ class _NDFrameIndexer(object):
 
         if com._is_bool_indexer(key):
             key = _check_bool_indexer(labels, key)
-            return _reindex(labels[np.asarray(key)])
+            # positions of the selected rows, no label lookup needed
+            inds = np.asarray(key, dtype=bool).nonzero()[0]
+            return self.obj.take(inds, axis=axis)
         else:
             if isinstance(key, Index):
                 # want Index objects to pass through untouched
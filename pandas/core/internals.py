@@ -14,11 +14,16 @@ class Block(object):
     structure
 
     Index-ignorant; let the container take care of that
+
+    Blocks which cannot hold NA values natively (integer, boolean) may carry
+    a validity bitmask, packed along the last axis, instead of being upcast
+    to float64 / object when missing values are introduced
     """
-    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim']
+    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim',
+                 '_valid_bits']
 
     def __init__(self, values, items, ref_items, ndim=2,
-                 do_integrity_check=False):
+                 do_integrity_check=False, mask=None):
         if issubclass(values.dtype.type, basestring):
             values = np.array(values, dtype=object)
 
@@ -29,6 +34,7 @@ class Block(object):
         self.ndim = ndim
         self.items = _ensure_index(items)
         self.ref_items = _ensure_index(ref_items)
+        self._set_mask(mask)
 
         if do_integrity_check:
             self._check_integrity()
@@ -49,6 +55,61 @@ class Block(object):
             self._ref_locs = indexer
         return self._ref_locs
 
+    _valid_bits = None
+
+    def _set_mask(self, mask):
+        if mask is None or not mask.any():
+            self._valid_bits = None
+        else:
+            assert(mask.shape == self.values.shape)
+            self._valid_bits = com._pack_mask(mask)
+
+    @property
+    def is_masked(self):
+        return self._valid_bits is not None
+
+    def isnull(self):
+        """
+        Boolean ndarray of same shape as values, True where values are NA
+        """
+        if self._valid_bits is not None:
+            return com._unpack_mask(self._valid_bits, self.values.shape[-1])
+        return com.isnull(self.values)
+
+    def _get_mask(self):
+        # NA mask or None if the block does not carry a bitmask
+        if self._valid_bits is None:
+            return None
+        return com._unpack_mask(self._valid_bits, self.values.shape[-1])
+
+    def _take_mask(self, indexer, axis=0):
+        if self._valid_bits is None:
+            return None
+        if axis == 0:
+            return com._unpack_mask(self._valid_bits.take(indexer, axis=0),
+                                    self.values.shape[-1])
+        return self._get_mask().take(indexer, axis=axis)
+
+    def _slice_mask(self, slicer):
+        if self._valid_bits is None:
+            return None
+        return self._get_mask()[slicer]
+
+    def unmask(self):
+        """
+        Convert a block carrying a validity bitmask into an ordinary block,
+        upcasting and placing NaN where values are missing
+
+        Returns
+        -------
+        y : Block (self if no bitmask)
+        """
+        if self._valid_bits is None:
+            return self
+        new_values = com._maybe_upcast(self.values)
+        np.putmask(new_values, self._get_mask(), np.nan)
+        return make_block(new_values, self.items, self.ref_items)
+
     def set_ref_items(self, ref_items, maybe_rename=True):
         """
         If maybe_rename=True, need to set the items for this guy
@@ -72,14 +133,15 @@ class Block(object):
     def __getstate__(self):
         # should not pickle generally (want to share ref_items), but here for
         # completeness
-        return (self.items, self.ref_items, self.values)
+        return (self.items, self.ref_items, self.values, self._get_mask())
 
     def __setstate__(self, state):
-        items, ref_items, values = state
+        items, ref_items, values = state[:3]
         self.items = _ensure_index(items)
         self.ref_items = _ensure_index(ref_items)
         self.values = values
         self.ndim = values.ndim
+        self._set_mask(state[3] if len(state) > 3 else None)
 
     @property
     def shape(self):
@@ -93,7 +155,8 @@ class Block(object):
         values = self.values
         if deep:
             values = values.copy()
-        return make_block(values, self.items, self.ref_items)
+        return make_block(values, self.items, self.ref_items,
+                          mask=self._get_mask())
 
     def merge(self, other):
         assert(self.ref_items.equals(other.ref_items))
@@ -104,10 +167,17 @@ class Block(object):
         return _merge_blocks([self, other], self.ref_items)
 
     def reindex_axis(self, indexer, mask, needs_masking, axis=0,
-                     fill_value=np.nan):
+                     fill_value=np.nan, mask_na=False):
         """
         Reindex using pre-computed indexer information
+
+        If mask_na=True, blocks that cannot hold NA record the introduced
+        missing values in a validity bitmask rather than being upcast
         """
+        if self._use_bitmask(needs_masking, fill_value, mask_na):
+            return self._reindex_axis_masked(indexer, mask, needs_masking,
+                                             axis=axis, fill_value=fill_value)
+
         if self.values.size > 0:
             new_values = com.take_fast(self.values, indexer, mask,
                                        needs_masking, axis=axis,
@@ -119,6 +189,41 @@ class Block(object):
             new_values.fill(fill_value)
         return make_block(new_values, self.items, self.ref_items)
 
+    def _use_bitmask(self, needs_masking, fill_value, mask_na):
+        if self._can_hold_na:
+            return False
+        if self._valid_bits is not None:
+            return True
+        return mask_na and needs_masking and com.isnull(fill_value)
+
+    def _reindex_axis_masked(self, indexer, mask, needs_masking, axis=0,
+                             fill_value=np.nan):
+        shape = list(self.shape)
+        shape[axis] = len(indexer)
+
+        if self.values.shape[axis] > 0:
+            # -1 positions are filled with a dummy value and masked out
+            new_values = com.take_fast(self.values, indexer, mask, False,
+                                       axis=axis, fill_value=0)
+            new_mask = self._take_mask(indexer, axis=axis)
+        else:
+            new_values = np.zeros(shape, dtype=self.dtype)
+            new_mask = None
+
+        if new_mask is None:
+            new_mask = np.zeros(shape, dtype=bool)
+
+        if needs_masking:
+            if com.notnull(fill_value) and self._can_hold_element(fill_value):
+                com.mask_out_axis(new_values, mask, axis,
+                                  self._try_cast(fill_value))
+                com.mask_out_axis(new_mask, mask, axis, False)
+            else:
+                com.mask_out_axis(new_mask, mask, axis, True)
+
+        return make_block(new_values, self.items, self.ref_items,
+                          mask=new_mask)
+
     def reindex_items_from(self, new_ref_items, copy=True):
         """
         Reindex to only those items contained in the input set of items
@@ -134,6 +239,7 @@ class Block(object):
         if indexer is None:
             new_items = new_ref_items
             new_values = self.values.copy() if copy else self.values
+            new_mask = self._get_mask()
         else:
             mask = indexer != -1
             masked_idx = indexer[mask]
@@ -145,11 +251,19 @@ class Block(object):
                 new_values = self.values.take(masked_idx, axis=0)
 
             new_items = self.items.take(masked_idx)
-        return make_block(new_values, new_items, new_ref_items)
+            new_mask = self._take_mask(masked_idx, axis=0)
+        return make_block(new_values, new_items, new_ref_items,
+                          mask=new_mask)
 
     def get(self, item):
         loc = self.items.get_loc(item)
-        return self.values[loc]
+        values = self.values[loc]
+        if self._valid_bits is not None:
+            mask = self._get_mask()[loc]
+            if mask.any():
+                values = com._maybe_upcast(values)
+                np.putmask(values, mask, np.nan)
+        return values
 
     def set(self, item, value):
         """
@@ -161,6 +275,13 @@ class Block(object):
         """
         loc = self.items.get_loc(item)
         self.values[loc] = value
+        self._clear_mask(loc)
+
+    def _clear_mask(self, loc):
+        if self._valid_bits is not None:
+            mask = self._get_mask()
+            mask[loc] = False
+            self._set_mask(mask)
 
     def delete(self, item):
         """
@@ -171,7 +292,11 @@ class Block(object):
         loc = self.items.get_loc(item)
         new_items = self.items.delete(loc)
         new_values = np.delete(self.values, loc, 0)
-        return make_block(new_values, new_items, self.ref_items)
+        new_mask = self._get_mask()
+        if new_mask is not None:
+            new_mask = np.delete(new_mask, loc, 0)
+        return make_block(new_values, new_items, self.ref_items,
+                          mask=new_mask)
 
     def split_block_at(self, item):
         """
@@ -192,23 +317,31 @@ class Block(object):
             # at front
             left_block = None
             right_block = make_block(self.values[1:], self.items[1:].copy(),
-                                      self.ref_items)
+                                     self.ref_items,
+                                     mask=self._slice_mask(slice(1, None)))
         elif loc == len(self.values) - 1:
             # at back
             left_block = make_block(self.values[:-1], self.items[:-1].copy(),
-                                    self.ref_items)
+                                    self.ref_items,
+                                    mask=self._slice_mask(slice(None, -1)))
             right_block = None
         else:
             # in the middle
             left_block = make_block(self.values[:loc],
-                                    self.items[:loc].copy(), self.ref_items)
+                                    self.items[:loc].copy(), self.ref_items,
+                                    mask=self._slice_mask(slice(None, loc)))
             right_block = make_block(self.values[loc + 1:],
                                      self.items[loc + 1:].copy(),
-                                     self.ref_items)
+                                     self.ref_items,
+                                     mask=self._slice_mask(slice(loc + 1,
+                                                                 None)))
 
         return left_block, right_block
 
     def fillna(self, value, inplace=False):
+        if self._valid_bits is not None:
+            return self._fillna_masked(value, inplace=inplace)
+
         new_values = self.values if inplace else self.values.copy()
 
         mask = com.isnull(new_values)
@@ -219,6 +352,19 @@ class Block(object):
         else:
             return make_block(new_values, self.items, self.ref_items)
 
+    def _fillna_masked(self, value, inplace=False):
+        if not self._can_hold_element(value):
+            return self.unmask().fillna(value)
+
+        new_values = self.values if inplace else self.values.copy()
+        np.putmask(new_values, self._get_mask(), self._try_cast(value))
+
+        if inplace:
+            self._valid_bits = None
+            return self
+        else:
+            return make_block(new_values, self.items, self.ref_items)
+
     def _can_hold_element(self, value):
         raise NotImplementedError()
 
@@ -226,6 +372,9 @@ class Block(object):
         raise NotImplementedError()
 
     def replace(self, to_replace, value, inplace=False):
+        if self._valid_bits is not None:
+            return self.unmask().replace(to_replace, value)
+
         new_values = self.values if inplace else self.values.copy()
         if self._can_hold_element(value):
             value = self._try_cast(value)
@@ -255,16 +404,25 @@ class Block(object):
 
     def putmask(self, mask, new, inplace=False):
         new_values = self.values if inplace else self.values.copy()
+        na_mask = self._get_mask()
         if self._can_hold_element(new):
             new = self._try_cast(new)
             np.putmask(new_values, mask, new)
+            if na_mask is not None:
+                na_mask &= -np.asarray(mask, dtype=bool)
         if inplace:
+            self._set_mask(na_mask)
             return self
         else:
-            return make_block(new_values, self.items, self.ref_items)
+            return make_block(new_values, self.items, self.ref_items,
+                              mask=na_mask)
 
     def interpolate(self, method='pad', axis=0, inplace=False,
                     limit=None, missing=None):
+        if self._valid_bits is not None:
+            return self.unmask().interpolate(method=method, axis=axis,
+                                             limit=limit, missing=missing)
+
         values = self.values if inplace else self.values.copy()
 
         if values.ndim != 2:
@@ -289,9 +447,12 @@ class Block(object):
         new_values = com.take_fast(self.values, indexer, None,
                                    None, axis=axis,
                                    fill_value=fill_value)
-        return make_block(new_values, self.items, self.ref_items)
+        return make_block(new_values, self.items, self.ref_items,
+                          mask=self._take_mask(indexer, axis=axis))
 
     def get_values(self, dtype):
+        if self._valid_bits is not None:
+            return self.unmask().values
         return self.values
 
 def _mask_missing(array, missing_values):
@@ -396,12 +557,12 @@ class DatetimeBlock(Block):
     _can_hold_na = True
 
     def __init__(self, values, items, ref_items, ndim=2,
-                 do_integrity_check=False):
+                 do_integrity_check=False, mask=None):
         if values.dtype != _NS_DTYPE:
             values = lib.cast_to_nanoseconds(values)
 
         Block.__init__(self, values, items, ref_items, ndim=ndim,
-                       do_integrity_check=do_integrity_check)
+                       do_integrity_check=do_integrity_check, mask=mask)
 
     def _can_hold_element(self, element):
         return com.is_integer(element) or isinstance(element, datetime)
@@ -438,7 +599,7 @@ class DatetimeBlock(Block):
         return self.values
 
 
-def make_block(values, items, ref_items, do_integrity_check=False):
+def make_block(values, items, ref_items, do_integrity_check=False, mask=None):
     dtype = values.dtype
     vtype = dtype.type
 
@@ -457,8 +618,15 @@ def make_block(values, items, ref_items, do_integrity_check=False):
     else:
         klass = ObjectBlock
 
+    if mask is not None and klass._can_hold_na:
+        # no need for a bitmask, NA can be represented in the values
+        if mask.any():
+            values = values.copy()
+            np.putmask(values, mask, np.nan)
+        mask = None
+
     return klass(values, items, ref_items, ndim=values.ndim,
-                 do_integrity_check=do_integrity_check)
+                 do_integrity_check=do_integrity_check, mask=mask)
 
 # TODO: flexible with index=None and/or items=None
 
@@ -479,11 +647,12 @@ class BlockManager(object):
     -----
     This is *not* a public API class
     """
-    __slots__ = ['axes', 'blocks', 'ndim']
+    __slots__ = ['axes', 'blocks', 'ndim', '_placement']
 
     def __init__(self, blocks, axes, do_integrity_check=True):
         self.axes = [_ensure_index(ax) for ax in axes]
         self.blocks = blocks
+        self._placement = None
 
         ndim = len(axes)
         for block in blocks:
@@ -519,6 +688,7 @@ class BlockManager(object):
         self.axes[axis] = _ensure_index(value)
 
         if axis == 0:
+            self._placement = None
             for block in self.blocks:
                 block.set_ref_items(self.items, maybe_rename=True)
 
@@ -531,6 +701,9 @@ class BlockManager(object):
         block_values = [b.values for b in self.blocks]
         block_items = [b.items for b in self.blocks]
         axes_array = [ax for ax in self.axes]
+        if self.is_masked():
+            block_masks = [b._get_mask() for b in self.blocks]
+            return axes_array, block_values, block_items, block_masks
         return axes_array, block_values, block_items
 
     def __setstate__(self, state):
@@ -538,15 +711,20 @@ class BlockManager(object):
         # while longer
         ax_arrays, bvalues, bitems = state[:3]
 
+        bmasks = [None] * len(bvalues)
+        if len(state) == 4 and isinstance(state[3], list):
+            bmasks = state[3]
+
         self.axes = [_ensure_index(ax) for ax in ax_arrays]
         self.axes = _handle_legacy_indexes(self.axes)
 
         blocks = []
-        for values, items in zip(bvalues, bitems):
+        for values, items, mask in zip(bvalues, bitems, bmasks):
             blk = make_block(values, items, self.axes[0],
-                             do_integrity_check=True)
+                             do_integrity_check=True, mask=mask)
             blocks.append(blk)
         self.blocks = blocks
+        self._placement = None
 
     def __len__(self):
         return len(self.items)
@@ -579,6 +757,7 @@ class BlockManager(object):
     def astype(self, dtype):
         new_blocks = []
         for block in self.blocks:
+            block = block.unmask()
             newb = make_block(com._astype_nansafe(block.values, dtype),
                               block.items, block.ref_items)
             new_blocks.append(newb)
@@ -586,6 +765,15 @@ class BlockManager(object):
         new_mgr = BlockManager(new_blocks, self.axes)
         return new_mgr.consolidate()
 
+    def is_masked(self):
+        """
+        Return True if any block carries a validity bitmask
+        """
+        for block in self.blocks:
+            if block._valid_bits is not None:
+                return True
+        return False
+
     def is_consolidated(self):
         """
         Return True if more than one block with the same dtype
@@ -657,7 +845,7 @@ class BlockManager(object):
             if len(self.blocks) == 1:
                 blk = self.blocks[0]
                 newb = make_block(blk.values[slobj], new_items,
-                                  new_items)
+                                  new_items, mask=blk._slice_mask(slobj))
                 new_blocks = [newb]
             else:
                 return self.reindex_items(new_items)
@@ -675,7 +863,8 @@ class BlockManager(object):
 
         for block in self.blocks:
             newb = make_block(block.values[slicer], block.items,
-                              block.ref_items)
+                              block.ref_items,
+                              mask=block._slice_mask(slicer))
             new_blocks.append(newb)
         return new_blocks
 
@@ -715,7 +904,7 @@ class BlockManager(object):
             blk = self.blocks[0]
             if items is None or blk.items.equals(items):
                 # if not, then just call interleave per below
-                mat = blk.values
+                mat = blk.get_values(blk.dtype)
             else:
                 mat = self.reindex_items(items).as_matrix()
         else:
@@ -769,13 +958,16 @@ class BlockManager(object):
                 raise Exception('cannot get view of mixed-type or '
                                 'non-consolidated DataFrame')
             for blk in self.blocks:
-                newb = make_block(blk.values[slicer], blk.items, blk.ref_items)
+                newb = make_block(blk.values[slicer], blk.items, blk.ref_items,
+                                  mask=blk._slice_mask(slicer))
                 new_blocks.append(newb)
         elif len(self.blocks) == 1:
-            vals = self.blocks[0].values[slicer]
+            blk = self.blocks[0]
+            vals = blk.values[slicer]
             if copy:
                 vals = vals.copy()
-            new_blocks = [make_block(vals, self.items, self.items)]
+            new_blocks = [make_block(vals, self.items, self.items,
+                                     mask=blk._slice_mask(slicer))]
 
         return BlockManager(new_blocks, new_axes)
 
@@ -783,7 +975,7 @@ class BlockManager(object):
         """
 
         """
-        if len(self.blocks) == 1:
+        if len(self.blocks) == 1 and not self.blocks[0].is_masked:
             result = self.blocks[0].values[:, loc]
             if copy:
                 result = result.copy()
@@ -799,7 +991,7 @@ class BlockManager(object):
         n = len(items)
         result = np.empty(n, dtype=dtype)
         for blk in self.blocks:
-            values = blk.values
+            values = blk.get_values(dtype)
             for j, item in enumerate(blk.items):
                 i = items.get_loc(item)
                 result[i] = values[j, loc]
@@ -822,6 +1014,37 @@ class BlockManager(object):
 
     def _consolidate_inplace(self):
         self.blocks = _consolidate(self.blocks, self.items)
+        self._placement = None
+
+    def _get_placement(self):
+        """
+        For unique items, return lists (blknos, blklocs) giving for each item
+        position the number of the block holding it and the item's position
+        within that block. Computed lazily and reset whenever the blocks or
+        the item order change. Returns None if the items are not unique
+        """
+        if self._placement is None:
+            if not self.items.is_unique:
+                return None
+            n = len(self.items)
+            blknos = [0] * n
+            blklocs = [0] * n
+            for blkno, block in enumerate(self.blocks):
+                indexer = self.items.get_indexer(block.items)
+                for j, loc in enumerate(indexer):
+                    if loc == -1:
+                        return None
+                    blknos[loc] = blkno
+                    blklocs[loc] = j
+            self._placement = blknos, blklocs
+        return self._placement
+
+    def _swap_blocks(self, new_blocks):
+        # masked blocks that cannot hold a fill value are replaced by an
+        # upcast copy even when filling in place
+        if any(new is not old for new, old in zip(new_blocks, self.blocks)):
+            self.blocks = new_blocks
+            self._consolidate_inplace()
 
     def get(self, item):
         _, block = self._find_block(item)
@@ -850,14 +1073,61 @@ class BlockManager(object):
         """
         Retrieve single item
         """
+        blk, full_loc = self._locate_scalar(tup)
+        if len(full_loc) == 2 and com.is_integer(full_loc[1]):
+            i, j = full_loc
+            if blk.is_masked and blk._get_mask()[i, j]:
+                return np.nan
+            return lib.get_value_2d(blk.values, i, j)
+
+        if blk.is_masked and blk._get_mask()[full_loc]:
+            return np.nan
+        return blk.values[full_loc]
+
+    def iget_scalar(self, i, j):
+        """
+        Retrieve single item by item position i and major axis position j
+        (2-dimensional managers only)
+        """
+        placement = self._get_placement()
+        if placement is None:
+            return self.iget(i)[j]
+
+        blk = self.blocks[placement[0][i]]
+        loc = placement[1][i]
+        if blk.is_masked and blk._get_mask()[loc, j]:
+            return np.nan
+        return lib.get_value_2d(blk.values, loc, j)
+
+    def set_scalar(self, tup, value):
+        """
+        Set single item in-place, clearing its NA bit if the block is masked
+        """
+        blk, full_loc = self._locate_scalar(tup)
+        if len(full_loc) == 2 and com.is_integer(full_loc[1]):
+            lib.set_value_2d(blk.values, full_loc[0], full_loc[1], value)
+        else:
+            blk.values[full_loc] = lib.convert_scalar(blk.values, value)
+        blk._clear_mask(full_loc)
+
+    def _locate_scalar(self, tup):
         item = tup[0]
-        _, blk = self._find_block(item)
+        item_loc = None
 
-        # this could obviously be seriously sped up in cython
-        item_loc = blk.items.get_loc(item),
-        full_loc = item_loc + tuple(ax.get_loc(x)
-                                    for ax, x in zip(self.axes[1:], tup[1:]))
-        return blk.values[full_loc]
+        placement = self._get_placement()
+        if placement is not None:
+            loc = self.items.get_loc(item)
+            if com.is_integer(loc):
+                blk = self.blocks[placement[0][loc]]
+                item_loc = placement[1][loc]
+
+        if item_loc is None:
+            _, blk = self._find_block(item)
+            item_loc = blk.items.get_loc(item)
+
+        full_loc = (item_loc,) + tuple(ax.get_loc(x)
+                                       for ax, x in zip(self.axes[1:], tup[1:]))
+        return blk, full_loc
 
     def delete(self, item):
         i, _ = self._find_block(item)
@@ -904,6 +1174,7 @@ class BlockManager(object):
     def set_items_norename(self, value):
         value = _ensure_index(value)
         self.axes[0] = value
+        self._placement = None
 
         for block in self.blocks:
             block.set_ref_items(value, maybe_rename=False)
@@ -913,6 +1184,7 @@ class BlockManager(object):
         Delete and maybe remove the whole block
         """
         block = self.blocks.pop(i)
+        self._placement = None
         new_left, new_right = block.split_block_at(item)
 
         if new_left is not None:
@@ -930,9 +1202,18 @@ class BlockManager(object):
         new_block = make_block(value, self.items[loc:loc+1].copy(),
                                self.items)
         self.blocks.append(new_block)
+        self._placement = None
 
     def _find_block(self, item):
         self._check_have(item)
+
+        placement = self._get_placement()
+        if placement is not None:
+            loc = self.items.get_loc(item)
+            if com.is_integer(loc):
+                i = placement[0][loc]
+                return i, self.blocks[i]
+
         for i, block in enumerate(self.blocks):
             if item in block:
                 return i, block
@@ -960,9 +1241,13 @@ class BlockManager(object):
         new_axis, indexer = cur_axis.reindex(new_axis, method)
         return self.reindex_indexer(new_axis, indexer, axis=axis)
 
-    def reindex_indexer(self, new_axis, indexer, axis=1, fill_value=np.nan):
+    def reindex_indexer(self, new_axis, indexer, axis=1, fill_value=np.nan,
+                        mask_na=False):
         """
         pandas-indexer with -1's only.
+
+        If mask_na=True, integer and boolean blocks keep their dtype and record
+        missing values in a validity bitmask instead of being upcast
         """
         if axis == 0:
             return self._reindex_indexer_items(new_axis, indexer, fill_value)
@@ -975,7 +1260,8 @@ class BlockManager(object):
         new_blocks = []
         for block in self.blocks:
             newb = block.reindex_axis(indexer, mask, needs_masking,
-                                      axis=axis, fill_value=fill_value)
+                                      axis=axis, fill_value=fill_value,
+                                      mask_na=mask_na)
             new_blocks.append(newb)
 
         new_axes = list(self.axes)
@@ -1003,8 +1289,9 @@ class BlockManager(object):
             new_block_items = new_items.take(selector.nonzero()[0])
             new_values = com.take_fast(blk.values, blk_indexer[selector],
                                        None, False, axis=0)
+            new_mask = blk._take_mask(blk_indexer[selector], axis=0)
             new_blocks.append(make_block(new_values, new_block_items,
-                                         new_items))
+                                         new_items, mask=new_mask))
 
         if not mask.all():
             na_items = new_items[-mask]
@@ -1015,6 +1302,57 @@ class BlockManager(object):
 
         return BlockManager(new_blocks, [new_items] + self.axes[1:])
 
+    def reindex_indexer_multi(self, new_items, item_indexer, new_axis,
+                              axis_indexer, fill_value=np.nan):
+        """
+        Conform both the items and the second axis using pandas-indexers
+        (-1's for missing), selecting each block's rows and columns in a
+        single take_2d_multi instead of one full intermediate per axis
+        """
+        placement = self._get_placement()
+        if (placement is None or self.ndim != 2 or 0 in self.shape or
+            any(blk._valid_bits is not None for blk in self.blocks)):
+            result = self.reindex_indexer(new_axis, axis_indexer, axis=1,
+                                          fill_value=fill_value)
+            return result.reindex_indexer(new_items, item_indexer, axis=0,
+                                          fill_value=fill_value)
+
+        item_indexer = com._ensure_int64(item_indexer)
+        axis_indexer = com._ensure_int64(axis_indexer)
+
+        found = item_indexer != -1
+        blknos = np.asarray(placement[0], dtype=np.int64)
+        blklocs = np.asarray(placement[1], dtype=np.int64)
+
+        # block number and in-block position of every requested item
+        new_blknos = np.where(found, blknos.take(item_indexer), -1)
+        new_blklocs = blklocs.take(item_indexer)
+
+        new_blocks = []
+        for blkno, blk in enumerate(self.blocks):
+            selector = (new_blknos == blkno).nonzero()[0]
+            if len(selector) == 0:
+                continue
+
+            new_values = com.take_2d_multi(blk.values,
+                                           new_blklocs.take(selector),
+                                           axis_indexer,
+                                           fill_value=fill_value)
+            new_blocks.append(make_block(new_values,
+                                         new_items.take(selector),
+                                         new_items))
+
+        if not found.all():
+            na_items = new_items[~found]
+            block_values = np.empty([len(na_items), len(new_axis)],
+                                    dtype=com._infer_dtype(fill_value))
+            block_values.fill(fill_value)
+            new_blocks.append(make_block(block_values, na_items, new_items,
+                                         do_integrity_check=True))
+            new_blocks = _consolidate(new_blocks, new_items)
+
+        return BlockManager(new_blocks, [new_items, new_axis])
+
     def reindex_items(self, new_items, copy=True, fill_value=np.nan):
         """
 
@@ -1083,7 +1421,8 @@ class BlockManager(object):
         for blk in self.blocks:
             new_values = com.take_fast(blk.values, indexer,
                                        None, False, axis=axis)
-            newb = make_block(new_values, blk.items, self.items)
+            newb = make_block(new_values, blk.items, self.items,
+                              mask=blk._take_mask(indexer, axis=axis))
             new_blocks.append(newb)
 
         return BlockManager(new_blocks, new_axes)
@@ -1165,9 +1504,10 @@ class BlockManager(object):
 
     def fillna(self, value, inplace=False):
         new_blocks = [b.fillna(value, inplace=inplace)
-                      if b._can_hold_na else b
+                      if b._can_hold_na or b.is_masked else b
                       for b in self.blocks]
         if inplace:
+            self._swap_blocks(new_blocks)
             return self
         return BlockManager(new_blocks, self.axes)
 
@@ -1175,6 +1515,7 @@ class BlockManager(object):
         new_blocks = [b.replace(to_replace, value, inplace=inplace)
                       for b in self.blocks]
         if inplace:
+            self._swap_blocks(new_blocks)
             return self
         return BlockManager(new_blocks, self.axes)
 
@@ -1343,10 +1684,13 @@ def _interleaved_dtype(blocks):
     for x in blocks:
         counts[type(x)] += 1
 
+    # missing values in masked blocks are materialized when interleaving
+    masked = set(type(x) for x in blocks if x.is_masked)
+
     have_int = counts[IntBlock] > 0
     have_bool = counts[BoolBlock] > 0
-    have_object = counts[ObjectBlock] > 0
-    have_float = counts[FloatBlock] > 0
+    have_object = counts[ObjectBlock] > 0 or BoolBlock in masked
+    have_float = counts[FloatBlock] > 0 or IntBlock in masked
     have_complex = counts[ComplexBlock] > 0
     have_dt64 = counts[DatetimeBlock] > 0
     have_numeric = have_float or have_complex or have_int
@@ -1391,8 +1735,13 @@ def _merge_blocks(blocks, items):
         return blocks[0]
     new_values = _vstack([b.values for b in blocks])
     new_items = blocks[0].items.append([b.items for b in blocks[1:]])
+
+    new_mask = None
+    if any(b.is_masked for b in blocks):
+        new_mask = np.vstack([b.isnull() for b in blocks])
+
     new_block = make_block(new_values, new_items, items,
-                           do_integrity_check=True)
+                           do_integrity_check=True, mask=new_mask)
     return new_block.reindex_items_from(items)
 
 def _union_block_items(blocks):
@@ -32,7 +32,8 @@ def _bottleneck_switch(bn_name, alt, zero_value=None, **kwargs):
                     result.fill(0)
                     return result
 
-            if _USE_BOTTLENECK and skipna and values.dtype != np.object_:
+            if (_USE_BOTTLENECK and skipna and values.dtype != np.object_
+                and kwds.get('mask') is None):
                 result = bn_func(values, axis=axis, **kwds)
                 # prefer to treat inf/-inf as NA
                 if _has_infs(result):
@@ -57,26 +58,33 @@ def _has_infs(result):
     else:
         return np.isinf(result) or np.isneginf(result)
 
-def nanany(values, axis=None, skipna=True):
-    mask = isnull(values)
+def _get_mask(values, mask):
+    # mask is passed explicitly for values carrying a validity bitmask, in
+    # which case the masked positions hold arbitrary values
+    if mask is None:
+        return isnull(values), False
+    return mask, mask.any()
+
+def nanany(values, axis=None, skipna=True, mask=None):
+    mask, _ = _get_mask(values, mask)
 
     if skipna:
         values = values.copy()
         np.putmask(values, mask, False)
     return values.any(axis)
 
-def nanall(values, axis=None, skipna=True):
-    mask = isnull(values)
+def nanall(values, axis=None, skipna=True, mask=None):
+    mask, _ = _get_mask(values, mask)
 
     if skipna:
         values = values.copy()
         np.putmask(values, mask, True)
     return values.all(axis)
 
-def _nansum(values, axis=None, skipna=True):
-    mask = isnull(values)
+def _nansum(values, axis=None, skipna=True, mask=None):
+    mask, masked = _get_mask(values, mask)
 
-    if skipna and not issubclass(values.dtype.type, np.integer):
+    if skipna and (masked or not issubclass(values.dtype.type, np.integer)):
         values = values.copy()
         np.putmask(values, mask, 0)
 
@@ -85,10 +93,10 @@ def _nansum(values, axis=None, skipna=True):
 
     return the_sum
 
-def _nanmean(values, axis=None, skipna=True):
-    mask = isnull(values)
+def _nanmean(values, axis=None, skipna=True, mask=None):
+    mask, masked = _get_mask(values, mask)
 
-    if skipna and not issubclass(values.dtype.type, np.integer):
+    if skipna and (masked or not issubclass(values.dtype.type, np.integer)):
         values = values.copy()
         np.putmask(values, mask, 0)
 
@@ -119,8 +127,10 @@ def _nanmedian(values, axis=None, skipna=True):
     else:
         return get_median(values)
 
-def _nanvar(values, axis=None, skipna=True, ddof=1):
-    mask = isnull(values)
+def _nanvar(values, axis=None, skipna=True, ddof=1, mask=None):
+    mask, masked = _get_mask(values, mask)
+    if masked:
+        values = values.astype('f8')
 
     if axis is not None:
         count = (values.shape[axis] - mask.sum(axis)).astype(float)
@@ -135,10 +145,13 @@ def _nanvar(values, axis=None, skipna=True, ddof=1):
     XX = _ensure_numeric((values ** 2).sum(axis))
     return np.fabs((XX - X ** 2 / count) / (count - ddof))
 
-def _nanmin(values, axis=None, skipna=True):
-    mask = isnull(values)
-    if skipna and not issubclass(values.dtype.type,
-                                 (np.integer, np.datetime64)):
+def _nanmin(values, axis=None, skipna=True, mask=None):
+    mask, masked = _get_mask(values, mask)
+    if skipna and masked and issubclass(values.dtype.type, np.integer):
+        values = values.copy()
+        np.putmask(values, mask, np.iinfo(values.dtype).max)
+    elif skipna and not issubclass(values.dtype.type,
+                                   (np.integer, np.datetime64)):
         values = values.copy()
         np.putmask(values, mask, np.inf)
     # numpy 1.6.1 workaround in Python 3.x
@@ -155,10 +168,13 @@ def _nanmin(values, axis=None, skipna=True):
 
     return _maybe_null_out(result, axis, mask)
 
-def _nanmax(values, axis=None, skipna=True):
-    mask = isnull(values)
-    if skipna and not issubclass(values.dtype.type,
-                                 (np.integer, np.datetime64)):
+def _nanmax(values, axis=None, skipna=True, mask=None):
+    mask, masked = _get_mask(values, mask)
+    if skipna and masked and issubclass(values.dtype.type, np.integer):
+        values = values.copy()
+        np.putmask(values, mask, np.iinfo(values.dtype).min)
+    elif skipna and not issubclass(values.dtype.type,
+                                   (np.integer, np.datetime64)):
         values = values.copy()
         np.putmask(values, mask, -np.inf)
     # numpy 1.6.1 workaround in Python 3.x
@@ -270,14 +286,18 @@ def nankurt(values, axis=None, skipna=True):
             return np.nan
         return result
 
-def nanprod(values, axis=None, skipna=True):
-    mask = isnull(values)
-    if skipna and not issubclass(values.dtype.type, np.integer):
+def nanprod(values, axis=None, skipna=True, mask=None):
+    mask, masked = _get_mask(values, mask)
+    if skipna and (masked or not issubclass(values.dtype.type, np.integer)):
         values = values.copy()
         values[mask] = 1
     result = values.prod(axis)
     return _maybe_null_out(result, axis, mask)
 
+# reductions accepting an explicit NA mask for bitmasked integer / boolean data
+_mask_ops = set([nanany, nanall, nansum, nanmean, nanvar, nanmin, nanmax,
+                 nanprod])
+
 def _maybe_arg_null_out(result, axis, mask, skipna):
     # helper function for nanargmin/nanargmax
     if axis is None:
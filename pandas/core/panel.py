@@ -1335,7 +1335,7 @@ def _extract_axis(data, axis=0, intersect=False):
             if have_frames:
                 assert(lengths[0] == len(index))
             else:
-                index = Index(np.arange(lengths[0]))
+                index = _default_index(lengths[0])
 
     return _ensure_index(index)
 
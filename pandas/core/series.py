@@ -2006,7 +2006,7 @@ copy : boolean, default False
         return self._constructor(new_values, new_index, name=self.name)
 
     def reindex(self, index=None, method=None, level=None, fill_value=np.nan,
-                limit=None, copy=True):
+                limit=None, copy=True, tolerance=None):
         """Conform Series to new index with optional filling logic, placing
         NA/NaN in locations having no value in the previous index. A new object
         is produced unless the new index is equivalent to the current one and
@@ -2017,10 +2017,11 @@ copy : boolean, default False
         index : array-like or Index
             New labels / index to conform to. Preferably an Index object to
             avoid duplicating data
-        method : {'backfill', 'bfill', 'pad', 'ffill', None}
+        method : {'backfill', 'bfill', 'pad', 'ffill', 'nearest', None}
             Method to use for filling holes in reindexed Series
             pad / ffill: propagate LAST valid observation forward to next valid
             backfill / bfill: use NEXT valid observation to fill gap
+            nearest: use the value at the NEAREST label
         copy : boolean, default True
             Return a new object, even if the passed indexes are the same
         level : int or name
@@ -2031,6 +2032,9 @@ copy : boolean, default False
             "compatible" value
         limit : int, default None
             Maximum size gap to forward or backward fill
+        tolerance : scalar, timedelta or string, default None
+            Maximum distance between a new label and the label it takes its
+            value from with a fill method, e.g. '5s' for a DatetimeIndex
 
         Returns
         -------
@@ -2052,7 +2056,8 @@ copy : boolean, default False
             return Series(nan, index=index, name=self.name)
 
         new_index, indexer = self.index.reindex(index, method=method,
-                                                 level=level, limit=limit)
+                                                 level=level, limit=limit,
+                                                 tolerance=tolerance)
         new_values = com.take_1d(self.values, indexer, fill_value=fill_value)
         return Series(new_values, index=new_index, name=self.name)
 
@@ -2449,7 +2454,7 @@ copy : boolean, default False
             return Series(self, index=self.index.shift(periods, offset),
                           name=self.name)
 
-    def asof(self, where):
+    def asof(self, where, tolerance=None):
         """
         Return last good (non-NaN) value in TimeSeries if value is NaN for
         requested date.
@@ -2459,6 +2464,9 @@ copy : boolean, default False
         Parameters
         ----------
         wehre : date or array of dates
+        tolerance : timedelta, string or scalar, default None
+            Return NaN where the last good value is further than this from
+            the requested date
 
         Notes
         -----
@@ -2481,12 +2489,20 @@ copy : boolean, default False
                 loc -= 1
             while isnull(values[loc]) and loc > 0:
                 loc -= 1
+            if tolerance is not None:
+                locs = np.array([loc], dtype=np.int64)
+                self.index._mask_tolerance([where], locs, tolerance)
+                if locs[0] == -1:
+                    return np.nan
             return values[loc]
 
         if not isinstance(where, Index):
             where = Index(where)
 
         locs = self.index.asof_locs(where, notnull(values))
+        if tolerance is not None:
+            locs = com._ensure_int64(locs)
+            self.index._mask_tolerance(where, locs, tolerance)
         new_values = com.take_1d(values, locs)
         return Series(new_values, index=where, name=self.name)
 
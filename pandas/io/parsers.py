@@ -759,7 +759,7 @@ class TextParser(object):
             index = self._get_simple_index(zipped_content)
             index = self._agg_index(index)
         else:
-            index = Index(np.arange(len(content)))
+            index = com._default_index(len(content))
 
         col_len, zip_len = len(self.columns), len(zipped_content)
         if col_len != zip_len:
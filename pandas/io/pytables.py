@@ -16,10 +16,10 @@ from pandas.sparse.api import SparseSeries, SparseDataFrame, SparsePanel
 from pandas.sparse.array import BlockIndex, IntIndex
 from pandas.tseries.api import PeriodIndex, DatetimeIndex
 from pandas.core.common import adjoin
-from pandas.core.algorithms import match, unique
+from pandas.core.algorithms import unique
 
 from pandas.core.categorical import Factor
-from pandas.core.common import _asarray_tuplesafe
+from pandas.core.index import _pack_labels
 from pandas.core.internals import BlockManager, make_block
 from pandas.core.reshape import block2d_to_block3d
 import pandas.core.common as com
@@ -873,13 +873,10 @@ class HDFStore(object):
             long_index = MultiIndex.from_arrays([index, columns])
             lp = DataFrame(values, index=long_index, columns=fields)
 
-            # need a better algorithm
-            tuple_index = long_index._tuple_index
-
-            unique_tuples = lib.fast_unique(tuple_index)
-            unique_tuples = _asarray_tuplesafe(unique_tuples)
-
-            indexer = match(unique_tuples, tuple_index)
+            # first row of each distinct entry, in order, found on the
+            # packed labels rather than on tuples
+            keys = _pack_labels(long_index.levels, long_index.labels)[0]
+            indexer = np.sort(np.unique(keys, return_index=True)[1])
             indexer = com._ensure_platform_int(indexer)
 
             new_index = long_index.take(indexer)
@@ -499,7 +499,7 @@ class SparseDataFrame(DataFrame):
                                  columns=self.columns)
 
     def _reindex_index(self, index, method, copy, level, fill_value=np.nan,
-                       limit=None):
+                       limit=None, mask_na=False, tolerance=None):
         if level is not None:
             raise Exception('Reindex by level not supported for sparse')
 
@@ -512,7 +512,8 @@ class SparseDataFrame(DataFrame):
         if len(self.index) == 0:
             return SparseDataFrame(index=index, columns=self.columns)
 
-        indexer = self.index.get_indexer(index, method, limit=limit)
+        indexer = self.index.get_indexer(index, method, limit=limit,
+                                         tolerance=tolerance)
         indexer = com._ensure_platform_int(indexer)
         mask = indexer == -1
         need_mask = mask.any()
@@ -546,7 +547,7 @@ class SparseDataFrame(DataFrame):
                                default_fill_value=self.default_fill_value)
 
     def _reindex_with_indexers(self, index, row_indexer, columns, col_indexer,
-                               copy, fill_value):
+                               copy, fill_value, mask_na=False):
         if columns is None:
             columns = self.columns
 
@@ -120,7 +120,7 @@ class SparseSeries(SparseArray, Series):
                 assert(len(values) == sparse_index.npoints)
 
         if index is None:
-            index = Index(np.arange(sparse_index.length))
+            index = common._default_index(sparse_index.length)
         index = _ensure_index(index)
 
         # Create array, do *not* copy data by default
@@ -11,6 +11,8 @@ cnp.import_ufunc()
 cimport util
 
 import numpy as np
+import weakref
+from operator import itemgetter
 
 import _algos
 
@@ -44,10 +46,118 @@ def get_value_at(ndarray arr, object loc):
 def set_value_at(ndarray arr, object loc, object val):
     return util.set_value_at(arr, loc, val)
 
+cdef inline _check_2d_bounds(ndarray arr, Py_ssize_t *i, Py_ssize_t *j):
+    cdef Py_ssize_t n = arr.shape[0], k = arr.shape[1]
+    if i[0] < 0:
+        i[0] += n
+    if j[0] < 0:
+        j[0] += k
+    if not (0 <= i[0] < n and 0 <= j[0] < k):
+        raise IndexError('index out of bounds')
+
+cpdef get_value_2d(ndarray arr, Py_ssize_t i, Py_ssize_t j):
+    '''
+    Return arr[i, j] as a scalar without going through ndarray indexing.
+    datetime64 values are boxed as Timestamp
+    '''
+    _check_2d_bounds(arr, &i, &j)
+    if arr.descr.type_num == NPY_DATETIME:
+        return Timestamp(util.get_value_2d(arr, i, j))
+    return util.get_value_2d(arr, i, j)
+
+cpdef set_value_2d(ndarray arr, Py_ssize_t i, Py_ssize_t j, object value):
+    '''
+    Set arr[i, j] = value, raising ValueError for NaN in an integer array
+    '''
+    _check_2d_bounds(arr, &i, &j)
+    util.assign_value_2d(arr, i, j, convert_scalar(arr, value))
+
 
 # Don't populate hash tables in monotonic indexes larger than this
 cdef int _SIZE_CUTOFF = 1000000
 
+# Lookup strategies, see IndexEngine.strategy
+cdef enum:
+    LOOKUP_AUTO = 0
+    LOOKUP_HASH = 1
+    LOOKUP_BINARY = 2
+    LOOKUP_INTERPOLATION = 3
+
+_lookup_names = ['auto', 'hash', 'binary', 'interpolation']
+
+#----------------------------------------------------------------------
+# Memory budget for engine hash tables
+
+# weak references to the engines currently holding a hash table
+_live_engines = set()
+
+cdef Py_ssize_t _memory_limit = -1
+
+# incremented on every hash table lookup, orders engines by recency of use
+cdef int64_t _clock = 0
+
+def set_engine_memory_limit(limit):
+    '''
+    Limit the combined size in bytes of the hash tables held by index
+    engines. When a new table pushes the total over the limit, the tables of
+    the least recently used engines are dropped; they are rebuilt if needed
+    again. None removes the limit
+    '''
+    global _memory_limit
+    if limit is None:
+        _memory_limit = -1
+    elif limit < 0:
+        raise ValueError('memory limit must be non-negative')
+    else:
+        _memory_limit = limit
+    _enforce_memory_limit(None)
+
+def get_engine_memory_limit():
+    if _memory_limit < 0:
+        return None
+    return _memory_limit
+
+def get_engine_memory_usage():
+    '''
+    Approximate total size in bytes of the hash tables of live index engines
+    '''
+    cdef Py_ssize_t total = 0
+    for engine in _get_live_engines():
+        total += (<IndexEngine> engine).table_nbytes
+    return total
+
+cdef list _get_live_engines():
+    result = []
+    for ref in list(_live_engines):
+        engine = ref()
+        if engine is not None:
+            result.append(engine)
+    return result
+
+cdef _enforce_memory_limit(IndexEngine keep):
+    cdef:
+        IndexEngine engine
+        Py_ssize_t total = 0
+
+    if _memory_limit < 0:
+        return
+
+    candidates = []
+    for engine in _get_live_engines():
+        total += engine.table_nbytes
+        if engine is not keep:
+            candidates.append((engine.last_used, engine))
+
+    if total <= _memory_limit:
+        return
+
+    candidates.sort(key=itemgetter(0))
+    for _, engine in candidates:
+        if total <= _memory_limit:
+            break
+        total -= engine.table_nbytes
+        engine.clear_mapping()
+
 
 cdef class IndexEngine:
 
@@ -55,10 +165,15 @@ cdef class IndexEngine:
         object vgetter
         HashTable mapping
         bint over_size_threshold
+        Py_ssize_t table_nbytes
 
     cdef:
         bint unique, monotonic
         bint initialized, monotonic_check, unique_check
+        int lookup
+        int64_t last_used
+
+    cdef object __weakref__
 
     def __init__(self, vgetter, n):
         self.vgetter = vgetter
@@ -71,9 +186,49 @@ cdef class IndexEngine:
         self.unique = 0
         self.monotonic = 0
 
+        self.lookup = LOOKUP_AUTO
+        self.table_nbytes = 0
+
+    property strategy:
+        '''
+        How labels are located:
+
+        'auto' : hash table, binary search for monotonic indexes with at
+            least _SIZE_CUTOFF elements
+        'hash' : hash table
+        'binary' : binary search if the index is monotonic, else hash table
+        'interpolation' : like 'binary', but int64 / datetime keys are found
+            by interpolation search, which is O(1) for evenly spaced keys
+        '''
+        def __get__(self):
+            return _lookup_names[self.lookup]
+
+        def __set__(self, value):
+            if value not in _lookup_names:
+                raise ValueError('Unknown lookup strategy: %s' % value)
+            self.lookup = _lookup_names.index(value)
+
+            # the hash table is not needed anymore
+            if self._use_sorted():
+                self.clear_mapping()
+
+    cdef inline bint _use_sorted(self) except -1:
+        if self.lookup == LOOKUP_HASH:
+            return 0
+        if self.lookup == LOOKUP_AUTO and not self.over_size_threshold:
+            return 0
+        return self.is_monotonic
+
     def __contains__(self, object val):
-        self._ensure_mapping_populated()
         hash(val)
+        if self._use_sorted():
+            try:
+                self.get_loc(val)
+                return True
+            except KeyError:
+                return False
+
+        self._ensure_mapping_populated()
         return val in self.mapping
 
     cpdef get_value(self, ndarray arr, object key):
@@ -112,14 +267,10 @@ cdef class IndexEngine:
         if is_definitely_invalid_key(val):
             raise TypeError
 
-        if self.over_size_threshold and self.is_monotonic:
+        if self._use_sorted():
             if not self.is_unique:
                 return self._get_loc_duplicates(val)
-            values = self._get_index_values()
-            loc = values.searchsorted(val, side='left')
-            if util.get_value_at(values, loc) != val:
-                raise KeyError(val)
-            return loc
+            return self._get_loc_sorted(val)
 
         self._ensure_mapping_populated()
         if not self.unique:
@@ -131,6 +282,14 @@ cdef class IndexEngine:
             self._check_type(val)
             raise KeyError(val)
 
+    cdef _get_loc_sorted(self, object val):
+        cdef Py_ssize_t loc
+        values = self._get_index_values()
+        loc = values.searchsorted(val, side='left')
+        if loc >= len(values) or util.get_value_at(values, loc) != val:
+            raise KeyError(val)
+        return loc
+
     cdef inline _get_loc_duplicates(self, object val):
         cdef:
             Py_ssize_t diff
@@ -208,12 +367,72 @@ cdef class IndexEngine:
     cdef _get_index_values(self):
         return self.vgetter()
 
+    def set_monotonic_unique(self):
+        '''
+        Record that the index is monotonic and unique without checking, for
+        indexes sorted by construction
+        '''
+        self.monotonic = 1
+        self.unique = 1
+        self.monotonic_check = 1
+        self.unique_check = 1
+
+    def set_known_flags(self, monotonic=None, unique=None):
+        '''
+        Record monotonicity and / or uniqueness known from how the index was
+        produced, skipping the corresponding check. None leaves a flag to be
+        checked on demand
+        '''
+        if monotonic is not None:
+            self.monotonic = monotonic
+            self.monotonic_check = 1
+        if unique is not None:
+            self.unique = unique
+            self.unique_check = 1
+
+    def known_flags(self):
+        '''
+        (monotonic, unique) as determined so far, None where not yet checked
+        '''
+        return (self.monotonic == 1 if self.monotonic_check else None,
+                self.unique == 1 if self.unique_check else None)
+
     cdef inline _do_unique_check(self):
         self._ensure_mapping_populated()
 
     def _call_monotonic(self, values):
         raise NotImplementedError
 
+    def get_nearest_indexer(self, other, tolerance=None):
+        '''
+        Position of the closest label to each element of other, -1 where
+        further than tolerance. Requires monotonic, unique labels
+        '''
+        values, other = self._get_numeric_values(other)
+        if values.dtype == np.int64:
+            if tolerance is not None:
+                tolerance = int(np.floor(tolerance))
+            return _algos.nearest_int64(values, other, tolerance=tolerance)
+        return _algos.nearest_float64(values, other, tolerance=tolerance)
+
+    def mask_tolerance(self, other, ndarray[int64_t] indexer, tolerance):
+        '''
+        Set indexer to -1, in place, where an element of other is further
+        than tolerance from the label it was matched to
+        '''
+        values, other = self._get_numeric_values(other)
+        if values.dtype == np.int64:
+            _algos.mask_tolerance_int64(values, other, indexer,
+                                        int(np.floor(tolerance)))
+        else:
+            _algos.mask_tolerance_float64(values, other, indexer, tolerance)
+
+    def _get_numeric_values(self, other):
+        '''
+        Labels and other as int64 or float64 arrays, to measure distances
+        '''
+        raise TypeError('Cannot measure distances between these labels')
+
     cdef _make_hash_table(self, n):
         raise NotImplementedError
 
@@ -221,8 +440,11 @@ cdef class IndexEngine:
         hash(val)
 
     cdef inline _ensure_mapping_populated(self):
+        global _clock
         if not self.initialized:
             self.initialize()
+        _clock += 1
+        self.last_used = _clock
 
     cdef initialize(self):
         values = self._get_index_values()
@@ -236,14 +458,42 @@ cdef class IndexEngine:
 
         self.initialized = 1
 
+        self.table_nbytes = self.mapping.sizeof()
+        _live_engines.add(weakref.ref(self, _live_engines.discard))
+        _enforce_memory_limit(self)
+
     def clear_mapping(self):
+        if self.initialized:
+            _live_engines.discard(weakref.ref(self))
         self.mapping = None
         self.initialized = 0
+        self.table_nbytes = 0
 
     def get_indexer(self, values):
+        if (self.lookup >= LOOKUP_BINARY and self._use_sorted()
+            and self.is_unique):
+            try:
+                return self._get_indexer_sorted(values)
+            except TypeError:
+                pass
+
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
+    def _get_indexer_sorted(self, target):
+        index_values = self._get_index_values()
+        target = np.asarray(target)
+        n = len(index_values)
+        if n == 0:
+            return np.repeat(-1, len(target)).astype(np.int64)
+
+        locs = index_values.searchsorted(target, side='left')
+        clipped = np.minimum(locs, n - 1)
+        found = index_values.take(clipped) == target
+        if not isinstance(found, np.ndarray):
+            raise TypeError('incomparable values')
+        return np.where(found, locs, -1).astype(np.int64)
+
 
 
 # @cache_readonly
@@ -267,6 +517,29 @@ cdef class Int64Engine(IndexEngine):
     def _call_monotonic(self, values):
         return _algos.is_monotonic_int64(values)
 
+    def _get_numeric_values(self, other):
+        values = self._get_index_values()
+        other = np.asarray(other)
+        if issubclass(other.dtype.type, (np.integer, np.bool_)):
+            return values, other.astype(np.int64)
+        try:
+            return values.astype(np.float64), other.astype(np.float64)
+        except (TypeError, ValueError):
+            raise TypeError('Cannot measure distances to non-numeric labels')
+
+    cdef _get_loc_sorted(self, object val):
+        cdef Py_ssize_t loc
+        if (self.lookup == LOOKUP_INTERPOLATION and
+            util.is_integer_object(val)):
+            try:
+                loc = _interpolation_search(self._get_index_values(), val)
+            except OverflowError:
+                loc = -1
+            if loc == -1:
+                raise KeyError(val)
+            return loc
+        return IndexEngine._get_loc_sorted(self, val)
+
     def get_pad_indexer(self, other, limit=None):
         return _algos.pad_int64(self._get_index_values(), other,
                                   limit=limit)
@@ -316,6 +589,13 @@ cdef class Float64Engine(IndexEngine):
     def _call_monotonic(self, values):
         return _algos.is_monotonic_float64(values)
 
+    def _get_numeric_values(self, other):
+        try:
+            other = np.asarray(other).astype(np.float64)
+        except (TypeError, ValueError):
+            raise TypeError('Cannot measure distances to non-numeric labels')
+        return self._get_index_values(), other
+
     def get_pad_indexer(self, other, limit=None):
         return _algos.pad_float64(self._get_index_values(), other,
                                     limit=limit)
@@ -324,6 +604,8 @@ cdef class Float64Engine(IndexEngine):
         return _algos.backfill_float64(self._get_index_values(), other,
                                          limit=limit)
 
+_numeric_types = set(['integer', 'floating', 'mixed-integer-float'])
+
 _pad_functions = {
     'object' : _algos.pad_object,
     'int64' : _algos.pad_int64,
@@ -346,6 +628,16 @@ cdef class ObjectEngine(IndexEngine):
     def _call_monotonic(self, values):
         return _algos.is_monotonic_object(values)
 
+    def _get_numeric_values(self, other):
+        values = self._get_index_values()
+        other = np.asarray(other)
+        for arr in (values, other):
+            if (arr.dtype == np.object_ and
+                infer_dtype(arr) not in _numeric_types):
+                raise TypeError('Cannot measure distances between '
+                                'non-numeric labels')
+        return values.astype(np.float64), other.astype(np.float64)
+
     def get_pad_indexer(self, other, limit=None):
         return _algos.pad_object(self._get_index_values(), other,
                                    limit=limit)
@@ -355,16 +647,93 @@ cdef class ObjectEngine(IndexEngine):
                                         limit=limit)
 
 
+cdef class StringEngine(ObjectEngine):
+    '''
+    ObjectEngine for indexes of str labels, backed by InternedStringTable
+    '''
+    cdef _make_hash_table(self, n):
+        return InternedStringTable(n)
+
+
+cdef class MultiIndexEngine(Int64Engine):
+    '''
+    Engine over the int64 keys packing the per-level label codes of a
+    MultiIndex (see pandas.core.index._pack_labels), so lookups hash
+    integers instead of materializing and hashing tuples
+    '''
+    cdef readonly:
+        list level_engines, sizes, uniques
+
+    def __init__(self, vgetter, n, level_engines, sizes, uniques):
+        Int64Engine.__init__(self, vgetter, n)
+        self.level_engines = level_engines
+        self.sizes = sizes
+        self.uniques = uniques
+
+    def __contains__(self, object val):
+        try:
+            self.get_loc(val)
+            return True
+        except KeyError:
+            return False
+
+    cpdef pack_key(self, object key):
+        '''
+        Packed int64 key of a full label tuple, KeyError if any element is not
+        in its level
+        '''
+        cdef:
+            Py_ssize_t i, nlevels = len(self.level_engines)
+            int64_t result = 0, code
+            IndexEngine engine
+
+        if not PyTuple_Check(key) or len(key) != nlevels:
+            raise KeyError(key)
+
+        for i in range(nlevels):
+            uniq = self.uniques[i]
+            if uniq is not None:
+                pos = uniq.searchsorted(result)
+                if pos == len(uniq) or uniq[pos] != result:
+                    raise KeyError(key)
+                result = pos
+
+            val = key[i]
+            engine = self.level_engines[i]
+            try:
+                loc = engine.get_loc(val)
+            except KeyError:
+                # NA labels are coded -1
+                if val == val:
+                    raise KeyError(key)
+                code = -1
+            else:
+                if not util.is_integer_object(loc):
+                    raise KeyError(key)
+                code = loc
+            result = result * <int64_t> self.sizes[i] + code + 1
+
+        return result
+
+    cpdef get_loc(self, object val):
+        if is_definitely_invalid_key(val):
+            raise TypeError
+
+        try:
+            return Int64Engine.get_loc(self, self.pack_key(val))
+        except KeyError:
+            raise KeyError(val)
+
+
 cdef class DatetimeEngine(Int64Engine):
 
     def __contains__(self, object val):
-        if self.over_size_threshold and self.is_monotonic:
-            if not self.is_unique:
-                return self._get_loc_duplicates(val)
-            values = self._get_index_values()
-            conv = _to_i8(val)
-            loc = values.searchsorted(conv, side='left')
-            return util.get_value_at(values, loc) == conv
+        if self._use_sorted():
+            try:
+                self.get_loc(val)
+                return True
+            except KeyError:
+                return False
 
         self._ensure_mapping_populated()
         return _to_i8(val) in self.mapping
@@ -375,21 +744,37 @@ cdef class DatetimeEngine(Int64Engine):
     def _call_monotonic(self, values):
         return _algos.is_monotonic_int64(values)
 
+    def _get_numeric_values(self, other):
+        if other.dtype != 'M8[ns]':
+            raise TypeError('Cannot measure distances to non-datetime labels')
+        return self._get_index_values(), np.asarray(other).view('i8')
+
+    def get_nearest_indexer(self, other, tolerance=None):
+        if other.dtype != 'M8[ns]':
+            return np.repeat(-1, len(other)).astype('i8')
+        indexer = Int64Engine.get_nearest_indexer(self, other, tolerance)
+        # NaT is not near anything
+        indexer[np.asarray(other).view('i8') == iNaT] = -1
+        return indexer
+
+    def mask_tolerance(self, other, ndarray[int64_t] indexer, tolerance):
+        Int64Engine.mask_tolerance(self, other, indexer, tolerance)
+        indexer[np.asarray(other).view('i8') == iNaT] = -1
+
     cpdef get_loc(self, object val):
         if is_definitely_invalid_key(val):
             raise TypeError
 
         # Welcome to the spaghetti factory
 
-        if self.over_size_threshold and self.is_monotonic:
-            if not self.is_unique:
-                return self._get_loc_duplicates(val)
-            values = self._get_index_values()
+        if self._use_sorted():
             conv = _to_i8(val)
-            loc = values.searchsorted(conv, side='left')
-            if util.get_value_at(values, loc) != conv:
+            if not self.is_unique:
+                return self._get_loc_duplicates(conv)
+            try:
+                return self._get_loc_sorted(conv)
+            except KeyError:
                 raise KeyError(val)
-            return loc
 
         self._ensure_mapping_populated()
         if not self.unique:
@@ -416,11 +801,10 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
         if values.dtype != 'M8[ns]':
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
-        return self.mapping.lookup(values)
+        return Int64Engine.get_indexer(self, values)
 
     def get_pad_indexer(self, other, limit=None):
         if other.dtype != 'M8[ns]':
@@ -446,12 +830,49 @@ cpdef convert_scalar(ndarray arr, object value):
         else:
             return Timestamp(value).value
 
-    if issubclass(arr.dtype.type, (np.integer, np.bool_)):
+    if cnp.PyArray_ISINTEGER(arr) or cnp.PyArray_ISBOOL(arr):
         if util.is_float_object(value) and value != value:
             raise ValueError('Cannot assign nan to integer series')
 
     return value
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _interpolation_search(ndarray[int64_t] values,
+                                      int64_t val) except -2:
+    '''
+    Position of val in sorted, unique values or -1. Probes where val would
+    be if the keys were evenly spaced, then bisects if that does not
+    converge within a few probes
+    '''
+    cdef:
+        Py_ssize_t lo = 0, hi = len(values) - 1, mid
+        int64_t vlo, vhi
+        int probes = 0
+
+    while lo <= hi:
+        vlo = values[lo]
+        vhi = values[hi]
+        if val < vlo or val > vhi:
+            return -1
+
+        if probes < 4 and vhi != vlo:
+            mid = lo + <Py_ssize_t> ((<double> val - <double> vlo) /
+                                     (<double> vhi - <double> vlo) *
+                                     (hi - lo))
+        else:
+            mid = lo + ((hi - lo) >> 1)
+        probes += 1
+
+        if values[mid] == val:
+            return mid
+        elif values[mid] < val:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+
+    return -1
+
 cdef inline _to_i8(object val):
     cdef pandas_datetimestruct dts
     try:
@@ -46,6 +46,8 @@ PyDateTime_IMPORT
 import_array()
 import_ufunc()
 
+cdef int64_t iNaT = util.get_nat()
+
 cdef int PLATFORM_INT = (<ndarray> np.arange(0, dtype=np.int_)).descr.type_num
 
 cpdef ensure_platform_int(object arr):
@@ -386,6 +388,110 @@ def pad_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
 
 """
 
+nearest_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def nearest_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
+                     tolerance=None):
+    \'\'\'
+    Position in the sorted, unique array old of the element closest to each
+    element of new, ties going to the later element. -1 where new is NaN or
+    the distance exceeds tolerance
+    \'\'\'
+    cdef:
+        Py_ssize_t i, j, lo, hi, mid, pos, nleft, nright
+        ndarray[int64_t] indexer
+        %(c_type)s val, prev_val, dist, left_dist, tol = 0
+        bint check_tol = tolerance is not None
+
+    nleft = len(old)
+    nright = len(new)
+    indexer = np.empty(nright, dtype=np.int64)
+    indexer.fill(-1)
+
+    if check_tol:
+        if tolerance < 0:
+            raise ValueError('Tolerance must be non-negative')
+        tol = tolerance
+
+    if nleft == 0:
+        return indexer
+
+    pos = 0
+    for j in range(nright):
+        val = new[j]
+        if val != val:
+            continue
+
+        # an increasing target only needs to search from the last position
+        if j == 0 or val < prev_val:
+            lo = 0
+        else:
+            lo = pos
+        hi = nleft
+        prev_val = val
+
+        # first position with old[pos] >= val
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if old[mid] < val:
+                lo = mid + 1
+            else:
+                hi = mid
+        pos = lo
+
+        if pos == nleft:
+            i = nleft - 1
+            dist = val - old[i]
+        else:
+            i = pos
+            dist = old[i] - val
+            if pos > 0:
+                left_dist = val - old[pos - 1]
+                if left_dist < dist:
+                    i = pos - 1
+                    dist = left_dist
+
+        if check_tol and dist > tol:
+            continue
+        indexer[j] = i
+
+    return indexer
+
+"""
+
+tolerance_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def mask_tolerance_%(name)s(ndarray[%(c_type)s] old,
+                            ndarray[%(c_type)s] new,
+                            ndarray[int64_t] indexer, tolerance):
+    \'\'\'
+    Set indexer to -1, in place, where an element of new is further than
+    tolerance from the element of old it was matched to
+    \'\'\'
+    cdef:
+        Py_ssize_t j, loc, n
+        %(c_type)s val, tol
+
+    if tolerance < 0:
+        raise ValueError('Tolerance must be non-negative')
+    tol = tolerance
+
+    n = len(new)
+    for j in range(n):
+        loc = indexer[j]
+        if loc == -1:
+            continue
+        val = new[j]
+        if val != val:
+            indexer[j] = -1
+        elif val >= old[loc]:
+            if val - old[loc] > tol:
+                indexer[j] = -1
+        elif old[loc] - val > tol:
+            indexer[j] = -1
+
+"""
+
 pad_1d_template = """@cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_inplace_%(name)s(ndarray[%(c_type)s] values,
@@ -1095,6 +1201,127 @@ def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
 
 # ensure_dtype functions
 
+union_sorted_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def union_sorted_%(name)s(ndarray[%(c_type)s] left,
+                          ndarray[%(c_type)s] right):
+    '''
+    Sorted unique values in either of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        %(c_type)s lval, rval, val
+        ndarray[%(c_type)s] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft + nright, dtype=%(dtype)s)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft or j < nright:
+        if j == nright:
+            val = left[i]
+            i += 1
+        elif i == nleft:
+            val = right[j]
+            j += 1
+        else:
+            lval = left[i]
+            rval = right[j]
+            if lval == rval:
+                val = lval
+                i += 1
+                j += 1
+            elif lval < rval:
+                val = lval
+                i += 1
+            else:
+                val = rval
+                j += 1
+
+        if count == 0 or result[count - 1] != val:
+            result[count] = val
+            count += 1
+
+    return result[:count]
+
+"""
+
+intersection_sorted_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def intersection_sorted_%(name)s(ndarray[%(c_type)s] left,
+                                 ndarray[%(c_type)s] right):
+    '''
+    Sorted unique values in both of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        %(c_type)s lval, rval
+        ndarray[%(c_type)s] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(min(nleft, nright), dtype=%(dtype)s)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            if count == 0 or result[count - 1] != lval:
+                result[count] = lval
+                count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:count]
+
+"""
+
+diff_sorted_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def diff_sorted_%(name)s(ndarray[%(c_type)s] left,
+                         ndarray[%(c_type)s] right):
+    '''
+    Sorted unique values of monotonic array left not in monotonic array
+    right, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        %(c_type)s lval
+        ndarray[%(c_type)s] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft, dtype=%(dtype)s)
+
+    j = 0
+    count = 0
+    for i in range(nleft):
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            continue
+        if count == 0 or result[count - 1] != lval:
+            result[count] = lval
+            count += 1
+
+    return result[:count]
+
+"""
+
 ensure_dtype_template = """
 cpdef ensure_%(name)s(object arr):
     if util.is_array(arr):
@@ -1139,6 +1366,331 @@ def put2d_%(name)s_%(dest_type)s(ndarray[%(c_type)s, ndim=2, cast=True] values,
 """
 
 
+#----------------------------------------------------------------------
+# Group-by aggregation in the input dtype
+
+group_add_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[%(c_type)s, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = %(na_value)s
+            else:
+                out[i, j] = sumx[i, j]
+
+"""
+
+group_nth_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[%(c_type)s, ndim=2] values,
+                   ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                nobs[lab, j] += 1
+                if nobs[lab, j] == rank:
+                    resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] < rank:
+                out[i, j] = %(na_value)s
+            else:
+                out[i, j] = resx[i, j]
+
+"""
+
+group_last_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[%(c_type)s, ndim=2] values,
+                    ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                nobs[lab, j] += 1
+                resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = %(na_value)s
+            else:
+                out[i, j] = resx[i, j]
+
+"""
+
+group_min_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[%(c_type)s, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                if nobs[lab, j] == 0 or val < minx[lab, j]:
+                    minx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = %(na_value)s
+            else:
+                out[i, j] = minx[i, j]
+
+"""
+
+group_max_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[%(c_type)s, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                if nobs[lab, j] == 0 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = %(na_value)s
+            else:
+                out[i, j] = maxx[i, j]
+
+"""
+
+group_count_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_%(name)s(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[%(c_type)s, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                out[lab, j] += 1
+
+"""
+
+group_count_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_%(name)s(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[%(c_type)s, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                out[b, j] += 1
+
+"""
+
+group_cumulative_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_%(how)s_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                    ndarray[%(c_type)s, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running %(how)s within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = %(na_value)s
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if %(notna)s:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    %(update)s
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = %(na_value)s
+
+"""
+
 #-------------------------------------------------------------------------
 # Generators
 
@@ -1202,12 +1754,76 @@ templates_1d = [map_indices_template,
 nobool_1d_templates = [left_join_unique_template,
                        left_join_template,
                        outer_join_template2,
-                       inner_join_template]
+                       inner_join_template,
+                       union_sorted_template,
+                       intersection_sorted_template,
+                       diff_sorted_template]
+
+# need arithmetic on the labels
+numeric_1d_templates = [nearest_template,
+                        tolerance_template]
 
 templates_2d = [take_2d_axis0_template,
                 take_2d_axis1_template,
                 take_2d_multi_template]
 
+# name, ctype, test for a non-null val, value for groups with no valid values
+groupby_function_list = [
+    ('float64', 'float64_t', 'val == val', 'nan'),
+    ('float32', 'float32_t', 'val == val', 'nan'),
+    # no missing values, and groups without rows are dropped anyway
+    ('int64', 'int64_t', 'True', '0'),
+    ('uint64', 'uint64_t', 'True', '0'),
+    ('datetime64', 'int64_t', 'val != iNaT', 'iNaT'),
+    ('object', 'object', 'not _checknull(val)', 'nan'),
+]
+
+def generate_groupby_functions(template, exclude=None):
+    output = StringIO()
+    for name, c_type, notna, na_value in groupby_function_list:
+        if exclude is not None and name in exclude:
+            continue
+
+        func = template % {'name': name, 'c_type': c_type,
+                           'notna': notna, 'na_value': na_value}
+        output.write(func)
+    return output.getvalue()
+
+groupby_arith_templates = [group_add_template]
+
+groupby_select_templates = [group_nth_template,
+                            group_last_template,
+                            group_min_template,
+                            group_max_template]
+
+groupby_count_templates = [group_count_template,
+                           group_count_bin_template]
+
+# how, update of accum[lab, j] by val, dtypes
+group_cumulative_list = [
+    ('cumsum', 'accum[lab, j] += val', ['float64', 'int64']),
+    ('cumprod', 'accum[lab, j] *= val', ['float64', 'int64']),
+    ('cummin', ('if val < accum[lab, j]:\n'
+                '                        accum[lab, j] = val'),
+     ['float64', 'int64', 'datetime64']),
+    ('cummax', ('if val > accum[lab, j]:\n'
+                '                        accum[lab, j] = val'),
+     ['float64', 'int64', 'datetime64']),
+]
+
+def generate_group_cumulative():
+    output = StringIO()
+    for how, update, dtypes in group_cumulative_list:
+        for name, c_type, notna, na_value in groupby_function_list:
+            if name not in dtypes:
+                continue
+
+            func = group_cumulative_template % {
+                'how': how, 'update': update, 'name': name, 'c_type': c_type,
+                'notna': notna, 'na_value': na_value}
+            output.write(func)
+    return output.getvalue()
+
 def generate_take_cython_file(path='generated.pyx'):
     with open(path, 'w') as f:
         print >> f, header
@@ -1229,5 +1845,23 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in nobool_1d_templates:
             print >> f, generate_from_template(template, exclude=['bool'])
 
+        for template in numeric_1d_templates:
+            print >> f, generate_from_template(template,
+                                               exclude=['object', 'bool'])
+
+        # the float64 versions live in groupby.pyx
+        for template in groupby_arith_templates:
+            print >> f, generate_groupby_functions(
+                template, exclude=['float64', 'datetime64', 'object'])
+
+        for template in groupby_select_templates:
+            print >> f, generate_groupby_functions(template,
+                                                   exclude=['float64'])
+
+        for template in groupby_count_templates:
+            print >> f, generate_groupby_functions(template)
+
+        print >> f, generate_group_cumulative()
+
 if __name__ == '__main__':
     generate_take_cython_file()
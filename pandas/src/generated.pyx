@@ -43,6 +43,8 @@ PyDateTime_IMPORT
 import_array()
 import_ufunc()
 
+cdef int64_t iNaT = util.get_nat()
+
 cdef int PLATFORM_INT = (<ndarray> np.arange(0, dtype=np.int_)).descr.type_num
 
 cpdef ensure_platform_int(object arr):
@@ -4015,3 +4017,2495 @@ def inner_join_indexer_int64(ndarray[int64_t] left,
     return result, lindexer, rindexer
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def union_sorted_float64(ndarray[float64_t] left,
+                          ndarray[float64_t] right):
+    '''
+    Sorted unique values in either of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        float64_t lval, rval, val
+        ndarray[float64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft + nright, dtype=np.float64)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft or j < nright:
+        if j == nright:
+            val = left[i]
+            i += 1
+        elif i == nleft:
+            val = right[j]
+            j += 1
+        else:
+            lval = left[i]
+            rval = right[j]
+            if lval == rval:
+                val = lval
+                i += 1
+                j += 1
+            elif lval < rval:
+                val = lval
+                i += 1
+            else:
+                val = rval
+                j += 1
+
+        if count == 0 or result[count - 1] != val:
+            result[count] = val
+            count += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def union_sorted_object(ndarray[object] left,
+                          ndarray[object] right):
+    '''
+    Sorted unique values in either of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        object lval, rval, val
+        ndarray[object] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft + nright, dtype=object)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft or j < nright:
+        if j == nright:
+            val = left[i]
+            i += 1
+        elif i == nleft:
+            val = right[j]
+            j += 1
+        else:
+            lval = left[i]
+            rval = right[j]
+            if lval == rval:
+                val = lval
+                i += 1
+                j += 1
+            elif lval < rval:
+                val = lval
+                i += 1
+            else:
+                val = rval
+                j += 1
+
+        if count == 0 or result[count - 1] != val:
+            result[count] = val
+            count += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def union_sorted_int32(ndarray[int32_t] left,
+                          ndarray[int32_t] right):
+    '''
+    Sorted unique values in either of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int32_t lval, rval, val
+        ndarray[int32_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft + nright, dtype=np.int32)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft or j < nright:
+        if j == nright:
+            val = left[i]
+            i += 1
+        elif i == nleft:
+            val = right[j]
+            j += 1
+        else:
+            lval = left[i]
+            rval = right[j]
+            if lval == rval:
+                val = lval
+                i += 1
+                j += 1
+            elif lval < rval:
+                val = lval
+                i += 1
+            else:
+                val = rval
+                j += 1
+
+        if count == 0 or result[count - 1] != val:
+            result[count] = val
+            count += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def union_sorted_int64(ndarray[int64_t] left,
+                          ndarray[int64_t] right):
+    '''
+    Sorted unique values in either of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int64_t lval, rval, val
+        ndarray[int64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft + nright, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft or j < nright:
+        if j == nright:
+            val = left[i]
+            i += 1
+        elif i == nleft:
+            val = right[j]
+            j += 1
+        else:
+            lval = left[i]
+            rval = right[j]
+            if lval == rval:
+                val = lval
+                i += 1
+                j += 1
+            elif lval < rval:
+                val = lval
+                i += 1
+            else:
+                val = rval
+                j += 1
+
+        if count == 0 or result[count - 1] != val:
+            result[count] = val
+            count += 1
+
+    return result[:count]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def intersection_sorted_float64(ndarray[float64_t] left,
+                                 ndarray[float64_t] right):
+    '''
+    Sorted unique values in both of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        float64_t lval, rval
+        ndarray[float64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(min(nleft, nright), dtype=np.float64)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            if count == 0 or result[count - 1] != lval:
+                result[count] = lval
+                count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def intersection_sorted_object(ndarray[object] left,
+                                 ndarray[object] right):
+    '''
+    Sorted unique values in both of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        object lval, rval
+        ndarray[object] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(min(nleft, nright), dtype=object)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            if count == 0 or result[count - 1] != lval:
+                result[count] = lval
+                count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def intersection_sorted_int32(ndarray[int32_t] left,
+                                 ndarray[int32_t] right):
+    '''
+    Sorted unique values in both of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int32_t lval, rval
+        ndarray[int32_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(min(nleft, nright), dtype=np.int32)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            if count == 0 or result[count - 1] != lval:
+                result[count] = lval
+                count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def intersection_sorted_int64(ndarray[int64_t] left,
+                                 ndarray[int64_t] right):
+    '''
+    Sorted unique values in both of two monotonic arrays, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int64_t lval, rval
+        ndarray[int64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(min(nleft, nright), dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            if count == 0 or result[count - 1] != lval:
+                result[count] = lval
+                count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:count]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def diff_sorted_float64(ndarray[float64_t] left,
+                         ndarray[float64_t] right):
+    '''
+    Sorted unique values of monotonic array left not in monotonic array
+    right, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        float64_t lval
+        ndarray[float64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft, dtype=np.float64)
+
+    j = 0
+    count = 0
+    for i in range(nleft):
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            continue
+        if count == 0 or result[count - 1] != lval:
+            result[count] = lval
+            count += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def diff_sorted_object(ndarray[object] left,
+                         ndarray[object] right):
+    '''
+    Sorted unique values of monotonic array left not in monotonic array
+    right, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        object lval
+        ndarray[object] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft, dtype=object)
+
+    j = 0
+    count = 0
+    for i in range(nleft):
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            continue
+        if count == 0 or result[count - 1] != lval:
+            result[count] = lval
+            count += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def diff_sorted_int32(ndarray[int32_t] left,
+                         ndarray[int32_t] right):
+    '''
+    Sorted unique values of monotonic array left not in monotonic array
+    right, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int32_t lval
+        ndarray[int32_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft, dtype=np.int32)
+
+    j = 0
+    count = 0
+    for i in range(nleft):
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            continue
+        if count == 0 or result[count - 1] != lval:
+            result[count] = lval
+            count += 1
+
+    return result[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def diff_sorted_int64(ndarray[int64_t] left,
+                         ndarray[int64_t] right):
+    '''
+    Sorted unique values of monotonic array left not in monotonic array
+    right, in one merge pass
+    '''
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int64_t lval
+        ndarray[int64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    result = np.empty(nleft, dtype=np.int64)
+
+    j = 0
+    count = 0
+    for i in range(nleft):
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            continue
+        if count == 0 or result[count - 1] != lval:
+            result[count] = lval
+            count += 1
+
+    return result[:count]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nearest_float64(ndarray[float64_t] old, ndarray[float64_t] new,
+                     tolerance=None):
+    '''
+    Position in the sorted, unique array old of the element closest to each
+    element of new, ties going to the later element. -1 where new is NaN or
+    the distance exceeds tolerance
+    '''
+    cdef:
+        Py_ssize_t i, j, lo, hi, mid, pos, nleft, nright
+        ndarray[int64_t] indexer
+        float64_t val, prev_val, dist, left_dist, tol = 0
+        bint check_tol = tolerance is not None
+
+    nleft = len(old)
+    nright = len(new)
+    indexer = np.empty(nright, dtype=np.int64)
+    indexer.fill(-1)
+
+    if check_tol:
+        if tolerance < 0:
+            raise ValueError('Tolerance must be non-negative')
+        tol = tolerance
+
+    if nleft == 0:
+        return indexer
+
+    pos = 0
+    for j in range(nright):
+        val = new[j]
+        if val != val:
+            continue
+
+        # an increasing target only needs to search from the last position
+        if j == 0 or val < prev_val:
+            lo = 0
+        else:
+            lo = pos
+        hi = nleft
+        prev_val = val
+
+        # first position with old[pos] >= val
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if old[mid] < val:
+                lo = mid + 1
+            else:
+                hi = mid
+        pos = lo
+
+        if pos == nleft:
+            i = nleft - 1
+            dist = val - old[i]
+        else:
+            i = pos
+            dist = old[i] - val
+            if pos > 0:
+                left_dist = val - old[pos - 1]
+                if left_dist < dist:
+                    i = pos - 1
+                    dist = left_dist
+
+        if check_tol and dist > tol:
+            continue
+        indexer[j] = i
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nearest_int32(ndarray[int32_t] old, ndarray[int32_t] new,
+                     tolerance=None):
+    '''
+    Position in the sorted, unique array old of the element closest to each
+    element of new, ties going to the later element. -1 where new is NaN or
+    the distance exceeds tolerance
+    '''
+    cdef:
+        Py_ssize_t i, j, lo, hi, mid, pos, nleft, nright
+        ndarray[int64_t] indexer
+        int32_t val, prev_val, dist, left_dist, tol = 0
+        bint check_tol = tolerance is not None
+
+    nleft = len(old)
+    nright = len(new)
+    indexer = np.empty(nright, dtype=np.int64)
+    indexer.fill(-1)
+
+    if check_tol:
+        if tolerance < 0:
+            raise ValueError('Tolerance must be non-negative')
+        tol = tolerance
+
+    if nleft == 0:
+        return indexer
+
+    pos = 0
+    for j in range(nright):
+        val = new[j]
+        if val != val:
+            continue
+
+        # an increasing target only needs to search from the last position
+        if j == 0 or val < prev_val:
+            lo = 0
+        else:
+            lo = pos
+        hi = nleft
+        prev_val = val
+
+        # first position with old[pos] >= val
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if old[mid] < val:
+                lo = mid + 1
+            else:
+                hi = mid
+        pos = lo
+
+        if pos == nleft:
+            i = nleft - 1
+            dist = val - old[i]
+        else:
+            i = pos
+            dist = old[i] - val
+            if pos > 0:
+                left_dist = val - old[pos - 1]
+                if left_dist < dist:
+                    i = pos - 1
+                    dist = left_dist
+
+        if check_tol and dist > tol:
+            continue
+        indexer[j] = i
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nearest_int64(ndarray[int64_t] old, ndarray[int64_t] new,
+                     tolerance=None):
+    '''
+    Position in the sorted, unique array old of the element closest to each
+    element of new, ties going to the later element. -1 where new is NaN or
+    the distance exceeds tolerance
+    '''
+    cdef:
+        Py_ssize_t i, j, lo, hi, mid, pos, nleft, nright
+        ndarray[int64_t] indexer
+        int64_t val, prev_val, dist, left_dist, tol = 0
+        bint check_tol = tolerance is not None
+
+    nleft = len(old)
+    nright = len(new)
+    indexer = np.empty(nright, dtype=np.int64)
+    indexer.fill(-1)
+
+    if check_tol:
+        if tolerance < 0:
+            raise ValueError('Tolerance must be non-negative')
+        tol = tolerance
+
+    if nleft == 0:
+        return indexer
+
+    pos = 0
+    for j in range(nright):
+        val = new[j]
+        if val != val:
+            continue
+
+        # an increasing target only needs to search from the last position
+        if j == 0 or val < prev_val:
+            lo = 0
+        else:
+            lo = pos
+        hi = nleft
+        prev_val = val
+
+        # first position with old[pos] >= val
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if old[mid] < val:
+                lo = mid + 1
+            else:
+                hi = mid
+        pos = lo
+
+        if pos == nleft:
+            i = nleft - 1
+            dist = val - old[i]
+        else:
+            i = pos
+            dist = old[i] - val
+            if pos > 0:
+                left_dist = val - old[pos - 1]
+                if left_dist < dist:
+                    i = pos - 1
+                    dist = left_dist
+
+        if check_tol and dist > tol:
+            continue
+        indexer[j] = i
+
+    return indexer
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def mask_tolerance_float64(ndarray[float64_t] old,
+                            ndarray[float64_t] new,
+                            ndarray[int64_t] indexer, tolerance):
+    '''
+    Set indexer to -1, in place, where an element of new is further than
+    tolerance from the element of old it was matched to
+    '''
+    cdef:
+        Py_ssize_t j, loc, n
+        float64_t val, tol
+
+    if tolerance < 0:
+        raise ValueError('Tolerance must be non-negative')
+    tol = tolerance
+
+    n = len(new)
+    for j in range(n):
+        loc = indexer[j]
+        if loc == -1:
+            continue
+        val = new[j]
+        if val != val:
+            indexer[j] = -1
+        elif val >= old[loc]:
+            if val - old[loc] > tol:
+                indexer[j] = -1
+        elif old[loc] - val > tol:
+            indexer[j] = -1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def mask_tolerance_int32(ndarray[int32_t] old,
+                            ndarray[int32_t] new,
+                            ndarray[int64_t] indexer, tolerance):
+    '''
+    Set indexer to -1, in place, where an element of new is further than
+    tolerance from the element of old it was matched to
+    '''
+    cdef:
+        Py_ssize_t j, loc, n
+        int32_t val, tol
+
+    if tolerance < 0:
+        raise ValueError('Tolerance must be non-negative')
+    tol = tolerance
+
+    n = len(new)
+    for j in range(n):
+        loc = indexer[j]
+        if loc == -1:
+            continue
+        val = new[j]
+        if val != val:
+            indexer[j] = -1
+        elif val >= old[loc]:
+            if val - old[loc] > tol:
+                indexer[j] = -1
+        elif old[loc] - val > tol:
+            indexer[j] = -1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def mask_tolerance_int64(ndarray[int64_t] old,
+                            ndarray[int64_t] new,
+                            ndarray[int64_t] indexer, tolerance):
+    '''
+    Set indexer to -1, in place, where an element of new is further than
+    tolerance from the element of old it was matched to
+    '''
+    cdef:
+        Py_ssize_t j, loc, n
+        int64_t val, tol
+
+    if tolerance < 0:
+        raise ValueError('Tolerance must be non-negative')
+    tol = tolerance
+
+    n = len(new)
+    for j in range(n):
+        loc = indexer[j]
+        if loc == -1:
+            continue
+        val = new[j]
+        if val != val:
+            indexer[j] = -1
+        elif val >= old[loc]:
+            if val - old[loc] > tol:
+                indexer[j] = -1
+        elif old[loc] - val > tol:
+            indexer[j] = -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_float32(ndarray[float32_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float32_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+        ndarray[float32_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = sumx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_int64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = sumx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_uint64(ndarray[uint64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[uint64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        uint64_t val
+        ndarray[uint64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = sumx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_float32(ndarray[float32_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float32_t, ndim=2] values,
+                   ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                nobs[lab, j] += 1
+                if nobs[lab, j] == rank:
+                    resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] < rank:
+                out[i, j] = nan
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_int64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                nobs[lab, j] += 1
+                if nobs[lab, j] == rank:
+                    resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] < rank:
+                out[i, j] = 0
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_uint64(ndarray[uint64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[uint64_t, ndim=2] values,
+                   ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        uint64_t val
+        ndarray[uint64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                nobs[lab, j] += 1
+                if nobs[lab, j] == rank:
+                    resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] < rank:
+                out[i, j] = 0
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_datetime64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                nobs[lab, j] += 1
+                if nobs[lab, j] == rank:
+                    resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] < rank:
+                out[i, j] = iNaT
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_object(ndarray[object, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[object, ndim=2] values,
+                   ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+        ndarray[object, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if not _checknull(val):
+                nobs[lab, j] += 1
+                if nobs[lab, j] == rank:
+                    resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] < rank:
+                out[i, j] = nan
+            else:
+                out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_float32(ndarray[float32_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[float32_t, ndim=2] values,
+                    ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                nobs[lab, j] += 1
+                resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_int64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                nobs[lab, j] += 1
+                resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_uint64(ndarray[uint64_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[uint64_t, ndim=2] values,
+                    ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        uint64_t val
+        ndarray[uint64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                nobs[lab, j] += 1
+                resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_datetime64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                nobs[lab, j] += 1
+                resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = iNaT
+            else:
+                out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_object(ndarray[object, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[object, ndim=2] values,
+                    ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+        ndarray[object, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if not _checknull(val):
+                nobs[lab, j] += 1
+                resx[lab, j] = val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_float32(ndarray[float32_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float32_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+        ndarray[float32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                if nobs[lab, j] == 0 or val < minx[lab, j]:
+                    minx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_int64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if nobs[lab, j] == 0 or val < minx[lab, j]:
+                    minx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_uint64(ndarray[uint64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[uint64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        uint64_t val
+        ndarray[uint64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if nobs[lab, j] == 0 or val < minx[lab, j]:
+                    minx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_datetime64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                if nobs[lab, j] == 0 or val < minx[lab, j]:
+                    minx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = iNaT
+            else:
+                out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_object(ndarray[object, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[object, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+        ndarray[object, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    minx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if not _checknull(val):
+                if nobs[lab, j] == 0 or val < minx[lab, j]:
+                    minx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = minx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_float32(ndarray[float32_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float32_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+        ndarray[float32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                if nobs[lab, j] == 0 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_int64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if nobs[lab, j] == 0 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_uint64(ndarray[uint64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[uint64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        uint64_t val
+        ndarray[uint64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if nobs[lab, j] == 0 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = 0
+            else:
+                out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_datetime64(ndarray[int64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[int64_t, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                if nobs[lab, j] == 0 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = iNaT
+            else:
+                out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_object(ndarray[object, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[object, ndim=2] values,
+                   ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+        ndarray[object, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    maxx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if not _checknull(val):
+                if nobs[lab, j] == 0 or val > maxx[lab, j]:
+                    maxx[lab, j] = val
+                nobs[lab, j] += 1
+
+    for i in range(len(counts)):
+        for j in range(K):
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = maxx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_float64(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[float64_t, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                out[lab, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_float32(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[float32_t, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                out[lab, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_int64(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[int64_t, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                out[lab, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_uint64(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[uint64_t, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        uint64_t val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                out[lab, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_datetime64(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[int64_t, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                out[lab, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_object(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[object, ndim=2] values,
+                     ndarray[int64_t] labels):
+    '''
+    Number of non-null values in each group, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        object val
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if not _checknull(val):
+                out[lab, j] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_float64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[float64_t, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                out[b, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_float32(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[float32_t, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                out[b, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_int64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[int64_t, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                out[b, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_uint64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[uint64_t, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        uint64_t val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                out[b, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_datetime64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[int64_t, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                out[b, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_object(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[object, ndim=2] values,
+                         ndarray[int64_t] bins):
+    '''
+    Number of non-null values in each bin, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        object val
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    out[:] = 0
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            if not _checknull(val):
+                out[b, j] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_float64(ndarray[float64_t, ndim=2] out,
+                    ndarray[float64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cumsum within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = nan
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    accum[lab, j] += val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = nan
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_int64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cumsum within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = 0
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    accum[lab, j] += val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_float64(ndarray[float64_t, ndim=2] out,
+                    ndarray[float64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cumprod within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = nan
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = nan
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_int64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cumprod within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = 0
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_float64(ndarray[float64_t, ndim=2] out,
+                    ndarray[float64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cummin within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = nan
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    if val < accum[lab, j]:
+                        accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = nan
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_int64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cummin within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = 0
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    if val < accum[lab, j]:
+                        accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_datetime64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cummin within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = iNaT
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    if val < accum[lab, j]:
+                        accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = iNaT
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_float64(ndarray[float64_t, ndim=2] out,
+                    ndarray[float64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cummax within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = nan
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if val == val:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    if val > accum[lab, j]:
+                        accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = nan
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_int64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cummax within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = 0
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if True:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    if val > accum[lab, j]:
+                        accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_datetime64(ndarray[int64_t, ndim=2] out,
+                    ndarray[int64_t, ndim=2] values,
+                    ndarray[int64_t] labels, Py_ssize_t ngroups):
+    '''
+    Running cummax within each group in row order. Missing values, and rows
+    with a missing label, are left missing
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    N, K = (<object> values).shape
+
+    accum = np.empty((ngroups, K), dtype=(<object> values).dtype)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            for j in range(K):
+                out[i, j] = iNaT
+            continue
+
+        for j in range(K):
+            val = values[i, j]
+
+            if val != iNaT:
+                if not seen[lab, j]:
+                    seen[lab, j] = 1
+                    accum[lab, j] = val
+                else:
+                    if val > accum[lab, j]:
+                        accum[lab, j] = val
+                out[i, j] = accum[lab, j]
+            else:
+                out[i, j] = iNaT
+
+
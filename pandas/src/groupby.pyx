@@ -241,33 +241,34 @@ def group_add(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
     for i in range(len(counts)):
         for j in range(K):
@@ -295,33 +296,34 @@ def group_prod(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        prodx[lab, j] *= val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    prodx[lab, j] *= val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                prodx[lab, 0] *= val
+                    nobs[lab, 0] += 1
+                    prodx[lab, 0] *= val
 
     for i in range(len(counts)):
         for j in range(K):
@@ -353,20 +355,21 @@ def group_nth(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    for i in range(N):
-        lab = labels[i]
-        if lab < 0:
-            continue
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-        counts[lab] += 1
-        for j in range(K):
-            val = values[i, j]
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-            # not nan
-            if val == val:
-                nobs[lab, j] += 1
-                if nobs[lab, j] == rank:
-                    resx[lab, j] = val
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
 
     for i in range(len(counts)):
         for j in range(K):
@@ -400,20 +403,21 @@ def group_nth_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    for i in range(N):
-        while b < ngroups - 1 and i >= bins[b]:
-            b += 1
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-        counts[b] += 1
-        for j in range(K):
-            val = values[i, j]
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-            # not nan
-            if val == val:
-                nobs[b, j] += 1
-                if nobs[b, j] == rank:
-                    resx[b, j] = val
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
 
     for i in range(ngroups):
         for j in range(K):
@@ -442,19 +446,20 @@ def group_last(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    for i in range(N):
-        lab = labels[i]
-        if lab < 0:
-            continue
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-        counts[lab] += 1
-        for j in range(K):
-            val = values[i, j]
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-            # not nan
-            if val == val:
-                nobs[lab, j] += 1
-                resx[lab, j] = val
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
 
     for i in range(len(counts)):
         for j in range(K):
@@ -488,19 +493,20 @@ def group_last_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    for i in range(N):
-        while b < ngroups - 1 and i >= bins[b]:
-            b += 1
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-        counts[b] += 1
-        for j in range(K):
-            val = values[i, j]
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-            # not nan
-            if val == val:
-                nobs[b, j] += 1
-                resx[b, j] = val
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
 
     for i in range(ngroups):
         for j in range(K):
@@ -534,35 +540,36 @@ def group_min(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    if val < minx[lab, j]:
-                        minx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val < minx[lab, 0]:
-                    minx[lab, 0] = val
+                    nobs[lab, 0] += 1
+                    if val < minx[lab, 0]:
+                        minx[lab, 0] = val
 
     for i in range(len(counts)):
         for j in range(K):
@@ -593,35 +600,36 @@ def group_max(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    if val > maxx[lab, j]:
-                        maxx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val > maxx[lab, 0]:
-                    maxx[lab, 0] = val
+                    nobs[lab, 0] += 1
+                    if val > maxx[lab, 0]:
+                        maxx[lab, 0] = val
 
     for i in range(len(counts)):
         for j in range(K):
@@ -647,7 +655,127 @@ def group_mean(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if K > 1:
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+
+    for i in range(len(counts)):
+        for j in range(K):
+            count = nobs[i, j]
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = sumx[i, j] / count
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_var(ndarray[float64_t, ndim=2] out,
+              ndarray[int64_t] counts,
+              ndarray[float64_t, ndim=2] values,
+              ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val, ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros_like(out)
+    sumx = np.zeros_like(out)
+    sumxx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+                        sumxx[lab, j] += val * val
+        else:
+            for i in range(N):
+
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+                    sumxx[lab, 0] += val * val
+
+
+    for i in range(len(counts)):
+        for j in range(K):
+            ct = nobs[i, j]
+            if ct < 2:
+                out[i, j] = nan
+            else:
+                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                             (ct * ct - ct))
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_summary(ndarray[float64_t, ndim=2] nobs,
+                  ndarray[float64_t, ndim=2] sumx,
+                  ndarray[float64_t, ndim=2] sumxx,
+                  ndarray[float64_t, ndim=2] minx,
+                  ndarray[float64_t, ndim=2] maxx,
+                  ndarray[int64_t] counts,
+                  ndarray[float64_t, ndim=2] values,
+                  ndarray[int64_t] labels):
+    '''
+    Count, sum, sum of squares, min and max of the non-null values in each
+    group in one pass, for aggregating several statistics at once. Only
+    aggregates on axis=0. The outputs must be zeroed, minx and maxx are
+    left at +inf and -inf for groups without values
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    N, K = (<object> values).shape
+
+    minx.fill(np.inf)
+    maxx.fill(-np.inf)
+
+    with nogil:
         for i in range(N):
             lab = labels[i]
             if lab < 0:
@@ -656,89 +784,515 @@ def group_mean(ndarray[float64_t, ndim=2] out,
             counts[lab] += 1
             for j in range(K):
                 val = values[i, j]
+
                 # not nan
                 if val == val:
                     nobs[lab, j] += 1
                     sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    sumxx[lab, j] += val * val
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_sem(ndarray[float64_t, ndim=2] out,
+              ndarray[int64_t] counts,
+              ndarray[float64_t, ndim=2] values,
+              ndarray[int64_t] labels):
+    '''
+    Standard error of the mean, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val, ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros_like(out)
+    sumx = np.zeros_like(out)
+    sumxx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j in range(K):
+            val = values[i, j]
 
-            counts[lab] += 1
-            val = values[i, 0]
             # not nan
             if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
+                sumxx[lab, j] += val * val
 
     for i in range(len(counts)):
         for j in range(K):
-            count = nobs[i, j]
-            if nobs[i, j] == 0:
+            ct = nobs[i, j]
+            if ct < 2:
                 out[i, j] = nan
             else:
-                out[i, j] = sumx[i, j] / count
+                out[i, j] = sqrt((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * ct - ct) / ct)
+
+cdef inline float64_t _kth_smallest(float64_t *a, Py_ssize_t n,
+                                    Py_ssize_t k):
+    # Wirth's selection, as in kth_smallest. Leaves a[:k] <= a[k] <= a[k + 1:]
+    cdef:
+        Py_ssize_t i, j, l, m
+        float64_t x, t
+
+    l = 0
+    m = n - 1
+    while l < m:
+        x = a[k]
+        i = l
+        j = m
+
+        while 1:
+            while a[i] < x: i += 1
+            while x < a[j]: j -= 1
+            if i <= j:
+                t = a[i]
+                a[i] = a[j]
+                a[j] = t
+                i += 1; j -= 1
+
+            if i > j: break
+
+        if j < k: l = i
+        if k < i: m = j
+    return a[k]
+
+cdef inline float64_t _buffer_quantile(float64_t *a, Py_ssize_t n, double q):
+    # linear interpolation between the closest ranks, like
+    # scoreatpercentile. Reorders a[:n]
+    cdef:
+        Py_ssize_t i, k
+        float64_t idx, frac, lower, upper
+
+    if n == 0:
+        return nan
+
+    idx = q * (n - 1)
+    k = <Py_ssize_t> idx
+    frac = idx - k
+
+    lower = _kth_smallest(a, n, k)
+    if frac == 0:
+        return lower
+
+    upper = a[k + 1]
+    for i in range(k + 2, n):
+        if a[i] < upper:
+            upper = a[i]
+    return lower + (upper - lower) * frac
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def group_var(ndarray[float64_t, ndim=2] out,
-              ndarray[int64_t] counts,
-              ndarray[float64_t, ndim=2] values,
-              ndarray[int64_t] labels):
+def group_quantile(ndarray[float64_t, ndim=2] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float64_t, ndim=2] values,
+                   ndarray[int64_t] labels, double q):
+    '''
+    q-th quantile of the non-null values in each group, interpolated like
+    Series.quantile. Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, ngroups, start, end, n
+        float64_t val
+        ndarray[int64_t] indexer, _counts
+        ndarray[float64_t] buf
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1')
+
+    ngroups = len(counts)
+    N, K = (<object> values).shape
+
+    # rows ordered by group, NA group first
+    indexer, _counts = groupsort_indexer(labels, ngroups)
+    for i in range(ngroups):
+        counts[i] += _counts[i + 1]
+
+    buf = np.empty(N, dtype=np.float64)
+
+    for j in range(K):
+        end = _counts[0]
+        for i in range(ngroups):
+            start = end
+            end = start + _counts[i + 1]
+
+            n = 0
+            for k in range(start, end):
+                val = values[indexer[k], j]
+
+                # not nan
+                if val == val:
+                    buf[n] = val
+                    n += 1
+
+            out[i, j] = _buffer_quantile(<float64_t*> buf.data, n, q)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique(ndarray[int64_t, ndim=2] out,
+                  ndarray[int64_t] counts,
+                  ndarray[int64_t, ndim=2] values,
+                  ndarray[int64_t] labels):
+    '''
+    Number of distinct values in each group. Takes factorized values, with
+    -1 for nulls. Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, ngroups, start, end, code, nuniques = 0
+        ndarray[int64_t] indexer, _counts, seen
+
+    ngroups = len(counts)
+    N, K = (<object> values).shape
+
+    indexer, _counts = groupsort_indexer(labels, ngroups)
+    for i in range(ngroups):
+        counts[i] += _counts[i + 1]
+
+    for i in range(N):
+        for j in range(K):
+            if values[i, j] >= nuniques:
+                nuniques = values[i, j] + 1
+
+    # group in which each value was last seen
+    seen = np.empty(nuniques, dtype=np.int64)
+
+    for j in range(K):
+        seen.fill(-1)
+        end = _counts[0]
+        for i in range(ngroups):
+            start = end
+            end = start + _counts[i + 1]
+
+            out[i, j] = 0
+            for k in range(start, end):
+                code = values[indexer[k], j]
+                if code >= 0 and seen[code] != i:
+                    seen[code] = i
+                    out[i, j] += 1
+
+#----------------------------------------------------------------------
+# mergeable aggregate states
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_moments(ndarray[float64_t, ndim=2] nobs,
+                  ndarray[float64_t, ndim=2] mean,
+                  ndarray[float64_t, ndim=2] m2,
+                  ndarray[float64_t, ndim=2] values,
+                  ndarray[int64_t] labels):
+    '''
+    Count, mean and sum of squared deviations from the mean of the non-null
+    values in each group, updated in one pass (Welford). The outputs must be
+    zeroed. Only aggregates on axis=0
+    '''
     cdef:
         Py_ssize_t i, j, N, K, lab
-        float64_t val, ct
-        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+        float64_t val, delta
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    delta = val - mean[lab, j]
+                    mean[lab, j] += delta / nobs[lab, j]
+                    m2[lab, j] += delta * (val - mean[lab, j])
+
+cdef inline uint64_t _mix64(uint64_t x) nogil:
+    # splitmix64 finalizer, spreads the bits of hash codes
+    x = (x ^ (x >> 30)) * <uint64_t> 0xbf58476d1ce4e5b9ULL
+    x = (x ^ (x >> 27)) * <uint64_t> 0x94d049bb133111ebULL
+    return x ^ (x >> 31)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_hll_update(ndarray[uint8_t, ndim=3] registers,
+                     ndarray[uint64_t, ndim=2] hashes,
+                     ndarray[uint8_t, ndim=2, cast=True] mask,
+                     ndarray[int64_t] labels, int precision):
+    '''
+    Add the hashed values not marked missing by mask to the HyperLogLog
+    registers (ngroups x K x 2**precision) of their group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, idx
+        uint64_t h, top = (<uint64_t> 1) << 63
+        uint8_t rank, max_rank = 64 - precision + 1
+
+    N, K = (<object> hashes).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                if mask[i, j]:
+                    continue
+
+                h = _mix64(hashes[i, j])
+                idx = h >> (64 - precision)
+                h = h << precision
+
+                # position of the first set bit after the index bits
+                rank = 1
+                while rank < max_rank and not (h & top):
+                    h = h << 1
+                    rank += 1
+
+                if rank > registers[lab, j, idx]:
+                    registers[lab, j, idx] = rank
+
+def hash_object_array(ndarray[object] values):
+    '''
+    64-bit hash codes of the values, for sketches. Numbers hash as their
+    float64 bits, like numeric arrays do, and strings as the FNV-1a hash of
+    their (utf-8) bytes, so the codes agree across processes. Other objects
+    fall back to hash(), which may not
+    '''
+    cdef:
+        Py_ssize_t i, j, n = len(values), length
+        ndarray[uint64_t] result
+        uint64_t h
+        float64_t fval
+        bytes data
+        char *buf
+        object val
+
+    result = np.empty(n, dtype=np.uint64)
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, unicode):
+            val = val.encode('utf-8')
+
+        if isinstance(val, bytes):
+            data = val
+            buf = data
+            length = len(data)
+            h = <uint64_t> 14695981039346656037ULL
+            for j in range(length):
+                h = (h ^ <uint8_t> buf[j]) * <uint64_t> 1099511628211ULL
+            result[i] = h
+        elif (util.is_float_object(val) or util.is_integer_object(val) or
+              util.is_bool_object(val)):
+            fval = val
+            if fval == 0:
+                fval = 0  # -0.0 is 0.0
+            result[i] = (<uint64_t*> &fval)[0]
+        else:
+            result[i] = <uint64_t> <int64_t> hash(val)
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_digest_compress(ndarray[float64_t] means,
+                          ndarray[float64_t] weights,
+                          ndarray[int64_t] labels, Py_ssize_t ngroups,
+                          double compression):
+    '''
+    Merge the weighted centroids of each group, sorted by label and then by
+    mean, into fewer centroids (t-digest). The size bound keeps centroids
+    small in the tails of each group so extreme quantiles stay accurate.
+    Returns the merged means, weights and labels
+    '''
+    cdef:
+        Py_ssize_t i, k, n, lab
+        float64_t w, q, total, sofar = 0
+        ndarray[float64_t] totals, out_means, out_weights
+        ndarray[int64_t] out_labels
+
+    n = len(means)
+
+    totals = np.zeros(ngroups, dtype=np.float64)
+    out_means = np.empty(n, dtype=np.float64)
+    out_weights = np.empty(n, dtype=np.float64)
+    out_labels = np.empty(n, dtype=np.int64)
+
+    with nogil:
+        for i in range(n):
+            if labels[i] >= 0:
+                totals[labels[i]] += weights[i]
+
+        k = -1
+        for i in range(n):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            w = weights[i]
+            if k >= 0 and out_labels[k] == lab:
+                total = totals[lab]
+                q = (sofar + (out_weights[k] + w) / 2) / total
+                if out_weights[k] + w <= 4 * total * q * (1 - q) / compression:
+                    out_weights[k] += w
+                    out_means[k] += (means[i] - out_means[k]) * w / out_weights[k]
+                    continue
+                sofar += out_weights[k]
+            else:
+                # first centroid of the group
+                sofar = 0
+
+            k += 1
+            out_means[k] = means[i]
+            out_weights[k] = w
+            out_labels[k] = lab
+
+    return out_means[:k + 1], out_weights[:k + 1], out_labels[:k + 1]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_digest_quantile(ndarray[float64_t] out,
+                          ndarray[float64_t] means,
+                          ndarray[float64_t] weights,
+                          ndarray[int64_t] labels, double q):
+    '''
+    q-th quantile of each group from its centroids, sorted by label and then
+    by mean. Interpolates between centroids like Series.quantile does
+    between values, so it is exact while all weights are 1
+    '''
+    cdef:
+        Py_ssize_t i, start, end, n, lab
+        float64_t total, target, pos, next_pos
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1')
+
+    n = len(means)
+    out[:] = nan
+
+    with nogil:
+        start = 0
+        while start < n:
+            lab = labels[start]
+            end = start
+            total = 0
+            while end < n and labels[end] == lab:
+                total += weights[end]
+                end += 1
+
+            # centroid i sits at the middle of its weight
+            target = q * (total - 1) + 0.5
+            pos = weights[start] / 2
+            if target <= pos:
+                out[lab] = means[start]
+            else:
+                out[lab] = means[end - 1]
+                for i in range(start, end - 1):
+                    next_pos = pos + (weights[i] + weights[i + 1]) / 2
+                    if target < next_pos:
+                        out[lab] = means[i] + ((means[i + 1] - means[i]) *
+                                               (target - pos) /
+                                               (next_pos - pos))
+                        break
+                    pos = next_pos
+
+            start = end
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_shift_indexer(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                        int periods):
+    '''
+    For each row, the position of the row `periods` rows earlier in the same
+    group (later if periods is negative), -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i, ii, lab, n, nper, pos
+        ndarray[int64_t] out, seen
+        ndarray[int64_t, ndim=2] last
 
-    nobs = np.zeros_like(out)
-    sumx = np.zeros_like(out)
-    sumxx = np.zeros_like(out)
+    n = len(labels)
+    out = np.empty(n, dtype=np.int64)
 
-    N, K = (<object> values).shape
+    if periods == 0:
+        for i in range(n):
+            out[i] = i if labels[i] >= 0 else -1
+        return out
 
-    if K > 1:
-        for i in range(N):
+    # ring buffer of the last |periods| positions seen in each group
+    nper = periods if periods > 0 else -periods
+    last = np.empty((ngroups, nper), dtype=np.int64)
+    seen = np.zeros(ngroups, dtype=np.int64)
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+    for ii in range(n):
+        i = ii if periods > 0 else n - 1 - ii
+        lab = labels[i]
+        if lab < 0:
+            out[i] = -1
+            continue
 
-            counts[lab] += 1
+        pos = seen[lab] % nper
+        if seen[lab] >= nper:
+            out[i] = last[lab, pos]
+        else:
+            out[i] = -1
+        last[lab, pos] = i
+        seen[lab] += 1
 
-            for j in range(K):
-                val = values[i, j]
+    return out
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-                    sumxx[lab, j] += val * val
-    else:
-        for i in range(N):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_pad_indexer(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                      ndarray[uint8_t, cast=True] mask, object limit=None):
+    '''
+    For each row, the position of the last row in the same group not marked
+    missing by mask, at most `limit` rows back for missing rows, -1 if there
+    is none
+    '''
+    cdef:
+        Py_ssize_t i, lab, n, lim
+        ndarray[int64_t] out, last, fill_count
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+    n = len(labels)
+    out = np.empty(n, dtype=np.int64)
 
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
-                sumxx[lab, 0] += val * val
+    if limit is None:
+        lim = n
+    else:
+        lim = limit
 
+    last = np.empty(ngroups, dtype=np.int64)
+    last.fill(-1)
+    fill_count = np.zeros(ngroups, dtype=np.int64)
 
-    for i in range(len(counts)):
-        for j in range(K):
-            ct = nobs[i, j]
-            if ct < 2:
-                out[i, j] = nan
-            else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+    for i in range(n):
+        lab = labels[i]
+        if lab < 0:
+            out[i] = -1
+        elif not mask[i]:
+            last[lab] = i
+            fill_count[lab] = 0
+            out[i] = i
+        elif fill_count[lab] < lim:
+            fill_count[lab] += 1
+            out[i] = last[lab]
+        else:
+            out[i] = -1
+
+    return out
 
 # TODO: could do even better if we know something about the data. eg, index has
 # 1-min data, binner has 5-min data, then  bins are just strides in index. This
@@ -815,32 +1369,33 @@ def group_add_bin(ndarray[float64_t, ndim=2] out,
         ngroups = len(bins) + 1
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    sumx[b, j] += val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                sumx[b, 0] += val
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
 
     for i in range(ngroups):
         for j in range(K):
@@ -872,32 +1427,33 @@ def group_prod_bin(ndarray[float64_t, ndim=2] out,
         ngroups = len(bins) + 1
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        prodx[b, j] *= val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    prodx[b, j] *= val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                prodx[b, 0] *= val
+                    nobs[b, 0] += 1
+                    prodx[b, 0] *= val
 
     for i in range(ngroups):
         for j in range(K):
@@ -932,34 +1488,35 @@ def group_min_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        if val < minx[b, j]:
+                            minx[b, j] = val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    if val < minx[b, j]:
-                        minx[b, j] = val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                if val < minx[b, 0]:
-                    minx[b, 0] = val
+                    nobs[b, 0] += 1
+                    if val < minx[b, 0]:
+                        minx[b, 0] = val
 
     for i in range(ngroups):
         for j in range(K):
@@ -994,34 +1551,35 @@ def group_max_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        if val > maxx[b, j]:
+                            maxx[b, j] = val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    if val > maxx[b, j]:
-                        maxx[b, j] = val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                if val > maxx[b, 0]:
-                    maxx[b, 0] = val
+                    nobs[b, 0] += 1
+                    if val > maxx[b, 0]:
+                        maxx[b, 0] = val
 
     for i in range(ngroups):
         for j in range(K):
@@ -1121,37 +1679,39 @@ def group_mean_bin(ndarray[float64_t, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+
     if bins[len(bins) - 1] == len(values):
         ngroups = len(bins)
     else:
         ngroups = len(bins) + 1
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    sumx[b, j] += val
-    else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
-
-            counts[b] += 1
-            val = values[i, 0]
-
-            # not nan
-            if val == val:
-                nobs[b, 0] += 1
-                sumx[b, 0] += val
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
 
     for i in range(ngroups):
         for j in range(K):
@@ -1184,35 +1744,85 @@ def group_var_bin(ndarray[float64_t, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    b = 0
-    if K > 1:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
 
-            counts[b] += 1
+                counts[b] += 1
 
-            for j in range(K):
-                val = values[i, j]
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+                        sumxx[b, j] += val * val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
 
                 # not nan
                 if val == val:
-                    nobs[b, j] += 1
-                    sumx[b, j] += val
-                    sumxx[b, j] += val * val
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
+                    sumxx[b, 0] += val * val
+
+    for i in range(ngroups):
+        for j in range(K):
+            ct = nobs[i, j]
+            if ct < 2:
+                out[i, j] = nan
+            else:
+                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                             (ct * ct - ct))
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_sem_bin(ndarray[float64_t, ndim=2] out,
+                  ndarray[int64_t] counts,
+                  ndarray[float64_t, ndim=2] values,
+                  ndarray[int64_t] bins):
+    '''
+    Standard error of the mean, only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros_like(out)
+    sumx = np.zeros_like(out)
+    sumxx = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
-        for i in range(N):
-            while b < ngroups - 1 and i >= bins[b]:
-                b += 1
+        ngroups = len(bins) + 1
 
-            counts[b] += 1
-            val = values[i, 0]
+    N, K = (<object> values).shape
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
 
             # not nan
             if val == val:
-                nobs[b, 0] += 1
-                sumx[b, 0] += val
-                sumxx[b, 0] += val * val
+                nobs[b, j] += 1
+                sumx[b, j] += val
+                sumxx[b, j] += val * val
 
     for i in range(ngroups):
         for j in range(K):
@@ -1220,8 +1830,99 @@ def group_var_bin(ndarray[float64_t, ndim=2] out,
             if ct < 2:
                 out[i, j] = nan
             else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+                out[i, j] = sqrt((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * ct - ct) / ct)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile_bin(ndarray[float64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float64_t, ndim=2] values,
+                       ndarray[int64_t] bins, double q):
+    '''
+    q-th quantile of the non-null values in each bin, interpolated like
+    Series.quantile. Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b, start, end, n
+        float64_t val
+        ndarray[float64_t] buf
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1')
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    buf = np.empty(N, dtype=np.float64)
+
+    for j in range(K):
+        end = 0
+        for b in range(ngroups):
+            start = end
+            end = bins[b] if b < ngroups - 1 else N
+            if j == 0:
+                counts[b] += end - start
+
+            n = 0
+            for i in range(start, end):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    buf[n] = val
+                    n += 1
+
+            out[b, j] = _buffer_quantile(<float64_t*> buf.data, n, q)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique_bin(ndarray[int64_t, ndim=2] out,
+                      ndarray[int64_t] counts,
+                      ndarray[int64_t, ndim=2] values,
+                      ndarray[int64_t] bins):
+    '''
+    Number of distinct values in each bin. Takes factorized values, with -1
+    for nulls. Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b, start, end, code, nuniques = 0
+        ndarray[int64_t] seen
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    for i in range(N):
+        for j in range(K):
+            if values[i, j] >= nuniques:
+                nuniques = values[i, j] + 1
+
+    # bin in which each value was last seen
+    seen = np.empty(nuniques, dtype=np.int64)
+
+    for j in range(K):
+        seen.fill(-1)
+        end = 0
+        for b in range(ngroups):
+            start = end
+            end = bins[b] if b < ngroups - 1 else N
+            if j == 0:
+                counts[b] += end - start
+
+            out[b, j] = 0
+            for i in range(start, end):
+                code = values[i, j]
+                if code >= 0 and seen[code] != b:
+                    seen[code] = b
+                    out[b, j] += 1
 
 
 
@@ -1409,8 +2110,10 @@ def generate_slices(ndarray[int64_t] labels, Py_ssize_t ngroups):
         group_size += 1
         lab = labels[i]
         if i == n - 1 or lab != labels[i + 1]:
-            starts[lab] = start
-            ends[lab] = start + group_size
+            # rows with a missing (-1) label are skipped
+            if lab >= 0:
+                starts[lab] = start
+                ends[lab] = start + group_size
             start += group_size
             group_size = 0
 
@@ -1,4 +1,8 @@
 from cpython cimport PyObject
+from cpython.object cimport PyObject_Hash, PyObject_RichCompareBool, Py_EQ
+from cpython.string cimport (PyString_CheckExact, PyString_GET_SIZE,
+                             PyString_AS_STRING)
+from libc.string cimport memcmp
 
 from khash cimport *
 from numpy cimport *
@@ -91,6 +95,11 @@ cdef class HashTable:
     pass
 
 
+cdef inline Py_ssize_t _khash_nbytes(Py_ssize_t n_buckets, Py_ssize_t keysize):
+    # keys, values and 2 flag bits per bucket
+    return n_buckets * (keysize + sizeof(size_t)) + (n_buckets >> 4) * 4
+
+
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
 
@@ -342,6 +351,10 @@ cdef class Int64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ Approximate memory used by the table, in bytes """
+        return _khash_nbytes(self.table.n_buckets, sizeof(int64_t))
+
     cdef inline bint has_key(self, int64_t val):
         cdef khiter_t k
         k = kh_get_int64(self.table, val)
@@ -574,6 +587,10 @@ cdef class Float64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ Approximate memory used by the table, in bytes """
+        return _khash_nbytes(self.table.n_buckets, sizeof(float64_t))
+
     def __dealloc__(self):
         kh_destroy_float64(self.table)
 
@@ -687,6 +704,12 @@ cdef class PyObjectHashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ Approximate memory used by the table, in bytes """
+        if self.table is NULL:
+            return 0
+        return _khash_nbytes(self.table.n_buckets, sizeof(PyObject*))
+
     def __contains__(self, object key):
         cdef khiter_t k
         hash(key)
@@ -841,6 +864,126 @@ cdef class PyObjectHashTable(HashTable):
         return labels, counts[:count].copy()
 
 
+cdef inline bint _labels_equal(object a, object b) except -1:
+    cdef Py_ssize_t n
+    if a is b:
+        return 1
+    if PyString_CheckExact(a) and PyString_CheckExact(b):
+        n = PyString_GET_SIZE(a)
+        return (n == PyString_GET_SIZE(b) and
+                memcmp(PyString_AS_STRING(a), PyString_AS_STRING(b), n) == 0)
+    return PyObject_RichCompareBool(a, b, Py_EQ)
+
+
+cdef class InternedStringTable(HashTable):
+    '''
+    Open-addressing table mapping index labels (mostly str) to locations.
+    Labels are interned when mapped and their hashes are kept in an array
+    parallel to the labels, so a probe first compares cached hashes, then
+    identity, then length and bytes; rich comparison is only used for
+    non-str keys. Built once by map_locations
+    '''
+    cdef:
+        ndarray slots, hashes, labels
+        Py_ssize_t mask, count
+
+    def __init__(self, size_hint=1):
+        self._allocate(size_hint)
+        self.hashes = np.empty(0, dtype=np.int_)
+        self.labels = np.empty(0, dtype=object)
+
+    cdef _allocate(self, Py_ssize_t size_hint):
+        cdef Py_ssize_t nslots = 8
+        # keep the load factor at or below 1/2
+        while nslots < 2 * size_hint:
+            nslots <<= 1
+        self.slots = np.empty(nslots, dtype=np.int64)
+        self.slots.fill(-1)
+        self.mask = nslots - 1
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def sizeof(self):
+        """ Approximate memory used by the table, in bytes """
+        return self.slots.nbytes + self.hashes.nbytes + self.labels.nbytes
+
+    def __contains__(self, object key):
+        return self._find(key, PyObject_Hash(key)) != -1
+
+    cdef inline Py_ssize_t _find(self, object key, long h) except -2:
+        cdef:
+            int64_t *slots = <int64_t*> self.slots.data
+            long *hashes = <long*> self.hashes.data
+            Py_ssize_t idx = h & self.mask
+            int64_t loc
+
+        while True:
+            loc = slots[idx]
+            if loc == -1:
+                return -1
+            if hashes[loc] == h and _labels_equal(self.labels[loc], key):
+                return loc
+            idx = (idx + 1) & self.mask
+
+    cpdef get_item(self, object val):
+        cdef Py_ssize_t loc = self._find(val, PyObject_Hash(val))
+        if loc == -1:
+            raise KeyError(val)
+        return loc
+
+    def map_locations(self, ndarray[object] values):
+        cdef:
+            Py_ssize_t i, idx, n = len(values)
+            int64_t loc
+            int64_t *slots
+            long h
+            long *hashes
+            object val
+            ndarray[object] labels
+
+        self._allocate(n)
+        slots = <int64_t*> self.slots.data
+
+        self.hashes = np.empty(n, dtype=np.int_)
+        hashes = <long*> self.hashes.data
+        self.labels = labels = np.empty(n, dtype=object)
+
+        for i in range(n):
+            val = values[i]
+            if PyString_CheckExact(val):
+                val = intern(val)
+            h = PyObject_Hash(val)
+            labels[i] = val
+            hashes[i] = h
+
+            # later duplicates replace earlier ones
+            idx = h & self.mask
+            while True:
+                loc = slots[idx]
+                if loc == -1:
+                    slots[idx] = i
+                    self.count += 1
+                    break
+                if hashes[loc] == h and _labels_equal(labels[loc], val):
+                    slots[idx] = i
+                    break
+                idx = (idx + 1) & self.mask
+
+    def lookup(self, ndarray[object] values):
+        cdef:
+            Py_ssize_t i, n = len(values)
+            object val
+            ndarray[int64_t] locs = np.empty(n, dtype=np.int64)
+
+        for i in range(n):
+            val = values[i]
+            locs[i] = self._find(val, PyObject_Hash(val))
+
+        return locs
+
+
 cdef class Factorizer:
     cdef public PyObjectHashTable table
     cdef public uniques
@@ -98,6 +98,20 @@ get_value_1d(PyArrayObject* ap, Py_ssize_t i) {
   return PyArray_Scalar(item, PyArray_DESCR(ap), (PyObject*) ap);
 }
 
+PANDAS_INLINE int
+assign_value_2d(PyArrayObject* ap, Py_ssize_t i, Py_ssize_t j, PyObject* v) {
+  char *item = (char *) PyArray_DATA(ap) + i * PyArray_STRIDE(ap, 0)
+    + j * PyArray_STRIDE(ap, 1);
+  return PyArray_DESCR(ap)->f->setitem(v, item, ap);
+}
+
+PANDAS_INLINE PyObject*
+get_value_2d(PyArrayObject* ap, Py_ssize_t i, Py_ssize_t j) {
+  char *item = (char *) PyArray_DATA(ap) + i * PyArray_STRIDE(ap, 0)
+    + j * PyArray_STRIDE(ap, 1);
+  return PyArray_Scalar(item, PyArray_DESCR(ap), (PyObject*) ap);
+}
+
 
 PANDAS_INLINE char*
 get_c_string(PyObject* obj) {
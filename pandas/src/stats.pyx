@@ -138,6 +138,73 @@ def rank_1d_float64(object in_arr, ties_method='average', ascending=True):
     return ranks
 
 
+def group_rank_float64(object in_arr, ndarray[int64_t] labels,
+                       ties_method='average', ascending=True):
+    """
+    Ranks (1 through group size) of values within each group given by labels.
+    NaN for missing values and rows with a missing (-1) label
+    """
+
+    cdef:
+        Py_ssize_t i, j, n, ngroups, start = 0, dups = 0
+        ndarray[float64_t] sorted_data, ranks, values
+        ndarray[int64_t] argsorted, sorted_labels, indexer
+        ndarray[uint8_t, cast=True] mask
+        float64_t sum_ranks = 0
+        int tiebreak = 0
+    tiebreak = tiebreakers[ties_method]
+
+    values = np.array(in_arr, dtype=np.float64)
+    if not ascending:
+        values = -values
+
+    # missing values go last within each group. Like rank_1d_float64, inf
+    # (-inf when descending) is ranked as missing
+    mask = np.isnan(values) | (values == np.inf)
+    np.putmask(values, mask, np.inf)
+
+    # stable, so ties keep their order for 'first'
+    _as = np.lexsort((values, mask))
+
+    # the counting sort by label is stable, keeping values ordered within
+    # each group
+    ngroups = labels.max() + 1 if len(labels) else 0
+    indexer = groupsort_indexer(labels.take(_as), ngroups)[0]
+    argsorted = _as.take(indexer).astype('i8')
+    sorted_data = values.take(argsorted)
+    sorted_labels = labels.take(argsorted)
+
+    n = len(values)
+    ranks = np.empty(n, dtype='f8')
+
+    for i in range(n):
+        if i == 0 or sorted_labels[i] != sorted_labels[i - 1]:
+            start = i
+        if sorted_labels[i] < 0 or mask[argsorted[i]]:
+            ranks[argsorted[i]] = nan
+            continue
+
+        sum_ranks += i - start + 1
+        dups += 1
+        if (i == n - 1 or sorted_labels[i + 1] != sorted_labels[i] or
+            mask[argsorted[i + 1]] or
+            fabs(sorted_data[i + 1] - sorted_data[i]) > FP_ERR):
+            if tiebreak == TIEBREAK_AVERAGE:
+                for j in range(i - dups + 1, i + 1):
+                    ranks[argsorted[j]] = sum_ranks / dups
+            elif tiebreak == TIEBREAK_MIN:
+                for j in range(i - dups + 1, i + 1):
+                    ranks[argsorted[j]] = i - start - dups + 2
+            elif tiebreak == TIEBREAK_MAX:
+                for j in range(i - dups + 1, i + 1):
+                    ranks[argsorted[j]] = i - start + 1
+            elif tiebreak == TIEBREAK_FIRST:
+                for j in range(i - dups + 1, i + 1):
+                    ranks[argsorted[j]] = j - start + 1
+            sum_ranks = dups = 0
+    return ranks
+
+
 def rank_1d_int64(object in_arr, ties_method='average', ascending=True):
     """
     Fast NaN-friendly version of scipy.stats.rankdata
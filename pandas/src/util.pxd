@@ -11,6 +11,9 @@ cdef extern from "numpy_helper.h":
     inline int assign_value_1d(ndarray, Py_ssize_t, object) except -1
     inline cnp.int64_t get_nat()
     inline object get_value_1d(ndarray, Py_ssize_t)
+    inline int assign_value_2d(ndarray, Py_ssize_t, Py_ssize_t,
+                               object) except -1
+    inline object get_value_2d(ndarray, Py_ssize_t, Py_ssize_t)
     inline char *get_c_string(object)
     inline object floatify(object)
     inline object char_to_string(char*)
@@ -695,6 +695,37 @@ class CheckIndexing(object):
         xp = df.reindex(['x'], columns=['a'])
         assert_frame_equal(rs, xp)
 
+    def test_ix_multi_take_mixed(self):
+        df = self.mixed_frame.copy()
+        df['bool'] = df['A'] > 0
+        df['int'] = np.arange(len(df))
+
+        rows = list(df.index[[5, 2, 9]]) + ['missing']
+        cols = ['int', 'foo', 'missing', 'bool', 'A']
+        rs = df.ix[rows, cols]
+        xp = df.reindex(rows).reindex(columns=cols)
+        assert_frame_equal(rs, xp)
+
+        # no missing labels keeps the block dtypes
+        rs = df.ix[rows[:-1], ['int', 'bool']]
+        self.assert_(rs['int'].dtype == np.int64)
+        self.assert_(rs['bool'].dtype == np.bool_)
+
+        mask = df['A'] > 0
+        rs = df.ix[mask, ['foo', 'int']]
+        xp = df.reindex(df.index[mask.values])[['foo', 'int']]
+        assert_frame_equal(rs, xp)
+
+        rs = df.ix[mask.values, [-1, 0]]
+        xp = df.reindex(df.index[mask.values])[['int', 'A']]
+        assert_frame_equal(rs, xp)
+
+    def test_ix_bool_series_duplicates(self):
+        df = DataFrame(np.random.randn(4, 2), index=['a', 'a', 'b', 'c'])
+        key = Series([True, False, True, True], index=df.index)
+        rs = df.ix[key]
+        assert_frame_equal(rs, df.take([0, 2, 3]))
+
     def test_ix_multi_take_multiindex(self):
         df = DataFrame(np.random.randn(3, 2), index=['x','y','z'],
                        columns=[['a','b'], ['1','2']])
@@ -1133,6 +1164,22 @@ class CheckIndexing(object):
                 expected = self.frame.get_value(row, col)
                 assert_almost_equal(result, expected)
 
+        # positional even with duplicate labels
+        df = DataFrame(np.arange(6.).reshape((3, 2)), index=['a', 'a', 'b'],
+                       columns=['x', 'x'])
+        self.assertEqual(df.iget_value(1, 1), 3.)
+        self.assertEqual(df.iget_value(-1, 0), 4.)
+
+    def test_set_value_masked(self):
+        df = DataFrame({'A' : np.arange(3, dtype=np.int64)})
+        result = df.reindex([0, 5, 2], mask_na=True)
+        self.assert_(isnull(result.get_value(5, 'A')))
+
+        result.set_value(5, 'A', 10)
+        self.assertEqual(result.get_value(5, 'A'), 10)
+        self.assert_(not isnull(result['A']).any())
+        self.assert_(result['A'].dtype == np.int64)
+
 _seriesd = tm.getSeriesData()
 _tsd = tm.getTimeSeriesData()
 
@@ -4415,6 +4462,61 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         smaller = self.intframe.reindex(columns=['A', 'B'])
         self.assert_(smaller['A'].dtype == np.int64)
 
+    def test_reindex_mask_na(self):
+        df = DataFrame({'A' : np.arange(5, dtype=np.int64) + 2 ** 60,
+                        'B' : [True, False, True, False, True],
+                        'C' : np.arange(5.)})
+        new_index = [0, 1, 10, 2, 11]
+        result = df.reindex(new_index, mask_na=True)
+
+        dtypes = set(blk.dtype for blk in result._data.blocks)
+        self.assert_(np.dtype(np.int64) in dtypes)
+        self.assert_(np.dtype(np.bool_) in dtypes)
+        self.assert_(result._data.is_masked())
+
+        # NA is materialized on access
+        expected = df.reindex(new_index)
+        assert_frame_equal(result, expected)
+        assert_frame_equal(isnull(result), isnull(expected))
+
+        # exact integer reduction
+        summed = result.sum()
+        self.assert_(summed.dtype == np.float64)
+        assert_almost_equal(summed['C'], expected.sum()['C'])
+        assert_almost_equal(result.mean()['C'], expected.mean()['C'])
+
+        filled = result.fillna(0)
+        self.assert_(filled['A'].dtype == np.int64)
+        self.assert_(not filled._data.is_masked())
+
+        # in place, upcasting the int block that cannot hold the value
+        filled = df.reindex(new_index, mask_na=True)
+        filled.fillna(0.5, inplace=True)
+        assert_frame_equal(filled, expected.fillna(0.5))
+        self.assert_(not filled._data.is_masked())
+
+        filled = df.reindex(new_index, mask_na=True)
+        filled.fillna(0, inplace=True)
+        self.assert_(filled['A'].dtype == np.int64)
+        self.assertEqual(filled['A'][10], 0)
+
+        taken = result.take([2, 0])
+        self.assert_(np.isnan(taken['A'][10]))
+        self.assertEqual(taken['A'][0], 2 ** 60)
+
+        # exact integer reduction
+        ints = df[['A']].reindex(new_index, mask_na=True)
+        summed = ints.sum()
+        self.assert_(summed.dtype == np.int64)
+        self.assertEqual(summed['A'], 3 * 2 ** 60 + 3)
+        maxed = ints.max()
+        self.assert_(maxed.dtype == np.int64)
+        self.assertEqual(maxed['A'], 2 ** 60 + 2)
+
+        unpickled = pickle.loads(pickle.dumps(result))
+        self.assert_(unpickled._data.is_masked())
+        assert_frame_equal(unpickled, expected)
+
     def test_reindex_like(self):
         other = self.frame.reindex(index=self.frame.index[:10],
                                    columns=['C', 'B'])
@@ -4874,6 +4976,83 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         expected = self.frame * 2
         assert_frame_equal(result, expected)
 
+    def test_eval(self):
+        import pandas.core.expressions as expr
+        df = DataFrame(np.random.randn(100, 4), columns=['a', 'b', 'c', 'd'])
+        df['e'] = np.arange(100)
+
+        result = df.eval('a * b + c / d')
+        expected = df['a'] * df['b'] + df['c'] / df['d']
+        assert_series_equal(result, expected)
+
+        result = df.eval('-a ** 2 - e % 7 >= 0')
+        expected = -df['a'] ** 2 - df['e'] % 7 >= 0
+        assert_series_equal(result, expected)
+
+        result = df.eval('(a > 0) & (0 < b < 1) | ~(e > 50)')
+        expected = ((df['a'] > 0) & ((df['b'] > 0) & (df['b'] < 1))
+                    | -(df['e'] > 50))
+        assert_series_equal(result, expected)
+
+        result = df.eval('e * 2 + 1')
+        self.assert_(result.dtype == np.int64)
+        assert_almost_equal(result, df['e'] * 2 + 1)
+
+        result = df.eval('2 * 3')
+        self.assert_((result == 6).all())
+        self.assert_(result.index.equals(df.index))
+
+        # Series operands are aligned to the frame's index
+        s = Series(np.arange(50.), index=df.index[::-1][:50])
+        result = df.eval('a + s', local_dict={'s' : s})
+        expected = df['a'] + s
+        assert_series_equal(result, expected)
+
+        # chunk boundaries, with and without threads
+        old_size = expr._CHUNK_SIZE
+        try:
+            expr._CHUNK_SIZE = 7
+            expected = df['a'] * df['b'] + df['c'] / df['d']
+            for num_threads in [1, 3]:
+                result = df.eval('a * b + c / d', num_threads=num_threads)
+                assert_series_equal(result, expected)
+        finally:
+            expr._CHUNK_SIZE = old_size
+
+        self.assertRaises(NameError, df.eval, 'a + foo')
+        self.assertRaises(ValueError, df.eval, 'a.sum()')
+        self.assertRaises(ValueError, df.eval, 'a +')
+
+    def test_apply_raw_blockwise(self):
+        df = DataFrame({'a' : np.arange(10), 'b' : np.random.randn(10),
+                        'c' : np.arange(10) % 3 == 0, 'd' : np.arange(10.)},
+                       columns=['b', 'a', 'd', 'c'])
+        self.assert_(len(df._data.blocks) == 3)
+
+        result = df.apply(np.sum, raw=True)
+        expected = df.apply(lambda x: x.values.sum())
+        assert_series_equal(result, expected)
+
+        # extra keywords are passed through
+        result = df.apply(np.std, raw=True, ddof=1)
+        expected = df.apply(lambda x: x.values.std(ddof=1))
+        assert_series_equal(result, expected)
+
+        # same-shaped result is reassembled from the blocks
+        result = df.apply(np.cumsum, raw=True)
+        for col in df.columns:
+            assert_almost_equal(result[col], np.cumsum(df[col].values))
+
+        # rows of a single-block frame
+        result = self.frame.apply(np.sum, axis=1, raw=True)
+        expected = self.frame.apply(lambda x: x.values.sum(), axis=1)
+        assert_series_equal(result, expected)
+
+        # mixed rows fall back to the per-row path
+        result = df.apply(np.sum, axis=1, raw=True)
+        expected = df.apply(lambda x: x.values.sum(), axis=1)
+        assert_series_equal(result, expected)
+
     def test_apply_axis1(self):
         d = self.frame.index[0]
         tapplied = self.frame.apply(np.mean, axis=1)
@@ -5135,6 +5314,12 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         expected = frame.ix[:, ::-1]
         assert_frame_equal(sorted_df, expected)
 
+        # sorted labels are known to be monotonic without a check
+        sorted_df = unordered.sort_index(axis=1)
+        self.assert_(sorted_df.columns._engine.known_flags()[0])
+        sorted_df = unordered.sort_index()
+        self.assert_(sorted_df.index._engine.known_flags()[0])
+
         # by column
         sorted_df = frame.sort_index(by='A')
         indexer = frame['A'].argsort().values
@@ -17,6 +17,7 @@ from pandas.tools.merge import concat
 from collections import defaultdict
 import pandas.core.common as com
 import pandas.core.datetools as dt
+import pandas.lib as lib
 import numpy as np
 from numpy.testing import assert_equal
 
@@ -95,9 +96,10 @@ class TestGroupBy(unittest.TestCase):
         assert_series_equal(agged, grouped.agg(np.mean)) # shorthand
         assert_series_equal(agged, grouped.mean())
 
-        # Cython only returning floating point for now...
-        assert_series_equal(grouped.agg(np.sum).astype(float),
-                            grouped.sum())
+        # Cython aggregates integers as integers
+        result = grouped.sum()
+        self.assert_(result.dtype == np.int64)
+        assert_series_equal(grouped.agg(np.sum), result)
 
         transformed = grouped.transform(lambda x: x * x.sum())
         self.assertEqual(transformed[7], 12)
@@ -125,12 +127,12 @@ class TestGroupBy(unittest.TestCase):
         # tests for first / last / nth
         grouped = self.df.groupby('A')
         first = grouped.first()
-        expected = self.df.ix[[1, 0], ['C', 'D']]
+        expected = self.df.ix[[1, 0], ['B', 'C', 'D']]
         expected.index = ['bar', 'foo']
         assert_frame_equal(first, expected)
 
         last = grouped.last()
-        expected = self.df.ix[[5, 7], ['C', 'D']]
+        expected = self.df.ix[[5, 7], ['B', 'C', 'D']]
         expected.index = ['bar', 'foo']
         assert_frame_equal(last, expected)
 
@@ -190,6 +192,227 @@ class TestGroupBy(unittest.TestCase):
         expected = self.mframe.groupby(key.astype('O')).sum()
         assert_frame_equal(result, expected)
 
+    def test_cython_agg_native_dtypes(self):
+        labels = np.array([0, 1, 0, 1, 2])
+
+        # integer sums beyond float64 precision
+        ints = Series(np.array([2**60, 1, 2**60 + 1, 2, 7], dtype=np.int64))
+        result = ints.groupby(labels).sum()
+        self.assert_(result.dtype == np.int64)
+        self.assertEqual(result[0], 2**61 + 1)
+
+        floats = Series(np.array([1.5, nan, 2.5, 3, 4], dtype=np.float32))
+        result = floats.groupby(labels).max()
+        self.assert_(result.dtype == np.float32)
+        self.assert_(np.array_equal(result.values, [2.5, 3, 4]))
+
+        uints = Series(np.array([1, 2, 3, 4, 2**63 + 5], dtype=np.uint64))
+        result = uints.groupby(labels).min()
+        self.assert_(result.dtype == np.uint64)
+        self.assertEqual(result[2], 2**63 + 5)
+
+        dates = Series(bdate_range('1/3/2000', periods=5))
+        dates[2] = nan
+        result = dates.groupby(labels).first()
+        expected = Series(dates.values[[0, 1, 4]])
+        assert_series_equal(result, expected)
+        result = dates.groupby(labels).last()
+        expected = Series(dates.values[[0, 3, 4]])
+        assert_series_equal(result, expected)
+
+        objects = Series(['b', 'c', 'a', None, 'd'], dtype=object)
+        grouped = objects.groupby(labels)
+        assert_series_equal(grouped.min(), Series(['a', 'c', 'd']))
+        assert_series_equal(grouped.max(), Series(['b', 'c', 'd']))
+        assert_series_equal(grouped.last(), Series(['a', 'c', 'd']))
+        self.assertRaises(Exception, grouped.mean)
+
+    def test_cython_stat_kernels(self):
+        df = self.df.copy()
+        df['C'][[1, 6]] = nan
+        df['E'] = ['a', 'b', None, 'a', 'a', 'c', 'b', 'b']
+        grouped = df.groupby(['A', 'B'])
+        values = grouped[['C', 'D']]
+
+        assert_frame_equal(grouped.median(),
+                           values.agg(lambda x: x.median()))
+        assert_frame_equal(grouped.sem(),
+                           values.agg(lambda x: x.std() / np.sqrt(x.count())))
+
+        def _quantile(x, q):
+            x = x.dropna()
+            if len(x) == 0:
+                return nan
+            return np.percentile(x.values, q * 100)
+
+        for q in [0, 0.3, 0.5, 1]:
+            assert_frame_equal(grouped.quantile(q),
+                               values.agg(lambda x: _quantile(x, q)))
+        self.assertRaises(ValueError, grouped.quantile, 1.5)
+
+        cols = grouped[['C', 'D', 'E']]
+        result = grouped.count()
+        self.assert_((result.dtypes == np.int64).all())
+        assert_frame_equal(result, cols.agg(lambda x: x.count()))
+
+        result = grouped.nunique()
+        expected = cols.agg(lambda x: len(x.dropna().unique()))
+        assert_frame_equal(result, expected)
+
+        dates = Series(bdate_range('1/3/2000', periods=6))
+        dates[1] = nan
+        dates[2] = dates[0]
+        result = dates.groupby([0, 0, 0, 1, 1, 1]).nunique()
+        assert_series_equal(result, Series([1, 3]))
+        result = dates.groupby([0, 0, 0, 1, 1, 1]).count()
+        assert_series_equal(result, Series([2, 3]))
+
+        # keywords other than the grouping axis count each group
+        frame = self.mframe
+        grouped = frame.groupby(np.arange(len(frame)) % 3)
+        assert_frame_equal(grouped.count(level=1),
+                           grouped.apply(lambda x: x.count(level=1)))
+        assert_series_equal(grouped['A'].count(level=1),
+                            grouped['A'].apply(lambda x: x.count(level=1)))
+        assert_frame_equal(grouped.count(axis=0), grouped.count())
+        assert_series_equal(grouped.count(axis=1),
+                            grouped.apply(lambda x: x.count(axis=1)))
+
+    def test_cython_transforms(self):
+        values = np.random.randn(50)
+        values[::4] = nan
+        values[10:20] = 0.5
+        keys = np.random.randint(0, 5, 50).astype(float)
+        keys[::7] = nan
+        s = Series(values)
+        grouped = s.groupby(keys)
+
+        def _check(result, f):
+            expected = Series(nan, index=s.index)
+            for _, group in grouped:
+                expected[group.index] = f(group)
+            assert_series_equal(result, expected)
+
+        _check(grouped.cumsum(), lambda x: x.cumsum())
+        _check(grouped.cumprod(), lambda x: x.cumprod())
+        _check(grouped.cummin(), lambda x: x.cummin())
+        _check(grouped.cummax(), lambda x: x.cummax())
+        for periods in [1, 2, -1, 0]:
+            _check(grouped.shift(periods), lambda x: x.shift(periods))
+            _check(grouped.diff(periods), lambda x: x.diff(periods))
+        _check(grouped.pct_change(), lambda x: x.pct_change())
+        _check(grouped.pct_change(2, fill_method=None),
+               lambda x: x.pct_change(2, fill_method=None))
+        for method in ['average', 'min', 'max', 'first']:
+            _check(grouped.rank(method=method),
+                   lambda x: x.rank(method=method))
+            _check(grouped.rank(method=method, ascending=False),
+                   lambda x: x.rank(method=method, ascending=False))
+
+        # infinite values, tied with each other but not with NaN
+        values[1::5] = np.inf
+        values[3::5] = -np.inf
+        s = Series(values)
+        grouped = s.groupby(keys)
+        for method in ['average', 'min', 'max', 'first']:
+            _check(grouped.rank(method=method),
+                   lambda x: x.rank(method=method))
+            _check(grouped.rank(method=method, ascending=False),
+                   lambda x: x.rank(method=method, ascending=False))
+
+        # integers stay integers
+        ints = Series(np.arange(10))
+        result = ints.groupby(np.arange(10) % 3).cumsum()
+        self.assert_(result.dtype == np.int64)
+        self.assert_(np.array_equal(result, [0, 1, 2, 3, 5, 7, 9, 12, 15,
+                                             18]))
+
+        df = DataFrame({'A' : np.arange(6) % 2, 'B' : np.arange(6.),
+                        'C' : list('abcdef')})
+        result = df.groupby('A').shift(1)
+        expected = DataFrame({'B' : [nan, nan, 0, 1, 2, 3],
+                              'C' : [nan, nan, 'a', 'b', 'c', 'd']},
+                             columns=['B', 'C'])
+        assert_frame_equal(result, expected)
+
+        result = df.groupby('A').cumsum()
+        expected = DataFrame({'B' : [0., 1, 2, 4, 6, 9]})
+        assert_frame_equal(result, expected)
+
+    def test_agg_n_jobs(self):
+        df = DataFrame(np.random.randn(100, 10))
+        df[3][::7] = np.nan
+        df['key'] = np.random.randint(0, 5, 100)
+        df['ints'] = np.arange(100)
+        df['strings'] = 'foo'
+
+        for how in ['sum', 'mean', 'std', 'min', 'max', 'first', 'last',
+                    'count', 'median']:
+            expected = getattr(df.groupby('key'), how)()
+            result = getattr(df.groupby('key', n_jobs=4), how)()
+            assert_frame_equal(result, expected)
+
+            result = getattr(df.groupby('key', n_jobs=-1)[[0, 1]], how)()
+            assert_frame_equal(result, expected[[0, 1]])
+
+    def test_partial_aggregate(self):
+        import cPickle
+        df = DataFrame({'A' : np.random.randint(0, 5, 200),
+                        'B' : np.random.randn(200),
+                        'C' : np.random.randint(0, 10, 200).astype(float),
+                        'D' : np.array(list('abcd') * 50, dtype=object)})
+        df['B'][::7] = np.nan
+        chunks = [df[:50], df[50:120], df[120:]]
+
+        def merged(how, **kwds):
+            parts = [chunk.groupby('A').partial_aggregate(how, **kwds)
+                     for chunk in chunks]
+            # states can be shipped between processes
+            parts = [cPickle.loads(cPickle.dumps(p, 2)) for p in parts]
+            return reduce(lambda a, b: a.combine(b), parts).result()
+
+        grouped = df.groupby('A')
+        for how in ['sum', 'mean', 'var', 'std', 'min', 'max']:
+            expected = getattr(grouped, how)()[['B', 'C']]
+            assert_frame_equal(merged(how), expected)
+        assert_frame_equal(merged('count'), grouped.count())
+
+        # sketches are exact on groups this small
+        assert_frame_equal(merged('nunique')[['C', 'D']],
+                           grouped.nunique()[['C', 'D']])
+        for q in [0., 0.3, 0.5, 1.]:
+            expected = grouped.quantile(q)[['B', 'C']]
+            assert_frame_equal(merged('quantile', q=q), expected)
+
+        # columns hash alike whatever the dtype of the other columns, or of
+        # the column itself, in each chunk
+        left = DataFrame({'k': [1, 1, 1], 'n': [1., 2., 3.],
+                          's': ['x', 'y', 'z']})
+        right = DataFrame({'k': [1, 1, 1, 1], 'n': [1, 2, 3, 3],
+                           's': [np.nan, np.nan, u'x', 'w']})
+        result = left.groupby('k').partial_aggregate('nunique').combine(
+            right.groupby('k').partial_aggregate('nunique')).result()
+        self.assertEqual(result['n'][1], 3)
+        self.assertEqual(result['s'][1], 4)
+
+        # and the same in every process
+        hashes = lib.hash_object_array(np.array(['x', u'x', 1, 1., -0.],
+                                                dtype=object))
+        self.assertEqual(list(hashes[:2]), [12638214688346347271] * 2)
+        self.assertEqual(list(hashes[2:]),
+                         list(np.array([1., 1., 0.]).view(np.uint64)))
+
+        parts = [chunk.groupby('A')['B'].partial_aggregate('mean')
+                 for chunk in chunks]
+        result = reduce(lambda a, b: a.combine(b), parts).result()
+        assert_series_equal(result, grouped['B'].mean())
+
+        part = df.groupby('A').partial_aggregate('sum')
+        self.assertRaises(ValueError, part.combine,
+                          df.groupby('A').partial_aggregate('mean'))
+        self.assertRaises(ValueError, df.groupby('A').partial_aggregate,
+                          'median')
+
     def test_agg_regression1(self):
         grouped = self.tsframe.groupby([lambda x: x.year, lambda x: x.month])
         result = grouped.agg(np.mean)
@@ -1257,6 +1480,30 @@ class TestGroupBy(unittest.TestCase):
         expected = grouped.transform(lambda x: x * 2)
         assert_series_equal(result, expected)
 
+    def test_apply_transform_unsorted_keys(self):
+        s = Series(np.arange(6.), index=['a', 'b', 'a', 'c', 'b', 'a'])
+        keys = np.array([1, 0, 1, 0, 1, 0])
+
+        # duplicate labels, results line up by position
+        result = s.groupby(keys).apply(lambda x: x - x.mean())
+        expected = Series([-2., -2., 0., 0., 2., 2.], index=s.index)
+        assert_series_equal(result, expected)
+
+        df = DataFrame({'A' : keys, 'B' : np.arange(6.)})
+        result = df.groupby('A').apply(lambda x: x - x.mean())
+        expected = DataFrame({'A' : np.zeros(6),
+                              'B' : [-2., -2., 0., 0., 2., 2.]})
+        assert_frame_equal(result, expected)
+
+        # rows with a missing key come back as NaN
+        keys = np.array([1, 0, np.nan, 0, 1, 0])
+        result = Series(np.arange(6.)).groupby(keys).apply(lambda x: x * 2)
+        expected = Series([0., 2., np.nan, 6., 8., 10.])
+        assert_series_equal(result, expected)
+
+        result = s.groupby(keys).apply(lambda x: x.sum())
+        assert_series_equal(result, Series([9., 4.], index=[0., 1.]))
+
     def test_apply_multikey_corner(self):
         grouped = self.tsframe.groupby([lambda x: x.year,
                                         lambda x: x.month])
@@ -1647,6 +1894,84 @@ class TestGroupBy(unittest.TestCase):
             self.assert_(left[k] == right[k[::-1]] == v)
         self.assert_(len(left) == len(right))
 
+    def test_reuse_grouper(self):
+        grouped = self.df.groupby(['A', 'B'])
+        expected = grouped.mean()
+        comp_ids = grouped.grouper.group_info[0]
+
+        regrouped = self.df.groupby(grouped.grouper)
+        assert_frame_equal(regrouped.mean(), expected)
+        self.assert_(regrouped.grouper.group_info[0] is comp_ids)
+
+        result = regrouped.agg({'C' : [np.mean, np.std], 'D' : np.max})
+        expected = grouped.agg({'C' : [np.mean, np.std], 'D' : np.max})
+        assert_frame_equal(result, expected)
+
+        self.assertRaises(ValueError, self.df[:3].groupby, grouped.grouper)
+
+    def test_groupby_assume_sorted(self):
+        from pandas.core.groupby import SortedGrouper
+
+        df = DataFrame({'k1': [1, 1, 1, 2, 2, 3, 3, 3],
+                        'k2': ['a', 'b', 'b', 'a', 'a', 'a', 'b', 'c'],
+                        'A': [1., np.nan, 3., 4., 5., 6., 7., 8.],
+                        'B': np.arange(8)})
+
+        for keys in ['k1', ['k1', 'k2']]:
+            grouped = df.groupby(keys, assume_sorted=True)
+            self.assert_(isinstance(grouped.grouper, SortedGrouper))
+            expected = df.groupby(keys)
+
+            for how in ['sum', 'mean', 'std', 'min', 'first', 'count',
+                        'median', 'nunique']:
+                assert_frame_equal(getattr(grouped, how)(),
+                                   getattr(expected, how)())
+            assert_series_equal(grouped.size(), expected.size())
+            assert_series_equal(grouped['A'].agg(lambda x: x.max()),
+                                expected['A'].agg(lambda x: x.max()))
+            assert_frame_equal(grouped.apply(lambda x: x.head(1)),
+                               expected.apply(lambda x: x.head(1)))
+            self.assertEqual([k for k, _ in grouped],
+                             [k for k, _ in expected])
+
+        # unsorted or missing keys are grouped as usual
+        s = Series(np.arange(4.))
+        for keys in [[2, 2, 1, 1], [1, 1, np.nan, 2]]:
+            grouped = s.groupby(keys, assume_sorted=True)
+            self.assert_(not isinstance(grouped.grouper, SortedGrouper))
+            assert_series_equal(grouped.sum(), s.groupby(keys).sum())
+
+    def test_groupby_no_sort_first_seen(self):
+        df = DataFrame({'a' : ['x', 'y', 'x', 'z', 'y'],
+                        'b' : [2, 1, 2, 1, 3],
+                        'v' : np.arange(5.)})
+
+        result = df.groupby(['a', 'b'], sort=False)['v'].sum()
+        expected = Series([2., 1., 3., 4.],
+                          index=MultiIndex.from_tuples([('x', 2), ('y', 1),
+                                                        ('z', 1), ('y', 3)]))
+        self.assert_(np.array_equal(result.index.values,
+                                    expected.index.values))
+        self.assert_(np.array_equal(result.values, expected.values))
+
+        # keys overflowing the int64 group offsets
+        B = np.concatenate((np.arange(1000), np.arange(1000),
+                            np.arange(500)))[::-1]
+        A = np.arange(2500)[::-1]
+        df = DataFrame({'A' : A, 'B' : B,
+                        'C' : A, 'D' : B,
+                        'E' : A, 'F' : B,
+                        'G' : A, 'H' : B,
+                        'values' : np.random.randn(2500)})
+        keys = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+        grouped = df.groupby(keys, sort=False)
+        self.assert_(grouped.grouper._overflow_possible)
+
+        result = grouped.sum()['values']
+        tups = com._asarray_tuplesafe(map(tuple, df[keys].values))
+        self.assert_(np.array_equal(result.index.values, tups))
+        self.assert_(np.array_equal(result.values, df['values'].values))
+
     def test_groupby_sort_multi(self):
         df = DataFrame({'a' : ['foo', 'bar', 'baz'],
                         'b' : [3, 2, 1],
@@ -1834,6 +2159,52 @@ class TestGroupBy(unittest.TestCase):
         expected = self.df.groupby('A').agg(ex_funcs)
         assert_frame_equal(result, expected)
 
+    def test_agg_multiple_builtin_one_pass(self):
+        from pandas import concat
+
+        df = DataFrame({'key': [1., 1., 2., 2., np.nan, 3., 3., 3.],
+                        'A': [1., np.nan, 2., 5., 4., np.nan, np.nan, np.nan],
+                        'B': np.arange(8.),
+                        'C': np.arange(8)})
+        funcs = ['sum', 'mean', 'std', 'var', 'min', 'max', ('n', 'count'),
+                 ('avg', np.mean)]
+        names = ['sum', 'mean', 'std', 'var', 'min', 'max', 'n', 'avg']
+
+        def _expected(grouped):
+            result = {}
+            for name, func in zip(names, funcs):
+                if isinstance(func, tuple):
+                    func = func[1]
+                result[name] = grouped.agg(func)
+            return DataFrame(result, columns=names)
+
+        grouped = df.groupby('key')
+        for col in ['A', 'B', 'C']:
+            result = grouped[col].agg(funcs)
+            assert_frame_equal(result, _expected(grouped[col]))
+
+        # float only, and with an int column aggregated separately
+        for cols in [['A', 'B'], ['A', 'B', 'C']]:
+            result = grouped[cols].agg(funcs)
+            expected = concat([_expected(grouped[col]) for col in cols],
+                              keys=cols, axis=1)
+            assert_frame_equal(result, expected)
+            self.assertEqual(result['A']['n'].dtype, np.int64)
+
+        # the float block is aggregated once for all the columns
+        from pandas.core.groupby import Grouper
+        calls = []
+        aggregate_multiple = Grouper.aggregate_multiple
+        def _spy(self, values, hows, axis=0):
+            calls.append(values.shape)
+            return aggregate_multiple(self, values, hows, axis=axis)
+        Grouper.aggregate_multiple = _spy
+        try:
+            grouped[['A', 'B']].agg(funcs)
+        finally:
+            Grouper.aggregate_multiple = aggregate_multiple
+        self.assertEqual(calls, [(2, 8)])
+
     def test_more_flexible_frame_multi_function(self):
         from pandas import concat
 
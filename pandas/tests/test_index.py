@@ -11,10 +11,11 @@ import numpy as np
 from numpy.testing import assert_array_equal
 
 from pandas.core.categorical import Factor
-from pandas.core.index import Index, Int64Index, MultiIndex
+from pandas.core.index import Index, Int64Index, RangeIndex, MultiIndex
 from pandas.util.testing import assert_almost_equal
 from pandas.util import py3compat
 import pandas.core.common as com
+import pandas.lib as lib
 
 import pandas.util.testing as tm
 
@@ -109,6 +110,150 @@ class TestIndex(unittest.TestCase):
         # Must also be an Index
         self.assertFalse(Index(['a', 'b', 'c']).equals(['a', 'b', 'c']))
 
+    def test_is_(self):
+        ind = Index(['a', 'b', 'c'])
+        self.assert_(ind.is_(ind))
+        self.assert_(ind.is_(ind.copy()))
+        self.assert_(ind.is_(ind._shallow_copy()))
+        self.assertFalse(ind.is_(ind[:2]))
+        self.assertFalse(ind.is_(np.array(ind)))
+
+        # equal indexes share lineage once compared
+        other = Index(['a', 'b', 'c'])
+        self.assertFalse(ind.is_(other))
+        self.assert_(ind.equals(other))
+        self.assert_(ind.is_(other))
+        self.assert_(other.is_(ind))
+
+        self.assert_(not ind.is_(Index(['a', 'b', 'd'])))
+        self.assertFalse(ind.equals(Index(['a', 'b', 'd'])))
+
+        # join of the same lineage needs no indexers
+        joined, lidx, ridx = ind.join(other, how='outer',
+                                      return_indexers=True)
+        self.assert_(joined is ind)
+        self.assert_(lidx is None and ridx is None)
+
+        idx1 = self.dateIndex
+        idx2 = tm.makeDateIndex(100)
+        self.assert_(idx1.equals(idx2))
+        self.assert_(idx1.is_(idx2))
+
+    def test_lookup_strategy(self):
+        indexes = [Index(['a', 'b', 'c', 'e']),
+                   Int64Index([0, 10, 20, 30, 40, 100]),
+                   Index(np.arange(5) * 1.5),
+                   tm.makeDateIndex(20),
+                   Index(['c', 'a', 'b'])]
+
+        for ind in indexes:
+            target = ind[::-1].append(Index([ind[0]])).take([0, 1, 2])
+            expected_indexer = ind.get_indexer(target)
+            for strategy in ['hash', 'binary', 'interpolation', 'auto']:
+                ind = Index(ind)
+                ind.set_lookup_strategy(strategy)
+                self.assertEqual(ind._engine.strategy, strategy)
+
+                for i, label in enumerate(ind):
+                    self.assertEqual(ind.get_loc(label), i)
+                    self.assert_(label in ind)
+
+                self.assert_(np.array_equal(ind.get_indexer(target),
+                                            expected_indexer))
+                if strategy in ('binary', 'interpolation') and \
+                        ind.is_monotonic:
+                    self.assert_(ind._engine.mapping is None)
+
+        ind = Int64Index([0, 10, 20, 30, 40, 100])
+        ind.set_lookup_strategy('interpolation')
+        for key in [-1, 5, 101, 2 ** 70]:
+            self.assertRaises(KeyError, ind.get_loc, key)
+            self.assert_(key not in ind)
+
+        self.assertRaises(ValueError, ind.set_lookup_strategy, 'foo')
+
+    def test_engine_memory_limit(self):
+        old_limit = lib.get_engine_memory_limit()
+        try:
+            indexes = [Index(np.arange(1000) * (i + 1)) for i in range(3)]
+            for ind in indexes:
+                ind.get_loc(ind[5])
+            sizes = [ind._engine.table_nbytes for ind in indexes]
+            self.assert_(all(size > 0 for size in sizes))
+
+            # make the first the most recently used
+            indexes[0].get_loc(indexes[0][1])
+
+            lib.set_engine_memory_limit(sizes[0] + sizes[2])
+            self.assert_(indexes[0]._engine.mapping is not None)
+            self.assert_(indexes[1]._engine.mapping is None)
+            self.assert_(indexes[2]._engine.mapping is not None)
+            self.assert_(lib.get_engine_memory_usage() <= sizes[0] + sizes[2])
+
+            # evicted tables are rebuilt on demand
+            self.assertEqual(indexes[1].get_loc(indexes[1][7]), 7)
+            self.assert_(indexes[1]._engine.mapping is not None)
+            self.assert_(indexes[2]._engine.mapping is None)
+        finally:
+            lib.set_engine_memory_limit(old_limit)
+
+    def test_string_engine(self):
+        labels = ['foo%d' % i for i in range(100)]
+        index = Index(labels + ['foo3'])
+        self.assert_(isinstance(index._engine, lib.StringEngine))
+        self.assert_(not isinstance(Index([1, 'a'])._engine,
+                                    lib.StringEngine))
+
+        # equal labels that are different objects
+        key = ''.join(['foo', '42'])
+        self.assertEqual(Index(labels).get_loc(key), 42)
+        self.assert_(key in index)
+        self.assert_(u'foo7' in index)
+        self.assert_('bar' not in index)
+        self.assert_(1 not in index)
+        self.assert_(not index.is_unique)
+
+        target = [''.join(['foo', str(i)]) for i in range(95, 105)]
+        result = Index(labels).get_indexer(target)
+        expected = [95, 96, 97, 98, 99, -1, -1, -1, -1, -1]
+        self.assert_(np.array_equal(result, expected))
+
+        self.assertRaises(KeyError, Index(labels).get_loc, 'bar')
+
+    def test_reindexer(self):
+        from pandas import Series, DataFrame
+        source = Index(['a', 'c', 'e', 'g'])
+        target = Index(['a', 'b', 'c', 'd', 'e'])
+
+        reindexer = target.reindexer(source)
+        self.assert_(target.reindexer(source) is reindexer)
+        self.assert_(target.reindexer(source.copy()) is reindexer)
+        self.assert_(target.reindexer(source, method='pad') is not reindexer)
+        self.assert_(np.array_equal(reindexer.indexer, [0, -1, 1, -1, 2]))
+
+        s = Series([1., 2., 3., 4.], index=source)
+        result = reindexer(s)
+        tm.assert_series_equal(result, s.reindex(target))
+        df = DataFrame({'A': s, 'B': s * 2})
+        tm.assert_frame_equal(reindexer(df), df.reindex(target))
+
+        # plain reindexing reuses the cached indexer
+        cached = reindexer.indexer
+        self.assert_(source.reindex(target)[1] is cached)
+
+        other = Series([1., 2., 3., 4.], index=Index(['a', 'b', 'e', 'g']))
+        self.assertRaises(ValueError, reindexer, other)
+
+    def test_reindexer_evicted(self):
+        import gc
+        source = Index(['a', 'c'])
+        target = Index(['a', 'b', 'c'])
+        target.reindexer(source)
+        self.assertEqual(len(target._reindexers), 1)
+        del source
+        gc.collect()
+        self.assertEqual(len(target._reindexers), 0)
+
     def test_asof(self):
         d = self.dateIndex[0]
         self.assert_(self.dateIndex.asof(d) is d)
@@ -284,6 +429,57 @@ class TestIndex(unittest.TestCase):
         # non-iterable input
         self.assertRaises(Exception, first.diff, 0.5)
 
+    def test_setops_sorted(self):
+        first = Index(sorted(self.strIndex[5:20]))
+        second = Index(sorted(self.strIndex[:10]))
+        fset, sset = set(first), set(second)
+
+        self.assertEqual(list(first.union(second)), sorted(fset | sset))
+        self.assertEqual(list(first.intersection(second)),
+                         sorted(fset & sset))
+        self.assertEqual(list(first - second), sorted(fset - sset))
+
+        # duplicates keep the join semantics for union / intersection
+        dups = Index(['a', 'b', 'b', 'c'])
+        self.assertEqual(list(dups.union(Index(['b', 'd']))),
+                         ['a', 'b', 'b', 'c', 'd'])
+        self.assertEqual(list(dups - Index(['c'])), ['a', 'b'])
+
+        result = Index([1, 3, 5, 7]) - Index([3, 4, 5])
+        self.assert_(np.array_equal(result, [1, 7]))
+
+    def test_known_flags(self):
+        first = Index(['a', 'c', 'e', 'g'])
+        second = Index(['b', 'c', 'd'])
+        self.assert_(first.is_monotonic and second.is_monotonic)
+        self.assert_(first.is_unique and second.is_unique)
+
+        for result in [first.union(second), first.intersection(second),
+                       first - second, first[1:3], first[1:],
+                       first[np.array([True, False, True, True])],
+                       first.take([0, 2]), first.take([-2, -1])]:
+            self.assertEqual(result._get_known_flags(), (True, True))
+            self.assert_(result._engine.known_flags() == (True, True))
+
+        self.assertEqual(first[::-1]._get_known_flags(), (None, True))
+        self.assertEqual(first.take([2, 0])._get_known_flags(), (None, None))
+        self.assertEqual(first.take([-1, 0])._get_known_flags(),
+                         (None, None))
+
+        # nothing known about the source, nothing propagated
+        unsorted = Index(['c', 'a', 'b'])
+        self.assertEqual(unsorted[1:]._get_known_flags(), (None, None))
+
+        ordered = unsorted.order()
+        self.assertEqual(ordered._get_known_flags(), (True, None))
+        self.assert_(ordered.is_monotonic)
+        self.assertEqual(unsorted.order(ascending=False)._get_known_flags(),
+                         (None, None))
+
+        # argsort can leave NaN in an object index out of order
+        mixed = Index([3., np.nan, 1.], dtype=object)
+        self.assertEqual(mixed.order()._get_known_flags()[0], None)
+
     def test_pickle(self):
         def testit(index):
             pickled = pickle.dumps(index)
@@ -545,6 +741,42 @@ class TestInt64Index(unittest.TestCase):
         expected = np.array([0, 1, 1, 2, 2, 3, 3, 4, 4, 5])
         self.assert_(np.array_equal(indexer, expected))
 
+    def test_get_indexer_nearest(self):
+        target = Int64Index([-3, 1, 3, 4, 17, 25])
+
+        # ties go to the later label
+        indexer = self.index.get_indexer(target, method='nearest')
+        expected = np.array([0, 1, 2, 2, 9, 9])
+        self.assert_(np.array_equal(indexer, expected))
+
+        indexer = self.index.get_indexer(target, method='nearest',
+                                         tolerance=1)
+        expected = np.array([-1, 1, 2, 2, 9, -1])
+        self.assert_(np.array_equal(indexer, expected))
+
+        # unsorted and float targets
+        indexer = self.index.get_indexer(Index([7.6, 0.2, 30.]),
+                                         method='nearest', tolerance=0.5)
+        self.assert_(np.array_equal(indexer, [4, 0, -1]))
+
+        self.assertRaises(ValueError, self.index.get_indexer, target,
+                          method='nearest', limit=1)
+        self.assertRaises(ValueError, self.index.get_indexer, target,
+                          tolerance=1)
+        self.assertRaises(TypeError, Index(['a', 'b']).get_indexer,
+                          Index(['a']), method='nearest')
+
+    def test_get_indexer_tolerance(self):
+        target = Int64Index(np.arange(10))
+        indexer = self.index.get_indexer(target, method='pad', tolerance=0)
+        expected = np.array([0, -1, 1, -1, 2, -1, 3, -1, 4, -1])
+        self.assert_(np.array_equal(indexer, expected))
+
+        indexer = self.index.get_indexer(target, method='backfill',
+                                         tolerance=1.5)
+        expected = np.array([0, 1, 1, 2, 2, 3, 3, 4, 4, 5])
+        self.assert_(np.array_equal(indexer, expected))
+
     def test_join_outer(self):
         other = Int64Index([7, 12, 25, 1, 2, 5])
         other_mono = Int64Index([1, 2, 5, 7, 12, 25])
@@ -805,6 +1037,101 @@ class TestInt64Index(unittest.TestCase):
         repr(s)
         repr(df)
 
+class TestRangeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RangeIndex(2, 20, 3, name='foo')
+
+    def test_constructor(self):
+        self.assert_(np.array_equal(self.index, np.arange(2, 20, 3)))
+        self.assert_(np.array_equal(RangeIndex(5), np.arange(5)))
+        self.assert_(np.array_equal(RangeIndex(5, 0, -2), [5, 3, 1]))
+        self.assertEqual(len(RangeIndex(5, 0)), 0)
+        self.assertRaises(ValueError, RangeIndex, 0, 5, 0)
+        self.assertEqual(self.index.name, 'foo')
+        self.assert_(isinstance(com._default_index(3), RangeIndex))
+
+    def test_get_loc(self):
+        index = self.index
+        self.assertEqual(index.get_loc(11), 3)
+        self.assertRaises(KeyError, index.get_loc, 12)
+        self.assertRaises(KeyError, index.get_loc, 20)
+        self.assertRaises(KeyError, index.get_loc, -1)
+        self.assert_(17 in index)
+        self.assert_(18 not in index)
+        self.assertEqual(RangeIndex(5, 0, -2).get_loc(1), 2)
+
+        # no hash table
+        index.get_indexer([5, 6])
+        self.assert_(index._engine.mapping is None)
+
+    def test_get_indexer(self):
+        result = self.index.get_indexer(Int64Index([20, 17, 3, 2, -1]))
+        self.assert_(np.array_equal(result, [-1, 5, -1, 0, -1]))
+
+        result = self.index.get_indexer(Int64Index([5, 8]), method='pad')
+        self.assert_(np.array_equal(result, [1, 2]))
+
+    def test_slice(self):
+        result = self.index[1:5]
+        self.assert_(isinstance(result, RangeIndex))
+        self.assertEqual(result._range, (5, 17, 3))
+        self.assert_(np.array_equal(result, [5, 8, 11, 14]))
+        self.assertEqual(result.name, 'foo')
+
+        result = self.index[::-2]
+        self.assert_(np.array_equal(result, np.arange(2, 20, 3)[::-2]))
+        self.assertEqual(result.get_loc(11), 1)
+
+        # fancy indexing gives a plain Int64Index
+        result = self.index[[0, 2]]
+        self.assert_(type(result) is Int64Index)
+
+    def test_equals(self):
+        self.assert_(self.index.equals(RangeIndex(2, 18, 3)))
+        self.assert_(not self.index.equals(RangeIndex(2, 17, 3)))
+        self.assert_(self.index.equals(Int64Index(np.arange(2, 20, 3))))
+        self.assert_(RangeIndex(3, 4, 5).equals(RangeIndex(3, 4)))
+
+    def test_setops(self):
+        left = RangeIndex(0, 10)
+        right = RangeIndex(5, 15)
+
+        result = left.union(right)
+        self.assert_(isinstance(result, RangeIndex))
+        self.assertEqual(result._range, (0, 15, 1))
+
+        result = left.intersection(right)
+        self.assert_(isinstance(result, RangeIndex))
+        self.assertEqual(result._range, (5, 10, 1))
+        self.assertEqual(len(left.intersection(RangeIndex(20, 30))), 0)
+
+        # gaps fall back to the generic path
+        result = left.union(RangeIndex(20, 22))
+        self.assert_(np.array_equal(result, range(10) + [20, 21]))
+
+    def test_join(self):
+        left = RangeIndex(0, 10)
+        right = RangeIndex(5, 15)
+        for how in ['left', 'right', 'inner', 'outer']:
+            result, lidx, ridx = left.join(right, how=how,
+                                           return_indexers=True)
+            expected, elidx, eridx = Int64Index(left).join(
+                Int64Index(right), how=how, return_indexers=True)
+            self.assert_(isinstance(result, RangeIndex))
+            self.assert_(np.array_equal(result, expected))
+            if lidx is not None or elidx is not None:
+                self.assert_(np.array_equal(lidx, elidx))
+            if ridx is not None or eridx is not None:
+                self.assert_(np.array_equal(ridx, eridx))
+
+    def test_pickle(self):
+        result = pickle.loads(pickle.dumps(self.index))
+        self.assert_(isinstance(result, RangeIndex))
+        self.assertEqual(result._range, self.index._range)
+        self.assertEqual(result.name, 'foo')
+
+
 class TestMultiIndex(unittest.TestCase):
 
     def setUp(self):
@@ -1183,6 +1510,54 @@ class TestMultiIndex(unittest.TestCase):
         # self.assertRaises(Exception, idx1.get_indexer,
         #                   list(list(zip(*idx2._tuple_index))[0]))
 
+    def test_get_indexer_packed(self):
+        # labels absent from a level, NA labels
+        index = MultiIndex(levels=[['a', 'b', 'c'], [1, 2]],
+                           labels=[[0, 0, 1, 2, -1], [0, 1, 1, -1, 0]])
+        target = MultiIndex(levels=[['b', 'c', 'z'], [2, 3]],
+                            labels=[[0, 2, 1, -1, 0], [0, 0, -1, 1, 1]])
+        # NA labels match each other
+        result = index.get_indexer(target)
+        assert_almost_equal(result, [2, -1, 3, -1, -1])
+
+        self.assertEqual(index.get_loc(('b', 2)), 2)
+        self.assertRaises(KeyError, index.get_loc, ('z', 2))
+        self.assertRaises(KeyError, index.get_loc, ('a', 3))
+
+    def test_get_indexer_packed_overflow(self):
+        # the product of the level sizes does not fit in int64
+        np.random.seed(1234)
+        levels = [np.arange(100000)] * 5
+        labels = [np.random.randint(0, 100000, 1000) for _ in range(5)]
+        index = MultiIndex(levels=levels, labels=labels)
+        self.assert_(any(x is not None for x in index._engine.uniques))
+
+        target = index[::-3]
+        target = MultiIndex.from_tuples(list(target) + [(1, 2, 3, 4, 5)])
+        result = index.get_indexer(target)
+        expected = index._tuple_index.get_indexer(target._tuple_index)
+        assert_almost_equal(result, expected)
+
+        self.assertEqual(index.get_loc(index[5]), 5)
+        self.assertRaises(KeyError, index.get_loc, (1, 2, 3, 4, 5))
+
+    def test_join_packed(self):
+        left = MultiIndex.from_tuples([(0, 'a'), (0, 'c'), (1, 'b'),
+                                       (2, 'a')])
+        right = MultiIndex.from_tuples([(0, 'c'), (1, 'a'), (2, 'a'),
+                                        (3, 'd')])
+        for how in ['left', 'right', 'inner', 'outer']:
+            result, lidx, ridx = left.join(right, how=how,
+                                           return_indexers=True)
+            expected, elidx, eridx = left._tuple_index.join(
+                right._tuple_index, how=how, return_indexers=True)
+            self.assert_(isinstance(result, MultiIndex))
+            self.assertEqual(list(result), list(expected))
+            if lidx is not None or elidx is not None:
+                assert_almost_equal(lidx, elidx)
+            if ridx is not None or eridx is not None:
+                assert_almost_equal(ridx, eridx)
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
@@ -1339,6 +1714,71 @@ class TestMultiIndex(unittest.TestCase):
         # raise Exception called with non-MultiIndex
         self.assertRaises(Exception, first.diff, first._tuple_index)
 
+    def test_setops_packed(self):
+        left = MultiIndex.from_tuples([(1, 'a'), (0, 'c'), (2, 'b'),
+                                       (1, 'a'), (0, 'a')])
+        right = MultiIndex.from_tuples([(3, 'a'), (0, 'c'), (2, 'd'),
+                                        (0, 'a')])
+        lset, rset = set(left.values), set(right.values)
+
+        result = left.union(right)
+        self.assertEqual(list(result), sorted(lset | rset))
+
+        result = left.intersection(right)
+        self.assertEqual(list(result), sorted(lset & rset))
+        # unused level values are dropped
+        self.assertEqual(list(result.levels[0]), [0])
+        self.assertEqual(list(result.levels[1]), ['a', 'c'])
+
+        result = left.diff(right)
+        self.assertEqual(list(result), sorted(lset - rset))
+
+        # many large levels
+        np.random.seed(1234)
+        levels = [np.arange(100000)] * 5
+        labels = [np.random.randint(0, 100000, 100) for _ in range(5)]
+        big = MultiIndex(levels=levels, labels=labels)
+        result = big[:60].union(big[40:])
+        self.assertEqual(list(result), sorted(set(big.values)))
+        result = big[:60].intersection(big[40:])
+        self.assertEqual(list(result), sorted(set(big[40:60].values)))
+
+    def test_unsorted_levels_label_based(self):
+        # levels not in sorted order, so that the label codes do not sort
+        # like the tuples
+        index = MultiIndex(levels=[['b', 'c', 'a'], [2, 0, 1]],
+                           labels=[[2, 2, 0, 0, 1, 1], [1, 0, 1, 2, 2, 0]])
+        tuples = index.values
+        self.assert_(index.is_monotonic)
+        self.assert_(not index[::-1].is_monotonic)
+        self.assert_(np.array_equal(index[::-1].argsort(),
+                                    tuples[::-1].argsort()))
+
+        result = index[:3].append(index[2:])
+        self.assertEqual(list(result), list(tuples[:3]) + list(tuples[2:]))
+        result = index[:2].append([index[4:], index[1:2]])
+        self.assertEqual(list(result), list(tuples[:2]) + list(tuples[4:]) +
+                         list(tuples[1:2]))
+
+        target = MultiIndex.from_tuples([('a', 0), ('a', 5), ('b', 1),
+                                         ('d', 0), ('0', 0)])
+        subset = index[::2]
+        for method in ['pad', 'backfill']:
+            result = subset.get_indexer(target, method=method)
+            expected = subset.get_indexer(target._tuple_index, method=method)
+            self.assert_(np.array_equal(result, expected))
+
+    def test_values_not_cached(self):
+        self.assert_(self.index.values is not self.index.values)
+        self.assertEqual(list(self.index.values), list(self.index))
+
+        index = self.index
+        index._iter_chunksize = 4
+        try:
+            self.assertEqual(list(index), list(index.values))
+        finally:
+            del index._iter_chunksize
+
     def test_from_tuples(self):
         self.assertRaises(Exception, MultiIndex.from_tuples, [])
 
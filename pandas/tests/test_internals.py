@@ -73,12 +73,17 @@ class TestBlock(unittest.TestCase):
             pickled = pickle.dumps(blk)
             unpickled = pickle.loads(pickled)
             assert_block_equal(blk, unpickled)
+            self.assert_(np.array_equal(blk.isnull(), unpickled.isnull()))
 
         _check(self.fblock)
         _check(self.cblock)
         _check(self.oblock)
         _check(self.bool_block)
 
+        indexer = np.array([0, -1, 2], dtype=np.int64)
+        _check(self.int_block.reindex_axis(indexer, indexer == -1, True,
+                                           axis=1, mask_na=True))
+
     def test_ref_locs(self):
         assert_almost_equal(self.fblock.ref_locs, [0, 2, 4])
 
@@ -136,6 +141,57 @@ class TestBlock(unittest.TestCase):
     def test_reindex_cast(self):
         pass
 
+    def test_reindex_axis_mask_na(self):
+        indexer = np.array([0, -1, 2, -1], dtype=np.int64)
+        mask = indexer == -1
+
+        result = self.int_block.reindex_axis(indexer, mask, True, axis=1,
+                                             mask_na=True)
+        self.assert_(isinstance(result, IntBlock))
+        self.assert_(result.is_masked)
+        self.assert_(np.array_equal(result.isnull()[0], mask))
+        self.assert_(np.array_equal(result.values[0, [0, 2]],
+                                    self.int_block.values[0, [0, 2]]))
+
+        result = self.bool_block.reindex_axis(indexer, mask, True, axis=1,
+                                              mask_na=True)
+        self.assert_(isinstance(result, BoolBlock))
+        self.assert_(np.array_equal(result.isnull()[0], mask))
+
+        # upcast by default
+        result = self.int_block.reindex_axis(indexer, mask, True, axis=1)
+        self.assert_(isinstance(result, FloatBlock))
+        self.assert_(not result.is_masked)
+
+    def test_masked_propagation(self):
+        indexer = np.array([0, -1, 2, -1], dtype=np.int64)
+        blk = self.int_block.reindex_axis(indexer, indexer == -1, True,
+                                          axis=1, mask_na=True)
+
+        taken = blk.take(np.array([1, 2]), axis=1)
+        self.assert_(np.array_equal(taken.isnull()[0], [True, False]))
+
+        copied = blk.copy()
+        self.assert_(np.array_equal(copied.isnull(), blk.isnull()))
+
+        # reindexing a masked block again keeps the existing mask
+        again = blk.reindex_axis(np.array([1, 0], dtype=np.int64),
+                                 np.array([False, False]), False, axis=1)
+        self.assert_(np.array_equal(again.isnull()[0], [True, False]))
+
+        values = blk.get('g')
+        self.assert_(values.dtype == np.float64)
+        self.assert_(np.isnan(values[[1, 3]]).all())
+
+        unmasked = blk.unmask()
+        self.assert_(isinstance(unmasked, FloatBlock))
+        assert_almost_equal(unmasked.values[0], values)
+
+        filled = blk.fillna(0)
+        self.assert_(isinstance(filled, IntBlock))
+        self.assert_(not filled.is_masked)
+        self.assert_((filled.values[0, [1, 3]] == 0).all())
+
     def test_insert(self):
         pass
 
@@ -281,6 +337,33 @@ class TestBlockManager(unittest.TestCase):
                 exp = self.mgr.get(item)[i]
                 assert_almost_equal(res, exp)
 
+    def test_iget_scalar(self):
+        for i, item in enumerate(self.mgr.items):
+            for j in range(len(self.mgr.axes[1])):
+                res = self.mgr.iget_scalar(i, j)
+                exp = self.mgr.get(item)[j]
+                assert_almost_equal(res, exp)
+
+        # placement is rebuilt after items are added or removed
+        mgr = self.mgr.copy()
+        mgr.set('baz', np.arange(N, dtype=np.int64))
+        self.assertEqual(mgr.iget_scalar(len(mgr.items) - 1, 1), 1)
+        mgr.delete('a')
+        self.assertEqual(mgr.iget_scalar(len(mgr.items) - 1, 2), 2)
+
+    def test_set_scalar(self):
+        mgr = self.mgr.copy()
+        mgr.set_scalar(('a', 1), 5.)
+        self.assertEqual(mgr.get_scalar(('a', 1)), 5.)
+        self.assertEqual(mgr.get('a')[1], 5.)
+
+        indexer = np.array([0, -1, 2], dtype=np.int64)
+        masked = mgr.reindex_indexer(Index([0, 1, 2]), indexer, axis=1,
+                                     mask_na=True)
+        self.assert_(np.isnan(masked.get_scalar(('g', 1))))
+        masked.set_scalar(('g', 1), 7)
+        self.assertEqual(masked.get_scalar(('g', 1)), 7)
+
     def test_set(self):
         pass
 
@@ -2145,6 +2145,25 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
         d = self.ts.index[0] - datetools.bday
         self.assert_(np.isnan(self.ts.asof(d)))
 
+    def test_asof_tolerance(self):
+        rng = date_range('1/1/2000', periods=5, freq='min')
+        ts = Series(np.arange(5.), index=rng)
+        ts[2] = np.nan
+        dates = [datetime(2000, 1, 1, 0, 0, 20), datetime(2000, 1, 1, 0, 2),
+                 datetime(2000, 1, 1, 0, 10)]
+
+        result = ts.asof(dates, tolerance='30s')
+        expected = Series([0., nan, nan], index=dates)
+        assert_series_equal(result, expected)
+
+        # the last good value is a minute before
+        result = ts.asof(dates, tolerance=timedelta(minutes=1))
+        expected = Series([0., 1., nan], index=dates)
+        assert_series_equal(result, expected)
+
+        self.assert_(np.isnan(ts.asof(dates[1], tolerance='30s')))
+        self.assertEqual(ts.asof(dates[1], tolerance='1min'), 1.)
+
     def test_asof_more(self):
         from pandas import date_range
         s = Series([nan, nan, 1, 2, nan, nan, 3, 4, 5],
@@ -2410,6 +2429,22 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
     def test_reindex_backfill(self):
         pass
 
+    def test_reindex_nearest(self):
+        s = Series(np.arange(10.), index=np.arange(0, 20, 2))
+        target = [-3, 1, 3, 17, 25]
+
+        result = s.reindex(target, method='nearest')
+        expected = Series([0., 1., 2., 9., 9.], index=target)
+        assert_series_equal(result, expected)
+
+        result = s.reindex(target, method='nearest', tolerance=1)
+        expected = Series([nan, 1., 2., 9., nan], index=target)
+        assert_series_equal(result, expected)
+
+        result = s.reindex(target, method='pad', tolerance=1)
+        expected = Series([nan, 0., 1., 8., nan], index=target)
+        assert_series_equal(result, expected)
+
     def test_reindex_int(self):
         ts = self.ts[::2]
         int_ts = Series(np.zeros(len(ts), dtype=int), index=ts.index)
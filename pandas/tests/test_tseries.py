@@ -199,6 +199,27 @@ def test_inner_join_indexer2():
     assert_almost_equal(ridx, exp_ridx)
 
 
+def test_sorted_setops():
+    left = np.array(['a', 'b', 'b', 'd', 'f'], dtype=object)
+    right = np.array(['b', 'c', 'd', 'd', 'g'], dtype=object)
+
+    result = algos.union_sorted_object(left, right)
+    assert_almost_equal(result, ['a', 'b', 'c', 'd', 'f', 'g'])
+
+    result = algos.intersection_sorted_object(left, right)
+    assert_almost_equal(result, ['b', 'd'])
+
+    result = algos.diff_sorted_object(left, right)
+    assert_almost_equal(result, ['a', 'f'])
+
+    empty = np.array([], dtype=np.int64)
+    values = np.array([1, 3, 3, 7], dtype=np.int64)
+    assert_almost_equal(algos.union_sorted_int64(empty, values), [1, 3, 7])
+    assert_almost_equal(algos.intersection_sorted_int64(values, empty), [])
+    assert_almost_equal(algos.diff_sorted_int64(values, empty), [1, 3, 7])
+    assert_almost_equal(algos.diff_sorted_int64(values, values), [])
+
+
 def test_is_lexsorted():
     failure = [
         np.array([3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
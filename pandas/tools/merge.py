@@ -260,7 +260,7 @@ class _MergeOperation(object):
             elif self.left_index:
                 join_index = self.right.index.take(right_indexer)
             else:
-                join_index = Index(np.arange(len(left_indexer)))
+                join_index = com._default_index(len(left_indexer))
 
         return join_index, left_indexer, right_indexer
 
@@ -760,6 +760,7 @@ def _upcast_blocks(blocks):
     """
     new_blocks = []
     for block in blocks:
+        block = block.unmask()
         if isinstance(block, IntBlock):
             newb = make_block(block.values.astype(float), block.items,
                               block.ref_items)
@@ -907,7 +908,7 @@ class _Concatenator(object):
             return self.objs[0]._from_axes(new_data, self.new_axes)
 
     def _get_fresh_axis(self):
-        return Index(np.arange(len(self._get_concat_axis())))
+        return com._default_index(len(self._get_concat_axis()))
 
     def _get_concatenated_data(self):
         try:
@@ -965,6 +966,8 @@ class _Concatenator(object):
         return reindexed_data
 
     def _concat_blocks(self, blocks):
+        # materialize missing values, concatenation upcasts as needed
+        blocks = [b if b is None else b.unmask() for b in blocks]
         values_list = [b.values for b in blocks if b is not None]
         if isinstance(blocks[0], DatetimeBlock):
             # hack around NumPy 1.6 bug
@@ -1080,7 +1083,7 @@ class _Concatenator(object):
             if self.axis == 0:
                 indexes = [x.index for x in self.objs]
             elif self.keys is None:
-                return Index(np.arange(len(self.objs)))
+                return com._default_index(len(self.objs))
             else:
                 return _ensure_index(self.keys)
         else:
@@ -54,6 +54,15 @@ def _join_i8_wrapper(joinf, with_indexers=True):
     return wrapper
 
 
+def _setop_i8_wrapper(setopf):
+    @staticmethod
+    def wrapper(left, right):
+        left = left.view('i8', type=np.ndarray)
+        right = right.view('i8', type=np.ndarray)
+        return setopf(left, right).view('M8[ns]')
+    return wrapper
+
+
 def _dt_index_cmp(opname):
     """
     Wrap comparison operations to convert datetime-like to datetime64
@@ -118,6 +127,10 @@ class DatetimeIndex(Int64Index):
     _left_indexer  = _join_i8_wrapper(_algos.left_join_indexer_int64)
     _left_indexer_unique  = _join_i8_wrapper(
         _algos.left_join_indexer_unique_int64, with_indexers=False)
+    _union_sorted = _setop_i8_wrapper(_algos.union_sorted_int64)
+    _intersection_sorted = _setop_i8_wrapper(_algos.intersection_sorted_int64)
+    # diff boxes its result through Index(); keep the generic path
+    _diff_sorted = None
     _arrmap = None
 
     __eq__ = _dt_index_cmp('__eq__')
@@ -570,18 +583,20 @@ class DatetimeIndex(Int64Index):
         """
         Return sorted copy of Index
         """
+        flags = self._sorted_flags(ascending)
         if return_indexer:
             _as = self.argsort()
             if not ascending:
                 _as = _as[::-1]
-            sorted_index = self.take(_as)
+            sorted_index = self.take(_as)._set_flag_hints(*flags)
             return sorted_index, _as
         else:
             sorted_values = np.sort(self.values)
             if not ascending:
                 sorted_values = sorted_values[::-1]
-            return self._simple_new(sorted_values, self.name, None,
-                                    self.tz)
+            sorted_index = self._simple_new(sorted_values, self.name, None,
+                                            self.tz)
+            return sorted_index._set_flag_hints(*flags)
 
     def snap(self, freq='S'):
         """
@@ -654,7 +669,8 @@ class DatetimeIndex(Int64Index):
             return self[maybe_slice]
         indices = com._ensure_platform_int(indices)
         taken = self.values.take(indices, axis=axis)
-        return self._simple_new(taken, self.name, None, self.tz)
+        result = self._simple_new(taken, self.name, None, self.tz)
+        return result._set_flag_hints(*self._selection_flags(indices))
 
     def union(self, other):
         """
@@ -784,6 +800,27 @@ class DatetimeIndex(Int64Index):
                               end=max(left_end, right_end),
                               freq=left.offset)
 
+    def _convert_tolerance(self, tolerance):
+        # nanoseconds, to compare with differences of the i8 values
+        if isinstance(tolerance, basestring):
+            tolerance = to_offset(tolerance)
+        if isinstance(tolerance, Tick):
+            return tolerance.nanos
+        if isinstance(tolerance, timedelta):
+            return offsets._delta_to_nanoseconds(tolerance)
+        if isinstance(tolerance, np.timedelta64):
+            return tolerance.astype('m8[ns]').astype(np.int64)
+        if isinstance(tolerance, DateOffset):
+            raise ValueError('tolerance must be a fixed frequency, got %s'
+                             % tolerance)
+        return tolerance
+
+    def _flag_hints(self):
+        # generated with a regular frequency, hence sorted and unique
+        if self.offset is not None and self.offset.n > 0:
+            return True, True
+        return Index._flag_hints(self)
+
     def __array_finalize__(self, obj):
         if self.ndim == 0: # pragma: no cover
             return self.item()
@@ -970,7 +1007,8 @@ class DatetimeIndex(Int64Index):
             if result.ndim > 1:
                 return result
 
-            return self._simple_new(result, self.name, new_offset, self.tz)
+            result = self._simple_new(result, self.name, new_offset, self.tz)
+            return result._set_flag_hints(*self._selection_flags(key))
 
     # Try to run function on index first, and then on elements of index
     # Especially important for group-by functionality
@@ -1068,7 +1106,7 @@ class DatetimeIndex(Int64Index):
         """
         Determines if two Index objects contain the same elements.
         """
-        if self is other:
+        if self.is_(other):
             return True
 
         if (not hasattr(other, 'inferred_type') or
@@ -1089,7 +1127,11 @@ class DatetimeIndex(Int64Index):
                 return False
             same_zone = True
 
-        return same_zone and np.array_equal(self.asi8, other.asi8)
+        if same_zone and np.array_equal(self.asi8, other.asi8):
+            if isinstance(other, DatetimeIndex):
+                self._note_equal(other)
+            return True
+        return False
 
     def insert(self, loc, item):
         """
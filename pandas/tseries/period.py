@@ -504,6 +504,9 @@ class PeriodIndex(Int64Index):
     """
     _box_scalars = True
 
+    # diff boxes its result through Index(); keep the generic path
+    _diff_sorted = None
+
     __eq__ = _period_index_cmp('__eq__')
     __ne__ = _period_index_cmp('__ne__')
     __lt__ = _period_index_cmp('__lt__')
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import pickle
 import unittest
 
@@ -95,6 +95,38 @@ class TestDateRange(unittest.TestCase):
         # only really care that it works
         repr(self.rng)
 
+    def test_known_flags(self):
+        # regular ranges are sorted and unique without a check
+        self.assert_(self.rng._engine.known_flags() == (True, True))
+
+        subset = self.rng[[1, 5, 7]]
+        self.assert_(subset.offset is None)
+        self.assert_(subset._engine.known_flags() == (True, True))
+
+        shuffled = self.rng[[5, 1, 7]]
+        self.assert_(shuffled._get_known_flags() == (None, None))
+        ordered = shuffled.order()
+        self.assert_(ordered._get_known_flags()[0])
+
+    def test_get_indexer_nearest(self):
+        rng = date_range('1/1/2000', periods=5, freq='min')
+        target = DatetimeIndex([datetime(2000, 1, 1, 0, 0, 20),
+                                datetime(2000, 1, 1, 0, 1, 40),
+                                datetime(2000, 1, 1, 0, 10)])
+
+        indexer = rng.get_indexer(target, method='nearest')
+        self.assert_(np.array_equal(indexer, [0, 2, 4]))
+
+        indexer = rng.get_indexer(target, method='nearest', tolerance='30s')
+        self.assert_(np.array_equal(indexer, [0, 2, -1]))
+
+        indexer = rng.get_indexer(target, method='pad',
+                                  tolerance=timedelta(seconds=30))
+        self.assert_(np.array_equal(indexer, [0, -1, -1]))
+
+        self.assertRaises(ValueError, rng.get_indexer, target,
+                          method='nearest', tolerance=datetools.bday)
+
     def test_getitem(self):
         smaller = self.rng[:5]
         self.assert_(np.array_equal(smaller, self.rng.view(np.ndarray)[:5]))
@@ -79,6 +79,26 @@ class TestResample(unittest.TestCase):
         self.assertEquals(len(r.columns), 10)
         self.assertEquals(len(r.index), 2593)
 
+    def test_bin_stat_kernels(self):
+        rng = date_range('1/1/2000 00:00:00', '1/1/2000 00:13:00', freq='min')
+        s = Series(np.random.randn(14), index=rng)
+        s[[2, 7]] = np.nan
+        s[4] = s[3]
+        g = s.groupby(TimeGrouper(Minute(5), closed='left', label='left'))
+
+        chunks = [s[:5], s[5:10], s[10:]]
+        assert_almost_equal(g.median(), [x.median() for x in chunks])
+        assert_almost_equal(g.count(), [4, 4, 4])
+        assert_almost_equal(g.nunique(), [3, 4, 4])
+        assert_almost_equal(g.sem(),
+                            [x.std() / np.sqrt(x.count()) for x in chunks])
+
+        expected = [np.percentile(x.dropna().values, 30) for x in chunks]
+        assert_almost_equal(g.quantile(0.3), expected)
+
+        result = s.resample('5min', how='median', closed='left', label='left')
+        assert_almost_equal(result, g.median())
+
     def test_resample_basic(self):
         rng = date_range('1/1/2000 00:00:00', '1/1/2000 00:13:00', freq='min')
         s = Series(np.random.randn(14), index=rng)